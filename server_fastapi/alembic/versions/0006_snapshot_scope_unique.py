@@ -0,0 +1,47 @@
+"""named unique constraint on regional snapshot scope keys
+
+Revision ID: 0006_snapshot_scope_unique
+Revises: 0005_regional_snapshots
+Create Date: 2026-02-20
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+
+revision: str = '0006_snapshot_scope_unique'
+down_revision: str | None = '0005_regional_snapshots'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _exec(sql: str) -> None:
+    op.get_bind().exec_driver_sql(sql)
+
+
+def upgrade() -> None:
+    # Bulk upserts target ON CONFLICT (scope_key); give the constraint a stable name.
+    _exec(
+        """
+        DO $$
+        BEGIN
+          IF NOT EXISTS (
+            SELECT 1 FROM pg_constraint WHERE conname = 'uq_local_regional_snapshots_scope'
+          ) THEN
+            ALTER TABLE local_center.regional_snapshots DROP CONSTRAINT IF EXISTS regional_snapshots_scope_key_key;
+            ALTER TABLE local_center.regional_snapshots
+              ADD CONSTRAINT uq_local_regional_snapshots_scope UNIQUE (scope_key);
+          END IF;
+        END $$;
+        """
+    )
+    _exec("DROP INDEX IF EXISTS local_center.ix_local_regional_snapshots_scope")
+
+
+def downgrade() -> None:
+    _exec(
+        "CREATE INDEX IF NOT EXISTS ix_local_regional_snapshots_scope ON local_center.regional_snapshots (scope_key)"
+    )
+    _exec("ALTER TABLE local_center.regional_snapshots DROP CONSTRAINT IF EXISTS uq_local_regional_snapshots_scope")
+    _exec("ALTER TABLE local_center.regional_snapshots ADD CONSTRAINT regional_snapshots_scope_key_key UNIQUE (scope_key)")
@@ -0,0 +1,39 @@
+"""jsonb payloads and item lookup index for regional snapshots
+
+Revision ID: 0007_snapshot_items_gin
+Revises: 0006_snapshot_scope_unique
+Create Date: 2026-02-20
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+
+revision: str = '0007_snapshot_items_gin'
+down_revision: str | None = '0006_snapshot_scope_unique'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _exec(sql: str) -> None:
+    op.get_bind().exec_driver_sql(sql)
+
+
+def upgrade() -> None:
+    _exec(
+        """
+        ALTER TABLE local_center.regional_snapshots
+          ALTER COLUMN payload_json TYPE jsonb USING payload_json::jsonb
+        """
+    )
+    _exec(
+        """
+        CREATE INDEX IF NOT EXISTS ix_local_regional_snapshots_items
+          ON local_center.regional_snapshots USING gin ((payload_json -> 'items') jsonb_path_ops)
+        """
+    )
+
+
+def downgrade() -> None:
+    _exec("DROP INDEX IF EXISTS local_center.ix_local_regional_snapshots_items")
@@ -0,0 +1,28 @@
+"""keyset pagination index for local case lists
+
+Revision ID: 0008_local_cases_keyset
+Revises: 0007_snapshot_items_gin
+Create Date: 2026-02-20
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+
+revision: str = '0008_local_cases_keyset'
+down_revision: str | None = '0007_snapshot_items_gin'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _exec(sql: str) -> None:
+    op.get_bind().exec_driver_sql(sql)
+
+
+def upgrade() -> None:
+    _exec("CREATE INDEX IF NOT EXISTS ix_local_cases_updated_case ON local_center.cases (updated_at, case_id)")
+
+
+def downgrade() -> None:
+    _exec("DROP INDEX IF EXISTS local_center.ix_local_cases_updated_case")
@@ -0,0 +1,43 @@
+"""trigram search column and indexes for local cases
+
+Revision ID: 0009_case_search_trgm
+Revises: 0008_local_cases_keyset
+Create Date: 2026-02-20
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+
+revision: str = '0009_case_search_trgm'
+down_revision: str | None = '0008_local_cases_keyset'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _exec(sql: str) -> None:
+    op.get_bind().exec_driver_sql(sql)
+
+
+def upgrade() -> None:
+    _exec("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    _exec(
+        """
+        ALTER TABLE local_center.cases
+          ADD COLUMN IF NOT EXISTS search_text text
+          GENERATED ALWAYS AS (lower(case_id || ' ' || coalesce(subject_json ->> 'maskedName', ''))) STORED
+        """
+    )
+    _exec(
+        "CREATE INDEX IF NOT EXISTS ix_local_cases_search_trgm ON local_center.cases USING gin (search_text gin_trgm_ops)"
+    )
+    _exec(
+        "CREATE INDEX IF NOT EXISTS ix_local_users_name_trgm ON local_center.users USING gin (lower(name) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    _exec("DROP INDEX IF EXISTS local_center.ix_local_users_name_trgm")
+    _exec("DROP INDEX IF EXISTS local_center.ix_local_cases_search_trgm")
+    _exec("ALTER TABLE local_center.cases DROP COLUMN IF EXISTS search_text")
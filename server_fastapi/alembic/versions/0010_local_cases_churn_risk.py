@@ -0,0 +1,37 @@
+"""promote churn risk to an indexed case column
+
+Revision ID: 0010_local_cases_churn_risk
+Revises: 0009_case_search_trgm
+Create Date: 2026-02-20
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+
+revision: str = '0010_local_cases_churn_risk'
+down_revision: str | None = '0009_case_search_trgm'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _exec(sql: str) -> None:
+    op.get_bind().exec_driver_sql(sql)
+
+
+def upgrade() -> None:
+    _exec("ALTER TABLE local_center.cases ADD COLUMN IF NOT EXISTS churn_risk varchar(16)")
+    _exec(
+        """
+        UPDATE local_center.cases
+        SET churn_risk = upper(raw_json #>> '{headerMeta,churn_risk}')
+        WHERE raw_json #>> '{headerMeta,churn_risk}' IS NOT NULL
+        """
+    )
+    _exec("CREATE INDEX IF NOT EXISTS ix_local_cases_center_churn ON local_center.cases (center_id, churn_risk)")
+
+
+def downgrade() -> None:
+    _exec("DROP INDEX IF EXISTS local_center.ix_local_cases_center_churn")
+    _exec("ALTER TABLE local_center.cases DROP COLUMN IF EXISTS churn_risk")
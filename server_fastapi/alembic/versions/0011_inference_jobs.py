@@ -0,0 +1,85 @@
+"""inference job table backfilled from case raw_json
+
+Revision ID: 0011_inference_jobs
+Revises: 0010_local_cases_churn_risk
+Create Date: 2026-02-20
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+
+revision: str = '0011_inference_jobs'
+down_revision: str | None = '0010_local_cases_churn_risk'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _exec(sql: str) -> None:
+    op.get_bind().exec_driver_sql(sql)
+
+
+def upgrade() -> None:
+    _exec(
+        """
+        CREATE TABLE IF NOT EXISTS local_center.inference_jobs (
+          job_id varchar(64) PRIMARY KEY,
+          case_id varchar(64) NOT NULL REFERENCES local_center.cases(case_id),
+          stage integer NOT NULL,
+          status varchar(32) NOT NULL DEFAULT 'PENDING',
+          progress integer NOT NULL DEFAULT 0,
+          eta_seconds integer,
+          duration_sec integer,
+          model_version varchar(64),
+          requested_at timestamptz NOT NULL DEFAULT now(),
+          started_at timestamptz,
+          updated_at timestamptz NOT NULL DEFAULT now(),
+          completed_at timestamptz,
+          applied_at timestamptz
+        )
+        """
+    )
+    _exec(
+        "CREATE INDEX IF NOT EXISTS ix_local_inference_jobs_case_requested ON local_center.inference_jobs (case_id, requested_at)"
+    )
+    _exec("CREATE INDEX IF NOT EXISTS ix_local_inference_jobs_status ON local_center.inference_jobs (status, updated_at)")
+
+    _exec(
+        """
+        INSERT INTO local_center.inference_jobs (
+          job_id, case_id, stage, status, progress, eta_seconds, duration_sec, model_version,
+          requested_at, started_at, updated_at, completed_at, applied_at
+        )
+        SELECT
+          COALESCE(j.value ->> 'jobId', j.key),
+          c.case_id,
+          COALESCE((j.value ->> 'stage')::integer, c.stage),
+          COALESCE(j.value ->> 'status', 'PENDING'),
+          COALESCE((j.value ->> 'progress')::integer, 0),
+          (j.value ->> 'etaSeconds')::integer,
+          (j.value ->> 'durationSec')::integer,
+          j.value ->> 'modelVersion',
+          COALESCE((j.value ->> 'requestedAt')::timestamptz, c.updated_at),
+          (j.value ->> 'startedAt')::timestamptz,
+          COALESCE((j.value ->> 'updatedAt')::timestamptz, c.updated_at),
+          (j.value ->> 'completedAt')::timestamptz,
+          (j.value ->> 'appliedAt')::timestamptz
+        FROM local_center.cases AS c
+        CROSS JOIN LATERAL jsonb_each(c.raw_json -> 'inferenceJobs') AS j(key, value)
+        WHERE jsonb_typeof(c.raw_json -> 'inferenceJobs') = 'object'
+          AND jsonb_typeof(j.value) = 'object'
+        ON CONFLICT (job_id) DO NOTHING
+        """
+    )
+    _exec(
+        """
+        UPDATE local_center.cases
+        SET raw_json = raw_json - 'inferenceJobs'
+        WHERE raw_json -> 'inferenceJobs' IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    _exec("DROP TABLE IF EXISTS local_center.inference_jobs")
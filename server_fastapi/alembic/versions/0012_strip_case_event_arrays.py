@@ -0,0 +1,36 @@
+"""strip embedded timeline and audit arrays from case raw_json
+
+Revision ID: 0012_strip_case_event_arrays
+Revises: 0011_inference_jobs
+Create Date: 2026-02-20
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+
+revision: str = '0012_strip_case_event_arrays'
+down_revision: str | None = '0011_inference_jobs'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _exec(sql: str) -> None:
+    op.get_bind().exec_driver_sql(sql)
+
+
+def upgrade() -> None:
+    _exec(
+        """
+        UPDATE local_center.cases
+        SET raw_json = raw_json - 'timeline' - 'audit'
+        WHERE raw_json -> 'timeline' IS NOT NULL
+           OR raw_json -> 'audit' IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    # The arrays were a render cache of timeline_events/audit_events and are rebuilt on read.
+    pass
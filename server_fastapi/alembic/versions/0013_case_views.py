@@ -0,0 +1,40 @@
+"""case view projection table
+
+Revision ID: 0013_case_views
+Revises: 0012_strip_case_event_arrays
+Create Date: 2026-02-20
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+
+revision: str = '0013_case_views'
+down_revision: str | None = '0012_strip_case_event_arrays'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _exec(sql: str) -> None:
+    op.get_bind().exec_driver_sql(sql)
+
+
+def upgrade() -> None:
+    # Rows are projected by the application (startup backfill or the rebuild_case_views task).
+    _exec(
+        """
+        CREATE TABLE IF NOT EXISTS local_center.case_views (
+          case_id varchar(64) PRIMARY KEY REFERENCES local_center.cases(case_id) ON DELETE CASCADE,
+          display_status varchar(16) NOT NULL,
+          entity_json jsonb NOT NULL,
+          record_json jsonb NOT NULL,
+          refreshed_at timestamptz NOT NULL DEFAULT now()
+        )
+        """
+    )
+    _exec("CREATE INDEX IF NOT EXISTS ix_local_case_views_display_status ON local_center.case_views (display_status)")
+
+
+def downgrade() -> None:
+    _exec("DROP TABLE IF EXISTS local_center.case_views")
@@ -0,0 +1,39 @@
+"""keyset indexes for timeline and audit event paging
+
+Revision ID: 0014_event_keyset_indexes
+Revises: 0013_case_views
+Create Date: 2026-02-20
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+
+revision: str = '0014_event_keyset_indexes'
+down_revision: str | None = '0013_case_views'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _exec(sql: str) -> None:
+    op.get_bind().exec_driver_sql(sql)
+
+
+def upgrade() -> None:
+    # Ascending, as the models declare; the newest-first pages scan these btrees backward.
+    _exec("CREATE INDEX IF NOT EXISTS ix_local_timeline_case_at_id ON local_center.timeline_events (case_id, at, id)")
+    _exec("DROP INDEX IF EXISTS local_center.ix_local_timeline_case_at")
+    _exec("CREATE INDEX IF NOT EXISTS ix_local_audit_case_at_id ON local_center.audit_events (case_id, at, id)")
+    _exec("DROP INDEX IF EXISTS local_center.ix_local_audit_case_at")
+    _exec("CREATE INDEX IF NOT EXISTS ix_local_audit_at_id ON local_center.audit_events (at, id)")
+    _exec("CREATE INDEX IF NOT EXISTS ix_control_audit_events_ts_id ON control.audit_events (ts, id)")
+
+
+def downgrade() -> None:
+    _exec("DROP INDEX IF EXISTS control.ix_control_audit_events_ts_id")
+    _exec("DROP INDEX IF EXISTS local_center.ix_local_audit_at_id")
+    _exec("CREATE INDEX IF NOT EXISTS ix_local_audit_case_at ON local_center.audit_events (case_id, at)")
+    _exec("DROP INDEX IF EXISTS local_center.ix_local_audit_case_at_id")
+    _exec("CREATE INDEX IF NOT EXISTS ix_local_timeline_case_at ON local_center.timeline_events (case_id, at)")
+    _exec("DROP INDEX IF EXISTS local_center.ix_local_timeline_case_at_id")
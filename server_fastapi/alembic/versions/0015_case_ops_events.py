@@ -0,0 +1,60 @@
+"""per-case ops-loop milestones recorded at timeline write time
+
+Revision ID: 0015_case_ops_events
+Revises: 0014_event_keyset_indexes
+Create Date: 2026-02-20
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+
+revision: str = '0015_case_ops_events'
+down_revision: str | None = '0014_event_keyset_indexes'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _exec(sql: str) -> None:
+    op.get_bind().exec_driver_sql(sql)
+
+
+def upgrade() -> None:
+    _exec(
+        """
+        CREATE TABLE IF NOT EXISTS local_center.case_ops_events (
+          case_id varchar(64) NOT NULL REFERENCES local_center.cases(case_id) ON DELETE CASCADE,
+          ops_event varchar(32) NOT NULL,
+          first_at timestamptz NOT NULL DEFAULT now(),
+          PRIMARY KEY (case_id, ops_event)
+        )
+        """
+    )
+    # Same token table as case_event_recorder.OPS_EVENT_TOKENS.
+    _exec(
+        """
+        INSERT INTO local_center.case_ops_events (case_id, ops_event, first_at)
+        SELECT t.case_id, tokens.code, MIN(t.at)
+        FROM local_center.timeline_events t
+        JOIN (
+          VALUES
+            ('PLAN_CONFIRMED', 'PLAN'), ('PLAN_CONFIRMED', '계획'),
+            ('RESULT_RECEIVED', 'RESULT'), ('RESULT_RECEIVED', '결과'),
+            ('RESULT_VALIDATED', 'VALID'), ('RESULT_VALIDATED', '검증'), ('RESULT_VALIDATED', '확정'),
+            ('INFERENCE_REQUESTED', 'INFERENCE_REQUESTED'), ('INFERENCE_REQUESTED', '모델 실행 요청'),
+            ('INFERENCE_STARTED', 'INFERENCE_STARTED'), ('INFERENCE_STARTED', '모델 실행 시작'),
+            ('INFERENCE_COMPLETED', 'INFERENCE_COMPLETED'), ('INFERENCE_COMPLETED', '모델 실행 완료'),
+            ('CLASSIFICATION_CONFIRMED', 'CLASS'), ('CLASSIFICATION_CONFIRMED', '분류'),
+            ('NEXT_STEP_DECIDED', 'NEXT STEP'), ('NEXT_STEP_DECIDED', '다음 단계'),
+            ('REFERRAL_CONFIRMED', 'REFERRAL'), ('REFERRAL_CONFIRMED', '의뢰'), ('REFERRAL_CONFIRMED', '예약')
+        ) AS tokens(code, token)
+          ON strpos(upper(coalesce(t.event_type, '') || ' ' || coalesce(t.title, '') || ' ' || coalesce(t.detail, '')), tokens.token) > 0
+        GROUP BY t.case_id, tokens.code
+        ON CONFLICT (case_id, ops_event) DO NOTHING
+        """
+    )
+
+
+def downgrade() -> None:
+    _exec("DROP TABLE IF EXISTS local_center.case_ops_events")
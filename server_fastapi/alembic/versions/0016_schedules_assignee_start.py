@@ -0,0 +1,31 @@
+"""composite index for assignee calendar range reads
+
+Revision ID: 0016_schedules_assignee_start
+Revises: 0015_case_ops_events
+Create Date: 2026-02-20
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+
+revision: str = '0016_schedules_assignee_start'
+down_revision: str | None = '0015_case_ops_events'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _exec(sql: str) -> None:
+    op.get_bind().exec_driver_sql(sql)
+
+
+def upgrade() -> None:
+    _exec(
+        "CREATE INDEX IF NOT EXISTS ix_local_schedules_assignee_start "
+        "ON local_center.schedules (assignee_id, start_at)"
+    )
+
+
+def downgrade() -> None:
+    _exec("DROP INDEX IF EXISTS local_center.ix_local_schedules_assignee_start")
@@ -0,0 +1,41 @@
+"""per-case overdue schedule counter
+
+Revision ID: 0017_case_overdue_counts
+Revises: 0016_schedules_assignee_start
+Create Date: 2026-02-20
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+
+revision: str = '0017_case_overdue_counts'
+down_revision: str | None = '0016_schedules_assignee_start'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _exec(sql: str) -> None:
+    op.get_bind().exec_driver_sql(sql)
+
+
+def upgrade() -> None:
+    _exec("ALTER TABLE local_center.cases ADD COLUMN IF NOT EXISTS overdue_schedule_count integer NOT NULL DEFAULT 0")
+    _exec(
+        """
+        UPDATE local_center.cases c
+        SET overdue_schedule_count = s.overdue
+        FROM (
+          SELECT case_id, count(*) AS overdue
+          FROM local_center.schedules
+          WHERE status = 'QUEUED'
+          GROUP BY case_id
+        ) s
+        WHERE s.case_id = c.case_id
+        """
+    )
+
+
+def downgrade() -> None:
+    _exec("ALTER TABLE local_center.cases DROP COLUMN IF EXISTS overdue_schedule_count")
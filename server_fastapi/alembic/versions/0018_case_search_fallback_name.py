@@ -0,0 +1,41 @@
+"""index the fallback subject name in case search text
+
+Revision ID: 0018_case_search_fallback_name
+Revises: 0017_case_overdue_counts
+Create Date: 2026-02-20
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+from alembic import op
+
+revision: str = '0018_case_search_fallback_name'
+down_revision: str | None = '0017_case_overdue_counts'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _exec(sql: str) -> None:
+    op.get_bind().exec_driver_sql(sql)
+
+
+def _replace_search_text(expression: str) -> None:
+    # A generated column's expression cannot be altered in place; rebuild it and its trigram index.
+    _exec("DROP INDEX IF EXISTS local_center.ix_local_cases_search_trgm")
+    _exec("ALTER TABLE local_center.cases DROP COLUMN IF EXISTS search_text")
+    _exec(f"ALTER TABLE local_center.cases ADD COLUMN search_text text GENERATED ALWAYS AS ({expression}) STORED")
+    _exec(
+        "CREATE INDEX IF NOT EXISTS ix_local_cases_search_trgm ON local_center.cases USING gin (search_text gin_trgm_ops)"
+    )
+
+
+def upgrade() -> None:
+    _replace_search_text(
+        "lower(case_id || ' ' || coalesce(nullif(subject_json ->> 'maskedName', ''), "
+        "'대상자-' || substr(case_id, length(case_id) - 3)))"
+    )
+
+
+def downgrade() -> None:
+    _replace_search_text("lower(case_id || ' ' || coalesce(subject_json ->> 'maskedName', ''))")
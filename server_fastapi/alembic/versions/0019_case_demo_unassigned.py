@@ -0,0 +1,51 @@
+"""stored demo-unassigned flag for case search
+
+Revision ID: 0019_case_demo_unassigned
+Revises: 0018_case_search_fallback_name
+Create Date: 2026-02-20
+"""
+from __future__ import annotations
+
+from typing import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = '0019_case_demo_unassigned'
+down_revision: str | None = '0018_case_search_fallback_name'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _exec(sql: str) -> None:
+    op.get_bind().exec_driver_sql(sql)
+
+
+def _seed_ratio(case_id: str, suffix: str) -> float:
+    # Frozen copy of case_search_service.seed_ratio, as of this revision.
+    acc = 0
+    for idx, ch in enumerate(f'{case_id}:{suffix}'):
+        acc = (acc * 33 + ord(ch) + idx) & 0xFFFFFFFF
+    return (acc % 1000) / 1000.0
+
+
+def upgrade() -> None:
+    _exec("ALTER TABLE local_center.cases ADD COLUMN IF NOT EXISTS demo_unassigned boolean NOT NULL DEFAULT false")
+    bind = op.get_bind()
+    case_ids = bind.execute(sa.text("SELECT case_id FROM local_center.cases WHERE stage = 1")).scalars().all()
+    hidden = [
+        case_id
+        for case_id in case_ids
+        if case_id.startswith(('CASE-2026-', 'CASE-TOKEN-')) and _seed_ratio(case_id, 'owner') < 0.22
+    ]
+    if hidden:
+        bind.execute(
+            sa.text("UPDATE local_center.cases SET demo_unassigned = true WHERE case_id = ANY(:case_ids)"),
+            {'case_ids': hidden},
+        )
+    _exec("CREATE INDEX IF NOT EXISTS ix_local_cases_demo_unassigned ON local_center.cases (demo_unassigned)")
+
+
+def downgrade() -> None:
+    _exec("DROP INDEX IF EXISTS local_center.ix_local_cases_demo_unassigned")
+    _exec("ALTER TABLE local_center.cases DROP COLUMN IF EXISTS demo_unassigned")
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager
 from datetime import datetime
 import logging
 
+import orjson
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from server_fastapi.app.core.security import AuthUser, get_current_user
-from server_fastapi.app.db.session import get_db
+from server_fastapi.app.db.session import get_db, get_read_session_factory
 from server_fastapi.app.schemas.local_center import CalendarEventCreatePayload, CalendarEventCreateResponse
-from server_fastapi.app.services.local_case_service import create_calendar_event, list_calendar_events
+from server_fastapi.app.services.local_case_service import calendar_range, create_calendar_event, iter_calendar_events
 
 router = APIRouter(tags=['local-calendar'])
 logger = logging.getLogger(__name__)
@@ -26,15 +30,26 @@ def post_calendar_event(
 
 @router.get('/api/local-center/calendar/events')
 def get_calendar_events(
-    from_at: datetime | None = Query(default=None, alias='from'),
-    to_at: datetime | None = Query(default=None, alias='to'),
+    from_at: datetime = Query(alias='from'),
+    to_at: datetime = Query(alias='to'),
     assignee: str | None = Query(default=None),
-    db: Session = Depends(get_db),
-) -> dict:
-    try:
-        rows = list_calendar_events(db, from_at=from_at, to_at=to_at, assignee=assignee)
-        return {'items': rows, 'total': len(rows)}
-    except Exception:
-        logger.exception('Calendar events fetch failed (degraded response)')
-        # 데모/운영 화면 안정성을 위해 500 대신 안전 응답을 반환한다.
-        return {'items': [], 'total': 0, 'degraded': True}
+    open_session: Callable[[], AbstractContextManager[Session]] = Depends(get_read_session_factory),
+) -> StreamingResponse:
+    from_at, to_at = calendar_range(from_at, to_at)
+
+    def body() -> Iterator[bytes]:
+        total = 0
+        degraded = False
+        yield b'{"items":['
+        try:
+            with open_session() as db:
+                for item in iter_calendar_events(db, from_at=from_at, to_at=to_at, assignee=assignee):
+                    yield (b',' if total else b'') + orjson.dumps(item)
+                    total += 1
+        except Exception:
+            logger.exception('Calendar events fetch failed (degraded response)')
+            # 데모/운영 화면 안정성을 위해 500 대신 안전 응답을 반환한다.
+            degraded = True
+        yield f'],"total":{total}'.encode() + (b',"degraded":true}' if degraded else b'}')
+
+    return StreamingResponse(body(), media_type='application/json')
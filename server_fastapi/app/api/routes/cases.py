@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
 from server_fastapi.app.core.security import AuthUser, get_current_user
-from server_fastapi.app.db.session import get_db
+from server_fastapi.app.db.session import get_db, get_read_db
 from server_fastapi.app.schemas.local_center import (
     ExecuteActionBody,
+    InferenceBatchRunPayload,
+    InferenceBatchRunResponse,
     InferenceRunPayload,
     OutcomeSavePayload,
     OutcomeSaveResponse,
@@ -18,6 +20,7 @@ from server_fastapi.app.services.local_case_service import (
     get_stage3_case,
     reconcile_case_ops_loop,
     run_case_inference,
+    run_case_inference_batch,
     save_stage1_outcome,
     support_request,
 )
@@ -36,8 +39,13 @@ def save_case_outcome(
 
 
 @router.get('/api/cases/{case_id}')
-def get_case(case_id: str, db: Session = Depends(get_db)) -> dict:
-    return get_stage3_case(db, case_id)
+def get_case(
+    case_id: str,
+    timelineLimit: int = Query(default=100, ge=0, le=200),
+    auditLimit: int = Query(default=100, ge=0, le=200),
+    db: Session = Depends(get_read_db),
+) -> dict:
+    return get_stage3_case(db, case_id, timeline_limit=timelineLimit, audit_limit=auditLimit)
 
 
 @router.post('/api/cases/{case_id}/actions/execute')
@@ -78,6 +86,15 @@ def run_inference(
     return run_case_inference(db, case_id, payload, actor_name=user.user_id)
 
 
+@router.post('/api/inference/batch', response_model=InferenceBatchRunResponse)
+def run_inference_batch(
+    payload: InferenceBatchRunPayload,
+    db: Session = Depends(get_db),
+    user: AuthUser = Depends(get_current_user),
+) -> dict:
+    return run_case_inference_batch(db, payload, actor_name=user.user_id)
+
+
 @router.get('/api/inference/{job_id}')
 def get_inference_status(
     job_id: str,
@@ -3,7 +3,7 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 
-from server_fastapi.app.db.session import get_db
+from server_fastapi.app.db.session import get_read_db
 from server_fastapi.app.schemas.central import (
     BottleneckResponse,
     CentralCaseListResponse,
@@ -32,7 +32,7 @@ def dashboard_kpis(
     periodVariant: str = Query('default'),
     scope_level: str = Query('nation'),
     scope_id: str = Query('KR'),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> CentralDashboardKpisResponse:
     return get_dashboard_kpis(
         db,
@@ -50,7 +50,7 @@ def dashboard_bundle(
     scope_level: str = Query('nation'),
     scope_id: str = Query('KR'),
     child_codes: str | None = Query(default=None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> DashboardDataOut:
     _ = child_codes
     return get_dashboard_bundle(
@@ -81,7 +81,7 @@ def metrics_linkage(window: str = Query('LAST_7D'), periodVariant: str = Query('
 def metrics_regions(
     window: str = Query('LAST_7D'),
     periodVariant: str = Query('default'),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> RegionComparisonResponse:
     return get_regions(db, window=window, period_variant=periodVariant)
 
@@ -92,7 +92,7 @@ def central_cases(
     pageSize: int = Query(10, ge=1, le=100),
     stage: str | None = Query(default=None),
     event_type: str | None = Query(default=None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> CentralCaseListResponse:
     filters = {}
     if stage:
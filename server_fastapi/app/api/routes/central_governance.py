@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 
 from server_fastapi.app.db.session import get_db
@@ -60,12 +60,24 @@ def audit_unified(
 
 @router.get('/audit/events', response_model=list[AuditEventOut])
 def audit_events(
+    response: Response,
     entity_type: str | None = Query(default=None),
     entity_id: str | None = Query(default=None),
     range: str | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=500, ge=1, le=500),
     db: Session = Depends(get_db),
 ) -> list[AuditEventOut]:
-    rows = get_audit_events(db, entity_type=entity_type, entity_id=entity_id, range_expr=range)
+    rows, next_cursor = get_audit_events(
+        db,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        range_expr=range,
+        cursor=cursor,
+        limit=limit,
+    )
+    if next_cursor:
+        response.headers['X-Next-Cursor'] = next_cursor
     return [
         AuditEventOut(
             id=row.id,
@@ -88,11 +100,16 @@ def audit_events(
 
 @router.get('/audit/changes', response_model=list[AuditEventOut])
 def audit_changes(
+    response: Response,
     type: str | None = Query(default=None),
     range: str | None = Query(default=None),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=500, ge=1, le=500),
     db: Session = Depends(get_db),
 ) -> list[AuditEventOut]:
-    rows = get_audit_changes(db, change_type=type, range_expr=range)
+    rows, next_cursor = get_audit_changes(db, change_type=type, range_expr=range, cursor=cursor, limit=limit)
+    if next_cursor:
+        response.headers['X-Next-Cursor'] = next_cursor
     return [
         AuditEventOut(
             id=row.id,
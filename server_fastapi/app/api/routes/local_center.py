@@ -3,10 +3,11 @@ from __future__ import annotations
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from server_fastapi.app.core.security import AuthUser, get_current_user
-from server_fastapi.app.db.session import get_db
+from server_fastapi.app.db.session import get_db, get_read_db
 from server_fastapi.app.schemas.local_center import (
     LocalCasesListResponse,
     LocalDashboardKpiResponse,
@@ -24,7 +25,7 @@ from server_fastapi.app.services.local_case_service import (
 from server_fastapi.app.services.local_view_service import (
     build_case_entity,
     build_case_events,
-    build_dashboard_stats,
+    compute_dashboard_stats,
     list_dashboard_case_records,
 )
 
@@ -41,9 +42,10 @@ def get_local_cases(
     status: str | None = Query(default=None),
     page: int = Query(default=1, ge=1),
     size: int = Query(default=20, ge=1, le=200),
-    db: Session = Depends(get_db),
-) -> LocalCasesListResponse:
-    return list_local_cases(
+    cursor: str | None = Query(default=None),
+    db: Session = Depends(get_read_db),
+) -> ORJSONResponse:
+    page_rows = list_local_cases(
         db,
         stage=stage,
         alert=alert,
@@ -53,7 +55,9 @@ def get_local_cases(
         status=status,
         page=page,
         size=size,
+        cursor=cursor,
     )
+    return ORJSONResponse(page_rows.to_payload())
 
 
 @router.get('/api/local-center/dashboard/stats')
@@ -61,12 +65,12 @@ def get_local_dashboard_stats(
     stage: str | None = Query(default=None),
     status: str | None = Query(default=None),
     keyword: str | None = Query(default=None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> dict:
-    records = list_dashboard_case_records(db, stage=stage, status=status, keyword=keyword)
+    stats, total_cases = compute_dashboard_stats(db, stage=stage, status=status, keyword=keyword)
     return {
-        'stats': build_dashboard_stats(db, records),
-        'totalCases': len(records),
+        'stats': stats,
+        'totalCases': total_cases,
         'fetchedAt': datetime.utcnow().isoformat() + 'Z',
         'source': 'remote',
     }
@@ -77,15 +81,17 @@ def get_local_dashboard_cases(
     stage: str | None = Query(default=None),
     status: str | None = Query(default=None),
     keyword: str | None = Query(default=None),
-    db: Session = Depends(get_db),
-) -> dict:
+    db: Session = Depends(get_read_db),
+) -> ORJSONResponse:
     records = list_dashboard_case_records(db, stage=stage, status=status, keyword=keyword)
-    return {
-        'items': records,
-        'total': len(records),
-        'fetchedAt': datetime.utcnow().isoformat() + 'Z',
-        'source': 'remote',
-    }
+    return ORJSONResponse(
+        {
+            'items': records,
+            'total': len(records),
+            'fetchedAt': datetime.utcnow().isoformat() + 'Z',
+            'source': 'remote',
+        }
+    )
 
 
 @router.get('/api/local-center/cases/{case_id}')
@@ -98,11 +104,17 @@ def get_local_case_detail(case_id: str, db: Session = Depends(get_db)) -> dict:
 
 
 @router.get('/api/local-center/cases/{case_id}/events')
-def get_local_case_events(case_id: str, db: Session = Depends(get_db)) -> dict:
-    items = build_case_events(db, case_id)
+def get_local_case_events(
+    case_id: str,
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=200, ge=1, le=200),
+    db: Session = Depends(get_db),
+) -> dict:
+    items, next_cursor = build_case_events(db, case_id, cursor=cursor, limit=limit)
     return {
         'items': items,
         'total': len(items),
+        'nextCursor': next_cursor,
         'fetchedAt': datetime.utcnow().isoformat() + 'Z',
         'source': 'remote',
     }
@@ -114,8 +126,11 @@ def get_local_case_summary(case_id: str, db: Session = Depends(get_db)) -> dict:
 
 
 @router.get('/api/local-center/dashboard/kpis', response_model=LocalDashboardKpiResponse)
-def get_local_kpis(db: Session = Depends(get_db)) -> LocalDashboardKpiResponse:
-    return get_local_dashboard_kpis(db)
+def get_local_kpis(
+    centerId: str | None = Query(default=None),
+    db: Session = Depends(get_db),
+) -> LocalDashboardKpiResponse:
+    return get_local_dashboard_kpis(db, center_id=centerId)
 
 
 @router.post('/api/local-center/work-items')
@@ -142,7 +157,9 @@ def get_local_audit_events(
     caseId: str | None = Query(default=None),
     from_at: datetime | None = Query(default=None, alias='from'),
     to_at: datetime | None = Query(default=None, alias='to'),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=200, ge=1, le=500),
     db: Session = Depends(get_db),
 ) -> dict:
-    rows = list_audit_events(db, case_id=caseId, from_at=from_at, to_at=to_at)
-    return {'items': [row.model_dump() for row in rows], 'total': len(rows)}
+    rows, next_cursor = list_audit_events(db, case_id=caseId, from_at=from_at, to_at=to_at, cursor=cursor, limit=limit)
+    return {'items': [row.model_dump() for row in rows], 'total': len(rows), 'nextCursor': next_cursor}
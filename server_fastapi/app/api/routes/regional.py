@@ -6,7 +6,7 @@ from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
-from server_fastapi.app.db.session import get_db
+from server_fastapi.app.db.session import get_db, get_read_db
 from server_fastapi.app.services.regional_service import (
     _parse_district_tokens,
     build_area_comparison,
@@ -16,8 +16,8 @@ from server_fastapi.app.services.regional_service import (
     build_dashboard_district_rows,
     build_report_summary,
     create_intervention_from_cause_snapshot,
-    ensure_regional_snapshot_scope,
     get_intervention_items,
+    patch_intervention_item,
     put_intervention_items,
 )
 
@@ -30,6 +30,12 @@ class InterventionSnapshotUpsertBody(BaseModel):
     items: list[dict[str, Any]] = Field(default_factory=list)
 
 
+class InterventionItemPatchBody(BaseModel):
+    regionId: str = Field(default='seoul')
+    period: str = Field(default='week')
+    patch: dict[str, Any] = Field(default_factory=dict)
+
+
 class CauseInterventionCreateBody(BaseModel):
     from_: str | None = Field(default=None, alias='from')
     queryState: dict[str, Any] = Field(default_factory=dict)
@@ -42,7 +48,7 @@ def get_regional_dashboard_districts(
     period: str = Query(default='week'),
     rangePreset: str = Query(default='7d'),
     district: list[str] = Query(default=[]),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> dict:
     districts = _parse_district_tokens(district)
     items = build_dashboard_district_rows(
@@ -70,7 +76,7 @@ def get_regional_cause_summary(
     period: str = Query(default='week'),
     selectedStage: str | None = Query(default=None),
     selectedCauseKey: str | None = Query(default=None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> dict:
     stage = None if selectedStage in {None, '', 'all'} else selectedStage
     cause = None if selectedCauseKey in {None, '', 'all'} else selectedCauseKey
@@ -93,7 +99,7 @@ def get_regional_cause_topn(
     period: str = Query(default='week'),
     selectedStage: str | None = Query(default=None),
     selectedArea: str | None = Query(default=None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> dict:
     stage = None if selectedStage in {None, '', 'all'} else selectedStage
     area = None if selectedArea in {None, '', 'all'} else selectedArea
@@ -117,7 +123,7 @@ def get_regional_area_comparison(
     selectedStage: str | None = Query(default=None),
     selectedCauseKey: str | None = Query(default=None),
     district: list[str] = Query(default=[]),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> list[dict[str, Any]]:
     stage = None if selectedStage in {None, '', 'all'} else selectedStage
     cause = None if selectedCauseKey in {None, '', 'all'} else selectedCauseKey
@@ -144,7 +150,7 @@ def get_regional_cause_trend(
     selectedCauseKey: str | None = Query(default=None),
     selectedArea: str | None = Query(default=None),
     trendMetric: str = Query(default='ratio'),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> dict:
     stage = None if selectedStage in {None, '', 'all'} else selectedStage
     cause = None if selectedCauseKey in {None, '', 'all'} else selectedCauseKey
@@ -179,9 +185,8 @@ def post_regional_cause_intervention(
 def get_regional_interventions_snapshot(
     regionId: str = Query(default='seoul'),
     period: str = Query(default='week'),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> dict:
-    ensure_regional_snapshot_scope(db, region_id=regionId, period=period)
     items = get_intervention_items(db, region_id=regionId, period=period)
     return {
         'regionId': regionId,
@@ -199,6 +204,22 @@ def put_regional_interventions_snapshot(
     return put_intervention_items(db, region_id=body.regionId, period=body.period, items=body.items)
 
 
+@router.patch('/api/regional/interventions/snapshot/items/{intervention_id}')
+def patch_regional_intervention_item(
+    intervention_id: str,
+    body: InterventionItemPatchBody,
+    db: Session = Depends(get_db),
+) -> dict:
+    item = patch_intervention_item(
+        db,
+        region_id=body.regionId,
+        period=body.period,
+        intervention_id=intervention_id,
+        patch=body.patch,
+    )
+    return {'ok': True, 'item': item}
+
+
 @router.get('/api/regional/reports/summary')
 def get_regional_report_summary(
     regionId: str = Query(default='seoul'),
@@ -206,7 +227,7 @@ def get_regional_report_summary(
     sgg: str = Query(default=''),
     kpi: str = Query(default='all'),
     period: str = Query(default='week'),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> dict:
     return build_report_summary(
         db,
@@ -19,10 +19,14 @@ class Settings(BaseSettings):
     base_path: str = Field(default='/neuro-shield/', alias='BASE_PATH')
 
     database_url: str = Field(default='postgresql+psycopg://dbuser:dbpass@db:5432/neuro', alias='DATABASE_URL')
+    database_replica_url: str | None = Field(default=None, alias='DATABASE_REPLICA_URL')
+    replica_max_lag_seconds: float = Field(default=5.0, alias='REPLICA_MAX_LAG_SECONDS')
+    replica_lag_check_seconds: float = Field(default=10.0, alias='REPLICA_LAG_CHECK_SECONDS')
     redis_url: str = Field(default='redis://redis:6379/0', alias='REDIS_URL')
 
     celery_broker_url: str = Field(default='redis://redis:6379/1', alias='CELERY_BROKER_URL')
     celery_result_backend: str = Field(default='redis://redis:6379/2', alias='CELERY_RESULT_BACKEND')
+    regional_sync_concurrency: int = Field(default=6, alias='REGIONAL_SYNC_CONCURRENCY')
 
     s3_endpoint: str = Field(default='http://minio:9000', alias='S3_ENDPOINT')
     s3_access_key: str = Field(default='minioadmin', alias='S3_ACCESS_KEY')
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def dialect_insert(db: Session, target: Any) -> Any:
+    # ON CONFLICT / RETURNING constructs are dialect specific; local SQLite runs mirror Postgres.
+    if db.get_bind().dialect.name == 'sqlite':
+        return sqlite.insert(target)
+    return postgresql.insert(target)
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-from collections.abc import Generator
+import logging
+import threading
+import time
+from collections.abc import Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
 
 from server_fastapi.app.core.config import get_settings
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 
 def _normalize_database_url(url: str) -> str:
@@ -19,6 +24,52 @@ def _normalize_database_url(url: str) -> str:
 engine = create_engine(_normalize_database_url(settings.database_url), pool_pre_ping=True)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, class_=Session)
 
+replica_engine = (
+    create_engine(_normalize_database_url(settings.database_replica_url), pool_pre_ping=True)
+    if settings.database_replica_url
+    else None
+)
+ReplicaSessionLocal = (
+    sessionmaker(autocommit=False, autoflush=False, bind=replica_engine, class_=Session) if replica_engine is not None else None
+)
+
+# A replica that has replayed everything it received is current even when the primary is idle.
+REPLICA_LAG_SQL = text(
+    'SELECT CASE WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 '
+    'ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END'
+)
+
+_replica_health = {'checked_at': float('-inf'), 'usable': False}
+_replica_health_lock = threading.Lock()
+
+
+def replica_lag_seconds() -> float | None:
+    if replica_engine is None:
+        return None
+    try:
+        with replica_engine.connect() as conn:
+            return float(conn.execute(REPLICA_LAG_SQL).scalar() or 0)
+    except Exception:
+        logger.warning('Replica lag check failed; reads fall back to primary', exc_info=True)
+        return None
+
+
+def replica_is_usable() -> bool:
+    if replica_engine is None:
+        return False
+    now = time.monotonic()
+    if now - _replica_health['checked_at'] < settings.replica_lag_check_seconds:
+        return bool(_replica_health['usable'])
+
+    with _replica_health_lock:
+        if now - _replica_health['checked_at'] >= settings.replica_lag_check_seconds:
+            lag = replica_lag_seconds()
+            usable = lag is not None and lag <= settings.replica_max_lag_seconds
+            if not usable and _replica_health['usable']:
+                logger.warning('Replica lag %s exceeds %ss; routing reads to primary', lag, settings.replica_max_lag_seconds)
+            _replica_health.update(checked_at=time.monotonic(), usable=usable)
+        return bool(_replica_health['usable'])
+
 
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
@@ -26,3 +77,23 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+@contextmanager
+def read_session() -> Iterator[Session]:
+    factory = ReplicaSessionLocal if ReplicaSessionLocal is not None and replica_is_usable() else SessionLocal
+    db = factory()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_read_db() -> Generator[Session, None, None]:
+    with read_session() as db:
+        yield db
+
+
+def get_read_session_factory() -> Callable[[], AbstractContextManager[Session]]:
+    # Streaming bodies run after yield dependencies have closed; they open their own read session with this.
+    return read_session
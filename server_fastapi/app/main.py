@@ -10,6 +10,7 @@ from server_fastapi.app.core.config import get_settings
 from server_fastapi.app.core.logging import configure_logging, get_logger
 from server_fastapi.app.db.session import SessionLocal
 from server_fastapi.app.services.bootstrap_service import seed_demo_data_if_needed
+from server_fastapi.app.services.case_view_service import refresh_missing_case_views
 
 settings = get_settings()
 logger = get_logger(__name__)
@@ -20,6 +21,8 @@ def _run_startup_bootstrap() -> None:
     try:
         result = seed_demo_data_if_needed(db, min_cases=20)
         logger.info('startup bootstrap seed result: %s', result)
+        projected = refresh_missing_case_views(db)
+        logger.info('startup bootstrap projected %s case views', projected)
     except Exception:
         logger.exception('startup bootstrap failed')
     finally:
@@ -165,6 +165,7 @@ class AuditEvent(Base):
     __tablename__ = 'audit_events'
     __table_args__ = (
         Index('ix_control_audit_events_entity_ts', 'entity_type', 'entity_id', 'ts'),
+        Index('ix_control_audit_events_ts_id', 'ts', 'id'),
         {'schema': 'control'},
     )
 
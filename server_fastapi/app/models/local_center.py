@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any
 
 from sqlalchemy import (
     Boolean,
+    Computed,
     DateTime,
     ForeignKey,
     Index,
@@ -13,8 +15,11 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    event,
+    false,
     func,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from server_fastapi.app.db.base import Base
@@ -67,6 +72,9 @@ class LocalCase(Base):
         Index('ix_local_cases_stage_status', 'stage', 'status'),
         Index('ix_local_cases_alert_priority', 'alert_level', 'priority_tier'),
         Index('ix_local_cases_case_key', 'case_key'),
+        Index('ix_local_cases_updated_case', 'updated_at', 'case_id'),
+        Index('ix_local_cases_center_churn', 'center_id', 'churn_risk'),
+        Index('ix_local_cases_demo_unassigned', 'demo_unassigned'),
         {'schema': 'local_center'},
     )
 
@@ -80,15 +88,37 @@ class LocalCase(Base):
     operational_status: Mapped[str] = mapped_column(String(64), nullable=False, default='TRACKING')
     priority_tier: Mapped[str] = mapped_column(String(16), nullable=False, default='P2')
     alert_level: Mapped[str | None] = mapped_column(String(16))
+    churn_risk: Mapped[str | None] = mapped_column(String(16))
+    # Stage 1 demo cases displayed as unassigned; kept in sync by case_search_service.
+    demo_unassigned: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, server_default=false())
+    # Due schedules the scan has QUEUED and queue processing has not finished; maintained by both.
+    overdue_schedule_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default='0')
     subject_json: Mapped[dict] = mapped_column(JSON, nullable=False)
     communication_json: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
     referral_json: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
     metrics_json: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
     raw_json: Mapped[dict | None] = mapped_column(JSON)
+    search_text: Mapped[str | None] = mapped_column(
+        Text,
+        # Mirrors the displayed subject name, including the '대상자-XXXX' fallback.
+        Computed(
+            "lower(case_id || ' ' || coalesce(nullif(subject_json ->> 'maskedName', ''), "
+            "'대상자-' || substr(case_id, length(case_id) - 3)))",
+            persisted=True,
+        ),
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
 
+@event.listens_for(LocalCase, 'before_insert')
+@event.listens_for(LocalCase, 'before_update')
+def _sync_local_case_churn_risk(mapper: Any, connection: Any, target: LocalCase) -> None:
+    header = (target.raw_json or {}).get('headerMeta') if isinstance(target.raw_json, dict) else None
+    churn_risk = header.get('churn_risk') if isinstance(header, dict) else None
+    target.churn_risk = str(churn_risk).upper() if churn_risk else None
+
+
 class CaseStageState(Base):
     __tablename__ = 'case_stage_states'
     __table_args__ = (
@@ -130,6 +160,7 @@ class Schedule(Base):
     __table_args__ = (
         UniqueConstraint('idempotency_key', name='uq_local_schedules_idempotency'),
         Index('ix_local_schedules_due', 'start_at', 'status'),
+        Index('ix_local_schedules_assignee_start', 'assignee_id', 'start_at'),
         {'schema': 'local_center'},
     )
 
@@ -150,7 +181,7 @@ class Schedule(Base):
 class TimelineEvent(Base):
     __tablename__ = 'timeline_events'
     __table_args__ = (
-        Index('ix_local_timeline_case_at', 'case_id', 'at'),
+        Index('ix_local_timeline_case_at_id', 'case_id', 'at', 'id'),
         {'schema': 'local_center'},
     )
 
@@ -165,10 +196,20 @@ class TimelineEvent(Base):
     payload_json: Mapped[dict | None] = mapped_column(JSON)
 
 
+class CaseOpsEvent(Base):
+    __tablename__ = 'case_ops_events'
+    __table_args__ = {'schema': 'local_center'}
+
+    case_id: Mapped[str] = mapped_column(ForeignKey('local_center.cases.case_id', ondelete='CASCADE'), primary_key=True)
+    ops_event: Mapped[str] = mapped_column(String(32), primary_key=True)
+    first_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
 class LocalAuditEvent(Base):
     __tablename__ = 'audit_events'
     __table_args__ = (
-        Index('ix_local_audit_case_at', 'case_id', 'at'),
+        Index('ix_local_audit_case_at_id', 'case_id', 'at', 'id'),
+        Index('ix_local_audit_at_id', 'at', 'id'),
         Index('ix_local_audit_entity_at', 'entity_type', 'entity_id', 'at'),
         {'schema': 'local_center'},
     )
@@ -398,6 +439,29 @@ class Stage3ModelRun(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
 
+class InferenceJob(Base):
+    __tablename__ = 'inference_jobs'
+    __table_args__ = (
+        Index('ix_local_inference_jobs_case_requested', 'case_id', 'requested_at'),
+        Index('ix_local_inference_jobs_status', 'status', 'updated_at'),
+        {'schema': 'local_center'},
+    )
+
+    job_id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    case_id: Mapped[str] = mapped_column(ForeignKey('local_center.cases.case_id'), nullable=False)
+    stage: Mapped[int] = mapped_column(Integer, nullable=False)
+    status: Mapped[str] = mapped_column(String(32), nullable=False, default='PENDING')
+    progress: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    eta_seconds: Mapped[int | None] = mapped_column(Integer)
+    duration_sec: Mapped[int | None] = mapped_column(Integer)
+    model_version: Mapped[str | None] = mapped_column(String(64))
+    requested_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    applied_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+
 class Alert(Base):
     __tablename__ = 'alerts'
     __table_args__ = (
@@ -429,17 +493,31 @@ class RagRun(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
 
+class CaseView(Base):
+    __tablename__ = 'case_views'
+    __table_args__ = (
+        Index('ix_local_case_views_display_status', 'display_status'),
+        {'schema': 'local_center'},
+    )
+
+    case_id: Mapped[str] = mapped_column(ForeignKey('local_center.cases.case_id', ondelete='CASCADE'), primary_key=True)
+    display_status: Mapped[str] = mapped_column(String(16), nullable=False)
+    entity_json: Mapped[dict] = mapped_column(JSON().with_variant(JSONB(), 'postgresql'), nullable=False)
+    record_json: Mapped[dict] = mapped_column(JSON().with_variant(JSONB(), 'postgresql'), nullable=False)
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
 class RegionalSnapshot(Base):
     __tablename__ = 'regional_snapshots'
     __table_args__ = (
-        Index('ix_local_regional_snapshots_scope', 'scope_key'),
+        UniqueConstraint('scope_key', name='uq_local_regional_snapshots_scope'),
         Index('ix_local_regional_snapshots_region_updated', 'region_id', 'updated_at'),
         {'schema': 'local_center'},
     )
 
     snapshot_id: Mapped[str] = mapped_column(String(64), primary_key=True)
-    scope_key: Mapped[str] = mapped_column(String(128), unique=True, nullable=False)
+    scope_key: Mapped[str] = mapped_column(String(128), nullable=False)
     region_id: Mapped[str] = mapped_column(String(64), nullable=False)
-    payload_json: Mapped[dict] = mapped_column(JSON, nullable=False)
+    payload_json: Mapped[dict] = mapped_column(JSON().with_variant(JSONB(), 'postgresql'), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
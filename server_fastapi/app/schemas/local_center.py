@@ -157,6 +157,23 @@ class InferenceRunResponse(BaseModel):
     completedAt: str | None = None
 
 
+class InferenceBatchRunPayload(BaseModel):
+    caseIds: list[str] = Field(min_length=1, max_length=500)
+    stage: Literal[2, 3]
+    modelVersion: str | None = None
+
+
+class InferenceBatchRejection(BaseModel):
+    caseId: str
+    code: str
+    message: str
+
+
+class InferenceBatchRunResponse(BaseModel):
+    jobs: list[InferenceRunResponse] = Field(default_factory=list)
+    rejected: list[InferenceBatchRejection] = Field(default_factory=list)
+
+
 class OpsLoopReconcileResponse(BaseModel):
     caseId: str
     stage: int
@@ -203,6 +220,7 @@ class LocalCasesListResponse(BaseModel):
     page: int
     size: int
     items: list[LocalCaseSummaryResponse]
+    nextCursor: str | None = None
 
 
 class LocalDashboardKpiResponse(BaseModel):
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from sqlalchemy import Row, inspect, select, update
+from sqlalchemy.orm import Session
+
+from server_fastapi.app.models.local_center import LocalAuditEvent
+from server_fastapi.app.services.cache_service import delete_pattern_after_commit
+from server_fastapi.app.services.case_event_recorder import record_case_events
+
+logger = logging.getLogger(__name__)
+
+BULK_TRANSITION_BATCH_SIZE = 500
+
+
+def bulk_transition(
+    db: Session,
+    model: Any,
+    *,
+    where: Sequence[Any],
+    values: dict[str, Any],
+    returning: Sequence[Any] = (),
+    audit: Callable[[Row], LocalAuditEvent | None] | None = None,
+    on_batch: Callable[[list[Row]], None] | None = None,
+    invalidate: Sequence[str] = (),
+    order_by: Any = None,
+    limit: int | None = None,
+    batch_size: int = BULK_TRANSITION_BATCH_SIZE,
+    label: str | None = None,
+) -> dict[str, Any]:
+    key = inspect(model).primary_key[0]
+    processed = 0
+    latencies: list[int] = []
+
+    while limit is None or processed < limit:
+        chunk = batch_size if limit is None else min(batch_size, limit - processed)
+        started = time.perf_counter()
+        # SKIP LOCKED hands concurrent workers disjoint batches instead of transitioning the same rows twice.
+        claim = select(key).where(*where).limit(chunk).with_for_update(skip_locked=True)
+        if order_by is not None:
+            claim = claim.order_by(order_by)
+        rows = db.execute(
+            update(model)
+            .where(key.in_(claim.scalar_subquery()), *where)
+            .values(**values)
+            .returning(key, *returning)
+            .execution_options(synchronize_session=False)
+        ).all()
+        if rows and audit is not None:
+            record_case_events(db, *(event for event in map(audit, rows) if event is not None))
+        if rows and on_batch is not None:
+            on_batch(rows)
+        if rows:
+            # Core UPDATEs bypass the ORM after_flush cache trackers, so callers name the caches to drop.
+            for pattern in invalidate:
+                delete_pattern_after_commit(db, pattern)
+        db.commit()
+
+        processed += len(rows)
+        latencies.append(int((time.perf_counter() - started) * 1000))
+        logger.info('%s: transitioned %s rows in %sms', label or model.__tablename__, len(rows), latencies[-1])
+        if len(rows) < chunk:
+            break
+
+    return {'processed': processed, 'batches': len(latencies), 'batchLatencyMs': latencies}
@@ -5,6 +5,8 @@ from typing import Any
 
 import redis
 from redis import Redis
+from sqlalchemy import event
+from sqlalchemy.orm import Session
 
 from server_fastapi.app.core.config import get_settings
 
@@ -49,7 +51,25 @@ def delete_pattern(pattern: str) -> int:
     client = get_redis_client()
     if client is None:
         return 0
+    if not any(ch in pattern for ch in '*?['):
+        # An exact key needs no keyspace walk.
+        return int(client.delete(pattern))
     deleted = 0
     for key in client.scan_iter(match=pattern):
         deleted += client.delete(key)
     return deleted
+
+
+def delete_pattern_after_commit(session: Session, pattern: str) -> None:
+    session.info.setdefault('cache_patterns_after_commit', set()).add(pattern)
+
+
+@event.listens_for(Session, 'after_commit')
+def _delete_patterns_after_commit(session: Session) -> None:
+    for pattern in session.info.pop('cache_patterns_after_commit', set()):
+        delete_pattern(pattern)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_patterns_after_rollback(session: Session) -> None:
+    session.info.pop('cache_patterns_after_commit', None)
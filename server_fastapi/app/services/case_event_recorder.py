@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.sql.util import find_tables
+
+from server_fastapi.app.db.dialect import dialect_insert
+from server_fastapi.app.models.local_center import CaseOpsEvent, LocalAuditEvent, TimelineEvent
+
+BUFFER_KEY = 'case_event_buffer'
+DRAINING_KEY = 'case_event_draining'
+BUFFERED_EVENT_TABLES = frozenset({TimelineEvent.__table__, LocalAuditEvent.__table__, CaseOpsEvent.__table__})
+
+TIMELINE_COLUMNS = [column.key for column in TimelineEvent.__table__.columns]
+AUDIT_COLUMNS = [column.key for column in LocalAuditEvent.__table__.columns if column.key != 'id']
+
+# Ops-loop milestones keyed by the tokens that mark them in a timeline row's type/title/detail.
+# Mirrored by the backfill in migration 0015_case_ops_events.
+OPS_EVENT_TOKENS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ('PLAN_CONFIRMED', ('PLAN', '계획')),
+    ('RESULT_RECEIVED', ('RESULT', '결과')),
+    ('RESULT_VALIDATED', ('VALID', '검증', '확정')),
+    ('INFERENCE_REQUESTED', ('INFERENCE_REQUESTED', '모델 실행 요청')),
+    ('INFERENCE_STARTED', ('INFERENCE_STARTED', '모델 실행 시작')),
+    ('INFERENCE_COMPLETED', ('INFERENCE_COMPLETED', '모델 실행 완료')),
+    ('CLASSIFICATION_CONFIRMED', ('CLASS', '분류')),
+    ('NEXT_STEP_DECIDED', ('NEXT STEP', '다음 단계')),
+    ('REFERRAL_CONFIRMED', ('REFERRAL', '의뢰', '예약')),
+)
+
+
+def ops_event_codes(event_type: str | None, title: str | None, detail: str | None) -> set[str]:
+    blob = f'{event_type or ""} {title or ""} {detail or ""}'.upper()
+    return {code for code, tokens in OPS_EVENT_TOKENS if any(token in blob for token in tokens)}
+
+
+def _ops_event_values(timeline_rows: list[TimelineEvent]) -> list[dict]:
+    first_at: dict[tuple[str, str], datetime] = {}
+    for row in timeline_rows:
+        for code in ops_event_codes(row.event_type, row.title, row.detail):
+            key = (row.case_id, code)
+            if key not in first_at or row.at < first_at[key]:
+                first_at[key] = row.at
+    return [{'case_id': case_id, 'ops_event': code, 'first_at': at} for (case_id, code), at in first_at.items()]
+
+
+def record_case_events(db: Session, *rows: TimelineEvent | LocalAuditEvent) -> None:
+    if not db.in_transaction():
+        # Tie the buffer to a transaction so a rollback always discards it.
+        db.begin()
+    buffer = db.info.setdefault(BUFFER_KEY, {'timeline': [], 'audit': []})
+    for row in rows:
+        if isinstance(row, TimelineEvent):
+            buffer['timeline'].append(row)
+        elif isinstance(row, LocalAuditEvent):
+            buffer['audit'].append(row)
+        else:
+            raise TypeError(f'unsupported case event row: {type(row).__name__}')
+
+
+def flush_case_events(db: Session) -> None:
+    buffer = db.info.get(BUFFER_KEY)
+    if not buffer or not (buffer['timeline'] or buffer['audit']) or db.info.get(DRAINING_KEY):
+        return
+
+    db.info[DRAINING_KEY] = True
+    try:
+        # Pending parents (e.g. a freshly seeded case) must exist before the FK rows land.
+        db.flush()
+        timeline_rows, audit_rows = buffer['timeline'], buffer['audit']
+        buffer['timeline'], buffer['audit'] = [], []
+
+        if timeline_rows:
+            db.execute(
+                insert(TimelineEvent),
+                [{key: getattr(row, key) for key in TIMELINE_COLUMNS} for row in timeline_rows],
+            )
+            ops_values = _ops_event_values(timeline_rows)
+            if ops_values:
+                db.execute(
+                    dialect_insert(db, CaseOpsEvent)
+                    .values(ops_values)
+                    .on_conflict_do_nothing(index_elements=['case_id', 'ops_event'])
+                )
+        if audit_rows:
+            ids = db.execute(
+                insert(LocalAuditEvent).returning(LocalAuditEvent.id, sort_by_parameter_order=True),
+                [{key: getattr(row, key) for key in AUDIT_COLUMNS} for row in audit_rows],
+            ).scalars()
+            for row, row_id in zip(audit_rows, ids):
+                row.id = row_id
+    finally:
+        db.info.pop(DRAINING_KEY, None)
+
+
+def _has_buffered_rows(session: Session) -> bool:
+    buffer = session.info.get(BUFFER_KEY)
+    return bool(buffer and (buffer['timeline'] or buffer['audit']))
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _flush_before_event_reads(orm_execute_state: ORMExecuteState) -> None:
+    session = orm_execute_state.session
+    if not orm_execute_state.is_select or not _has_buffered_rows(session):
+        return
+    # Walks subqueries too, so count() and joined reads see the buffered rows.
+    if BUFFERED_EVENT_TABLES.intersection(find_tables(orm_execute_state.statement, include_aliases=True)):
+        flush_case_events(session)
+
+
+@event.listens_for(Session, 'before_commit')
+def _flush_before_commit(session: Session) -> None:
+    flush_case_events(session)
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_after_rollback(session: Session, previous_transaction: object) -> None:
+    if not getattr(previous_transaction, 'nested', False):
+        session.info.pop(BUFFER_KEY, None)
+
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+# Response keys in the order list_local_cases selects the matching columns; rows are zipped onto them as-is.
+CASE_SUMMARY_KEYS = (
+    'caseId',
+    'stage',
+    'status',
+    'operationalStatus',
+    'owner',
+    'alertLevel',
+    'priorityTier',
+    'nextActionAt',
+)
+
+
+class CaseSummaryPage:
+    __slots__ = ('total', 'page', 'size', 'rows', 'next_cursor')
+
+    def __init__(self, total: int, page: int, size: int, rows: Sequence[Sequence[Any]], next_cursor: str | None) -> None:
+        self.total = total
+        self.page = page
+        self.size = size
+        self.rows = rows
+        self.next_cursor = next_cursor
+
+    def items(self) -> list[dict[str, Any]]:
+        keys = CASE_SUMMARY_KEYS
+        return [dict(zip(keys, row)) for row in self.rows]
+
+    def to_payload(self) -> dict[str, Any]:
+        return {
+            'total': self.total,
+            'page': self.page,
+            'size': self.size,
+            'items': self.items(),
+            'nextCursor': self.next_cursor,
+        }
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import and_, event, func, or_, select
+from sqlalchemy.orm import Session
+
+from server_fastapi.app.models.local_center import LocalCase, LocalUser
+
+UNASSIGNED_OWNER_LABEL = '담당자 미지정'
+DEMO_CASE_PREFIXES = ('CASE-2026-', 'CASE-TOKEN-')
+
+
+def seed_ratio(case_id: str, suffix: str) -> float:
+    raw = f'{case_id}:{suffix}'
+    acc = 0
+    for idx, ch in enumerate(raw):
+        acc = (acc * 33 + ord(ch) + idx) & 0xFFFFFFFF
+    return (acc % 1000) / 1000.0
+
+
+def is_demo_unassigned(case: Any) -> bool:
+    if case.stage != 1:
+        return False
+    if not case.case_id.startswith(DEMO_CASE_PREFIXES):
+        return False
+    return seed_ratio(case.case_id, 'owner') < 0.22
+
+
+@event.listens_for(LocalCase, 'before_insert')
+@event.listens_for(LocalCase, 'before_update')
+def _sync_local_case_demo_unassigned(mapper: Any, connection: Any, target: LocalCase) -> None:
+    # Stored so search can tell, in SQL, which cases display UNASSIGNED_OWNER_LABEL instead of their owner.
+    target.demo_unassigned = is_demo_unassigned(target)
+
+
+def _normalize_keyword(keyword: str | None) -> str:
+    return str(keyword or '').strip().lower()
+
+
+def _like_pattern(value: str) -> str:
+    escaped = value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f'%{escaped}%'
+
+
+def case_search_filter(db: Session, keyword: str | None) -> Any | None:
+    q = _normalize_keyword(keyword)
+    if not q:
+        return None
+
+    # Match what the case list displays: id, subject name (search_text) and the manager label.
+    # On Postgres, search_text and lower(users.name) both carry gin_trgm_ops indexes.
+    pattern = _like_pattern(q)
+    owner_ids = select(LocalUser.id).where(func.lower(LocalUser.name).like(pattern, escape='\\'))
+    clauses = [
+        LocalCase.search_text.like(pattern, escape='\\'),
+        and_(LocalCase.owner_id.in_(owner_ids), ~LocalCase.demo_unassigned),
+    ]
+    if q in UNASSIGNED_OWNER_LABEL:
+        clauses.append(or_(LocalCase.owner_id.is_(None), LocalCase.demo_unassigned))
+    return or_(*clauses)
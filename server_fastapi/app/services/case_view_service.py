@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from itertools import chain
+from typing import Any, Iterable
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from server_fastapi.app.db.dialect import dialect_insert
+from server_fastapi.app.models.local_center import CaseView, LocalCase, Stage2ModelRun, Stage3ModelRun, WorkItem
+from server_fastapi.app.services.local_view_service import _case_record_base, compute_case_entities
+
+CASE_VIEW_SOURCE_MODELS = (LocalCase, Stage2ModelRun, Stage3ModelRun, WorkItem)
+CASE_VIEW_DIRTY_KEY = 'case_view_dirty'
+CASE_VIEW_REFRESH_CHUNK = 500
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def mark_case_views_stale(db: Session, case_ids: Iterable[str]) -> None:
+    # For writes that bypass the unit of work (bulk UPDATE statements); ORM changes are tracked automatically.
+    db.info.setdefault(CASE_VIEW_DIRTY_KEY, set()).update(str(case_id) for case_id in case_ids if case_id)
+
+
+def refresh_case_views(db: Session, case_ids: list[str]) -> int:
+    refreshed = 0
+    for offset in range(0, len(case_ids), CASE_VIEW_REFRESH_CHUNK):
+        chunk = case_ids[offset : offset + CASE_VIEW_REFRESH_CHUNK]
+        cases = db.execute(select(LocalCase).where(LocalCase.case_id.in_(chunk))).scalars().all()
+        if not cases:
+            continue
+        entities = compute_case_entities(db, list(cases))
+        now = _utcnow()
+        values = []
+        for case in cases:
+            record = _case_record_base(case)
+            values.append(
+                {
+                    'case_id': case.case_id,
+                    'display_status': record['status'],
+                    'entity_json': entities[case.case_id],
+                    'record_json': record,
+                    'refreshed_at': now,
+                }
+            )
+        stmt = dialect_insert(db, CaseView).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CaseView.case_id],
+            set_={
+                'display_status': stmt.excluded.display_status,
+                'entity_json': stmt.excluded.entity_json,
+                'record_json': stmt.excluded.record_json,
+                'refreshed_at': stmt.excluded.refreshed_at,
+            },
+        )
+        db.execute(stmt)
+        refreshed += len(values)
+    return refreshed
+
+
+def refresh_missing_case_views(db: Session) -> int:
+    missing = list(
+        db.execute(
+            select(LocalCase.case_id)
+            .outerjoin(CaseView, CaseView.case_id == LocalCase.case_id)
+            .where(CaseView.case_id.is_(None))
+            .order_by(LocalCase.case_id)
+        ).scalars()
+    )
+    refreshed = refresh_case_views(db, missing)
+    db.commit()
+    return refreshed
+
+
+@event.listens_for(Session, 'after_flush')
+def _track_case_view_sources(session: Session, flush_context: Any) -> None:
+    deleted_cases = {obj.case_id for obj in session.deleted if isinstance(obj, LocalCase)}
+    case_ids = {
+        obj.case_id
+        for obj in chain(session.new, session.dirty, session.deleted)
+        if isinstance(obj, CASE_VIEW_SOURCE_MODELS) and obj.case_id not in deleted_cases
+    }
+    if case_ids:
+        mark_case_views_stale(session, case_ids)
+
+
+@event.listens_for(Session, 'before_commit')
+def _refresh_case_views_before_commit(session: Session) -> None:
+    # before_commit runs ahead of the final flush; flush here so pending source rows are tracked and visible.
+    session.flush()
+    if not session.info.get(CASE_VIEW_DIRTY_KEY):
+        return
+    case_ids = sorted(session.info.pop(CASE_VIEW_DIRTY_KEY, set()))
+    refresh_case_views(session, case_ids)
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_case_view_marks(session: Session, previous_transaction: Any) -> None:
+    if not getattr(previous_transaction, 'nested', False):
+        session.info.pop(CASE_VIEW_DIRTY_KEY, None)
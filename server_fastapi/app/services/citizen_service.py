@@ -7,7 +7,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from fastapi import HTTPException
-from sqlalchemy import and_, desc, func, select
+from sqlalchemy import desc, func, select
 from sqlalchemy.orm import Session
 
 from server_fastapi.app.core.config import get_settings
@@ -31,8 +31,10 @@ from server_fastapi.app.models.local_center import (
     WorkItem,
 )
 from server_fastapi.app.services import storage_service
+from server_fastapi.app.services.bulk_transition import bulk_transition
 from server_fastapi.app.services.comms_service import dispatch_outbox_message, enqueue_outbox, hash_value
-from server_fastapi.app.services.local_case_service import ensure_case
+from server_fastapi.app.services.local_case_service import ensure_case, get_case
+from server_fastapi.app.services.regional_service import CAUSE_CUBE_BASE_KEY
 
 settings = get_settings()
 
@@ -134,8 +136,7 @@ def _ensure_write_session(db: Session, session_id: str) -> CitizenSession:
     return session
 
 
-def _append_local_audit(
-    db: Session,
+def _local_audit_row(
     *,
     case_id: str,
     action: str,
@@ -147,24 +148,26 @@ def _append_local_audit(
     severity: str = 'info',
     entity_type: str = 'case',
     entity_id: str | None = None,
-) -> None:
-    db.add(
-        LocalAuditEvent(
-            case_id=case_id,
-            at=_utcnow(),
-            actor_name=actor_name,
-            actor_type=actor_type,
-            action=action,
-            message=message,
-            severity=severity,
-            entity_type=entity_type,
-            entity_id=entity_id or case_id,
-            before_json=before,
-            after_json=after,
-        )
+) -> LocalAuditEvent:
+    return LocalAuditEvent(
+        case_id=case_id,
+        at=_utcnow(),
+        actor_name=actor_name,
+        actor_type=actor_type,
+        action=action,
+        message=message,
+        severity=severity,
+        entity_type=entity_type,
+        entity_id=entity_id or case_id,
+        before_json=before,
+        after_json=after,
     )
 
 
+def _append_local_audit(db: Session, **fields: Any) -> None:
+    db.add(_local_audit_row(**fields))
+
+
 def _resolve_legacy_case_context(token: str) -> dict[str, Any]:
     try:
         from server_fastapi.app.api.routes.legacy import SMS_MESSAGE_STORE
@@ -953,7 +956,7 @@ def commit_upload(
 
 def citizen_status(db: Session, *, session_id: str) -> dict[str, Any]:
     session = _load_session(db, session_id)
-    case = ensure_case(db, session.case_id)
+    case = get_case(db, session.case_id)
     open_items = db.execute(
         select(func.count()).select_from(WorkItem).where(WorkItem.case_id == case.case_id, WorkItem.status.in_(['OPEN', 'IN_PROGRESS']))
     ).scalar_one()
@@ -1002,20 +1005,15 @@ def list_case_citizen_submissions(db: Session, *, case_id: str) -> dict[str, Any
     }
 
 
-def process_pending_citizen_requests(db: Session, *, limit: int = 200) -> dict[str, int]:
+def process_pending_citizen_requests(db: Session, *, limit: int = 200) -> dict[str, Any]:
     now = _utcnow()
-    rows = db.execute(
-        select(CitizenRequest)
-        .where(and_(CitizenRequest.status == 'RECEIVED', CitizenRequest.processed_at.is_(None)))
-        .order_by(CitizenRequest.created_at.asc())
-        .limit(limit)
-    ).scalars().all()
-
-    for row in rows:
-        row.status = 'PROCESSED'
-        row.processed_at = now
-        _append_local_audit(
-            db,
+    return bulk_transition(
+        db,
+        CitizenRequest,
+        where=[CitizenRequest.status == 'RECEIVED', CitizenRequest.processed_at.is_(None)],
+        values={'status': 'PROCESSED', 'processed_at': now},
+        returning=[CitizenRequest.case_id, CitizenRequest.request_type],
+        audit=lambda row: _local_audit_row(
             case_id=row.case_id,
             action='CITIZEN_REQUEST_PROCESSED',
             message=f'Citizen request processed: {row.request_type}',
@@ -1024,21 +1022,23 @@ def process_pending_citizen_requests(db: Session, *, limit: int = 200) -> dict[s
             after={'requestId': row.id, 'type': row.request_type},
             entity_type='citizen_request',
             entity_id=row.id,
-        )
-    db.commit()
-    return {'processed': len(rows)}
+        ),
+        invalidate=[CAUSE_CUBE_BASE_KEY],
+        order_by=CitizenRequest.created_at.asc(),
+        limit=limit,
+        label='citizen request processing',
+    )
 
 
-def cleanup_expired_sessions(db: Session) -> dict[str, int]:
+def cleanup_expired_sessions(db: Session) -> dict[str, Any]:
     now = _utcnow()
-    rows = db.execute(
-        select(CitizenSession).where(CitizenSession.status.in_(['PENDING', 'ACTIVE']), CitizenSession.expires_at < now)
-    ).scalars().all()
-    for row in rows:
-        row.status = 'EXPIRED'
-        row.updated_at = now
-        _append_local_audit(
-            db,
+    result = bulk_transition(
+        db,
+        CitizenSession,
+        where=[CitizenSession.status.in_(['PENDING', 'ACTIVE']), CitizenSession.expires_at < now],
+        values={'status': 'EXPIRED', 'updated_at': now},
+        returning=[CitizenSession.case_id],
+        audit=lambda row: _local_audit_row(
             case_id=row.case_id,
             action='CITIZEN_SESSION_EXPIRED',
             message='Citizen session expired by cleanup task',
@@ -1046,6 +1046,7 @@ def cleanup_expired_sessions(db: Session) -> dict[str, int]:
             actor_type='SYSTEM',
             entity_type='citizen_session',
             entity_id=row.id,
-        )
-    db.commit()
-    return {'expired': len(rows)}
+        ),
+        label='citizen session cleanup',
+    )
+    return {'expired': result['processed'], 'batches': result['batches'], 'batchLatencyMs': result['batchLatencyMs']}
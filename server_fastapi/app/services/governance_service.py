@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Any
 
-from sqlalchemy import desc, select
+from sqlalchemy import desc, select, tuple_
 from sqlalchemy.orm import Session
 
 from server_fastapi.app.models.control import AuditEvent
 from server_fastapi.app.services.audit_service import ENTITY_TYPE_BY_CHANGE_TYPE
+from server_fastapi.app.services.keyset_pagination import decode_int_keyset_cursor, encode_keyset_cursor
 from server_fastapi.app.services.reference_data import DRIVER_ANALYSIS, POLICY_CHANGES, QUALITY_ALERTS, UNIFIED_AUDIT
 
+AUDIT_PAGE_LIMIT = 500
+
 
 def _in_range(ts: str, range_expr: str | None) -> bool:
     if not range_expr:
@@ -63,42 +67,63 @@ def get_unified_audit(event_type: str | None, severity: str | None, status: str
     return rows
 
 
+def _parse_range_expr(range_expr: str | None) -> tuple[datetime, datetime] | None:
+    if not range_expr:
+        return None
+    try:
+        start_s, end_s = range_expr.split(',', 1)
+        start = datetime.fromisoformat(start_s.strip().replace('Z', '+00:00'))
+        end = datetime.fromisoformat(end_s.strip().replace('Z', '+00:00'))
+    except Exception:
+        return None
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    return start, end
+
+
+def _page_audit_events(query: Any, range_expr: str | None, cursor: str | None, limit: int, db: Session) -> tuple[list[AuditEvent], str | None]:
+    bounds = _parse_range_expr(range_expr)
+    if bounds:
+        query = query.where(AuditEvent.ts >= bounds[0], AuditEvent.ts <= bounds[1])
+    if cursor:
+        cursor_ts, cursor_id = decode_int_keyset_cursor(cursor)
+        query = query.where(tuple_(AuditEvent.ts, AuditEvent.id) < tuple_(cursor_ts, cursor_id))
+
+    rows = db.execute(query.order_by(desc(AuditEvent.ts), desc(AuditEvent.id)).limit(limit + 1)).scalars().all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_keyset_cursor(rows[-1].ts, rows[-1].id) if has_more and rows else None
+    return rows, next_cursor
+
+
 def get_audit_events(
     db: Session,
     *,
     entity_type: str | None,
     entity_id: str | None,
     range_expr: str | None,
-) -> list[AuditEvent]:
+    cursor: str | None = None,
+    limit: int = AUDIT_PAGE_LIMIT,
+) -> tuple[list[AuditEvent], str | None]:
     query = select(AuditEvent)
     if entity_type:
         query = query.where(AuditEvent.entity_type == entity_type)
     if entity_id:
         query = query.where(AuditEvent.entity_id == entity_id)
-    query = query.order_by(desc(AuditEvent.ts)).limit(500)
-
-    rows = db.execute(query).scalars().all()
+    return _page_audit_events(query, range_expr, cursor, limit, db)
 
-    if range_expr:
-        filtered: list[AuditEvent] = []
-        for row in rows:
-            if _in_range(row.ts.isoformat(), range_expr):
-                filtered.append(row)
-        rows = filtered
-
-    return rows
 
-
-def get_audit_changes(db: Session, change_type: str | None, range_expr: str | None) -> list[AuditEvent]:
+def get_audit_changes(
+    db: Session,
+    change_type: str | None,
+    range_expr: str | None,
+    cursor: str | None = None,
+    limit: int = AUDIT_PAGE_LIMIT,
+) -> tuple[list[AuditEvent], str | None]:
     query = select(AuditEvent)
     entity_type = ENTITY_TYPE_BY_CHANGE_TYPE.get(change_type or '', None)
     if entity_type:
         query = query.where(AuditEvent.entity_type == entity_type)
-
-    query = query.order_by(desc(AuditEvent.ts)).limit(500)
-    rows = db.execute(query).scalars().all()
-
-    if range_expr:
-        rows = [row for row in rows if _in_range(row.ts.isoformat(), range_expr)]
-
-    return rows
+    return _page_audit_events(query, range_expr, cursor, limit, db)
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import base64
+from datetime import datetime
+
+from fastapi import HTTPException
+
+
+def encode_keyset_cursor(ts: datetime, key: str | int) -> str:
+    raw = f'{ts.isoformat()}|{key}'
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_keyset_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        ts_raw, key = base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8').split('|', 1)
+        return datetime.fromisoformat(ts_raw), key
+    except Exception as exc:
+        raise HTTPException(status_code=400, detail='invalid cursor') from exc
+
+
+def decode_int_keyset_cursor(cursor: str) -> tuple[datetime, int]:
+    ts, key = decode_keyset_cursor(cursor)
+    try:
+        return ts, int(key)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail='invalid cursor') from exc
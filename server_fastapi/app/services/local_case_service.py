@@ -4,14 +4,19 @@ import logging
 import hashlib
 import uuid
 from datetime import datetime, timedelta, timezone
+from collections import Counter
+from collections.abc import Callable, Iterator
+from itertools import chain
 from typing import Any
 
 from fastapi import HTTPException
-from sqlalchemy import and_, desc, func, select
+from sqlalchemy import and_, bindparam, desc, event, false, func, or_, select, tuple_, update
 from sqlalchemy.orm import Session
 
+from server_fastapi.app.db.dialect import dialect_insert
 from server_fastapi.app.models.local_center import (
     Appointment,
+    CaseOpsEvent,
     CaseStageState,
     Center,
     Contact,
@@ -19,6 +24,7 @@ from server_fastapi.app.models.local_center import (
     ContactResult,
     ExamResult,
     Followup,
+    InferenceJob,
     LocalAuditEvent,
     LocalCase,
     LocalUser,
@@ -33,10 +39,11 @@ from server_fastapi.app.schemas.local_center import (
     AuditLogResponse,
     CalendarEventCreatePayload,
     CalendarEventCreateResponse,
+    CalendarEventDraft,
     ExecuteActionBody,
+    InferenceBatchRunPayload,
     InferenceRunPayload,
     LocalCaseSummaryResponse,
-    LocalCasesListResponse,
     LocalDashboardKpiResponse,
     OpsLoopReconcileResponse,
     OutcomeSavePayload,
@@ -48,9 +55,36 @@ from server_fastapi.app.schemas.local_center import (
     WorkItemCreatePayload,
     WorkItemPatchPayload,
 )
+from server_fastapi.app.services.bulk_transition import bulk_transition
+from server_fastapi.app.services.cache_service import delete_pattern_after_commit, get_json, set_json
+from server_fastapi.app.services.case_event_recorder import record_case_events
+from server_fastapi.app.services.case_rows import CaseSummaryPage
+from server_fastapi.app.services.case_search_service import case_search_filter
+from server_fastapi.app.services.keyset_pagination import decode_int_keyset_cursor, decode_keyset_cursor, encode_keyset_cursor
+from server_fastapi.app.services.regional_service import CAUSE_CUBE_BASE_KEY
 
 logger = logging.getLogger(__name__)
 
+LOCAL_KPI_CACHE_PREFIX = 'local:kpis'
+LOCAL_KPI_CACHE_TTL_SECONDS = 30
+
+CASE_CACHE_KEY = 'local_case_cache'
+STAGE3_EVENT_LIMIT = 100
+AUDIT_PAGE_LIMIT = 200
+OPS_RECONCILE_CHUNK = 500
+DUE_SCAN_BATCH_SIZE = 500
+CALENDAR_MAX_RANGE_DAYS = 62
+CALENDAR_STREAM_BATCH_SIZE = 500
+STAGE3_PROJECTED_KEYS = ('timeline', 'audit')
+
+INFERENCE_QUEUE = 'inference'
+INFERENCE_TASK_NAME = 'server_fastapi.app.tasks.inference.run_inference_job'
+INFERENCE_BATCH_TASK_NAME = 'server_fastapi.app.tasks.inference.run_inference_batch'
+INFERENCE_BATCH_SIZE = 100
+INFERENCE_STALE_SECONDS = 600
+STAGE2_INFERENCE_CLASSES = [('NORMAL', 30), ('MCI', 55), ('AD', 82)]
+STAGE3_INFERENCE_RISKS = [15, 35, 67, 88]
+
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
@@ -342,8 +376,6 @@ def _default_case_payload(case_id: str, owner_name: str) -> dict[str, Any]:
                 }
             ],
         },
-        'audit': [],
-        'timeline': [],
         'communication': {
             'recommendedTimeSlot': '평일 14:00~16:00',
             'history': [],
@@ -357,6 +389,18 @@ def _default_case_payload(case_id: str, owner_name: str) -> dict[str, Any]:
     }
 
 
+def get_case(db: Session, case_id: str) -> LocalCase:
+    # Read-only accessor: never creates, backfills or flushes, so read routes can use a replica session.
+    cache = db.info.setdefault(CASE_CACHE_KEY, {})
+    case = cache.get(case_id)
+    if case is None:
+        case = db.get(LocalCase, case_id)
+        if case is None:
+            raise HTTPException(status_code=404, detail='case not found')
+        cache[case_id] = case
+    return case
+
+
 def ensure_case(db: Session, case_id: str) -> LocalCase:
     case = db.get(LocalCase, case_id)
     if case:
@@ -431,8 +475,7 @@ def ensure_case(db: Session, case_id: str) -> LocalCase:
     return case
 
 
-def _append_timeline(
-    db: Session,
+def _new_timeline_row(
     case_id: str,
     *,
     event_type: str,
@@ -442,7 +485,7 @@ def _append_timeline(
     actor_type: str,
     payload: dict[str, Any] | None = None,
 ) -> TimelineEvent:
-    row = TimelineEvent(
+    return TimelineEvent(
         id=_new_id('TL'),
         case_id=case_id,
         at=_utcnow(),
@@ -453,13 +496,9 @@ def _append_timeline(
         actor_type=actor_type,
         payload_json=payload,
     )
-    db.add(row)
-    db.flush()
-    return row
 
 
-def _append_audit(
-    db: Session,
+def _new_audit_row(
     case_id: str,
     *,
     action: str,
@@ -472,7 +511,7 @@ def _append_audit(
     entity_type: str = 'case',
     entity_id: str | None = None,
 ) -> LocalAuditEvent:
-    row = LocalAuditEvent(
+    return LocalAuditEvent(
         case_id=case_id,
         at=_utcnow(),
         actor_name=actor_name,
@@ -485,8 +524,59 @@ def _append_audit(
         before_json=before,
         after_json=after,
     )
-    db.add(row)
-    db.flush()
+
+
+def _append_timeline(
+    db: Session,
+    case_id: str,
+    *,
+    event_type: str,
+    title: str,
+    detail: str | None,
+    actor_name: str,
+    actor_type: str,
+    payload: dict[str, Any] | None = None,
+) -> TimelineEvent:
+    row = _new_timeline_row(
+        case_id,
+        event_type=event_type,
+        title=title,
+        detail=detail,
+        actor_name=actor_name,
+        actor_type=actor_type,
+        payload=payload,
+    )
+    record_case_events(db, row)
+    return row
+
+
+def _append_audit(
+    db: Session,
+    case_id: str,
+    *,
+    action: str,
+    message: str,
+    actor_name: str,
+    actor_type: str,
+    before: dict[str, Any] | None,
+    after: dict[str, Any] | None,
+    severity: str = 'info',
+    entity_type: str = 'case',
+    entity_id: str | None = None,
+) -> LocalAuditEvent:
+    row = _new_audit_row(
+        case_id,
+        action=action,
+        message=message,
+        actor_name=actor_name,
+        actor_type=actor_type,
+        before=before,
+        after=after,
+        severity=severity,
+        entity_type=entity_type,
+        entity_id=entity_id,
+    )
+    record_case_events(db, row)
     return row
 
 
@@ -676,6 +766,19 @@ def save_stage1_outcome(
             )
         )
 
+    if events:
+        # Same key shape the stage1 client uses, so its /api/calendar/events fallback resolves to these rows.
+        keys = [f'{case_id}:{result.id}:{draft_event["type"]}:{idx}' for idx, draft_event in enumerate(events)]
+        created = _create_calendar_events(
+            db,
+            [(key, CalendarEventDraft.model_validate(draft_event)) for key, draft_event in zip(keys, events)],
+            actor_name=actor_name,
+            actor_type=actor_type,
+        )
+        for key, draft_event in zip(keys, events):
+            draft_event['idempotencyKey'] = key
+            draft_event['eventId'] = created[key][0]
+
     _append_timeline(
         db,
         case_id,
@@ -711,6 +814,90 @@ def save_stage1_outcome(
     return OutcomeSaveResponse.model_validate(response_payload)
 
 
+def insert_schedules_idempotent(db: Session, values: list[dict[str, Any]]) -> dict[str, tuple[str, bool]]:
+    # One INSERT ... ON CONFLICT DO NOTHING; keys that already existed are resolved with a single follow-up read.
+    by_key = {value['idempotency_key']: value for value in values}
+    if not by_key:
+        return {}
+    inserted = dict(
+        db.execute(
+            dialect_insert(db, Schedule)
+            .values(list(by_key.values()))
+            .on_conflict_do_nothing(index_elements=['idempotency_key'])
+            .returning(Schedule.idempotency_key, Schedule.id)
+        ).all()
+    )
+    existing_keys = [key for key in by_key if key not in inserted]
+    existing = (
+        dict(db.execute(select(Schedule.idempotency_key, Schedule.id).where(Schedule.idempotency_key.in_(existing_keys))).all())
+        if existing_keys
+        else {}
+    )
+    result = {key: (schedule_id, True) for key, schedule_id in inserted.items()}
+    result.update({key: (schedule_id, False) for key, schedule_id in existing.items()})
+    return result
+
+
+def _create_calendar_events(
+    db: Session,
+    drafts: list[tuple[str, CalendarEventDraft]],
+    *,
+    actor_name: str,
+    actor_type: str,
+) -> dict[str, tuple[str, bool]]:
+    now = _utcnow()
+    created = insert_schedules_idempotent(
+        db,
+        [
+            {
+                'id': _new_id('CAL'),
+                'idempotency_key': key,
+                'case_id': draft.caseId,
+                'event_type': draft.type,
+                'title': draft.title,
+                'start_at': draft.startAt,
+                'duration_min': draft.durationMin,
+                'priority': draft.priority,
+                'payload_json': draft.payload,
+                'status': 'SCHEDULED',
+                'created_at': now,
+            }
+            for key, draft in drafts
+        ],
+    )
+
+    events: list[TimelineEvent | LocalAuditEvent] = []
+    for key, draft in dict(drafts).items():
+        schedule_id, is_new = created[key]
+        if not is_new:
+            continue
+        events.append(
+            _new_timeline_row(
+                draft.caseId,
+                event_type='REEVAL_SCHEDULED' if draft.type == 'RECONTACT' else 'PLAN_UPDATED',
+                title='캘린더 일정 생성',
+                detail=draft.title,
+                actor_name=actor_name,
+                actor_type=actor_type,
+                payload={'eventType': draft.type, 'startAt': draft.startAt.isoformat()},
+            )
+        )
+        events.append(
+            _new_audit_row(
+                draft.caseId,
+                action='CALENDAR_EVENT_CREATED',
+                message=f'Calendar event created: {draft.type}',
+                actor_name=actor_name,
+                actor_type=actor_type,
+                before=None,
+                after={'eventId': schedule_id, 'idempotencyKey': key},
+            )
+        )
+    if events:
+        record_case_events(db, *events)
+    return created
+
+
 def create_calendar_event(
     db: Session,
     payload: CalendarEventCreatePayload,
@@ -718,62 +905,30 @@ def create_calendar_event(
     actor_name: str = 'system',
     actor_type: str = 'system',
 ) -> CalendarEventCreateResponse:
-    case = ensure_case(db, payload.event.caseId)
-
-    existing = db.execute(
-        select(Schedule).where(Schedule.idempotency_key == payload.idempotencyKey)
-    ).scalar_one_or_none()
-    if existing:
-        return CalendarEventCreateResponse(ok=True, eventId=existing.id)
-
-    schedule = Schedule(
-        id=_new_id('CAL'),
-        idempotency_key=payload.idempotencyKey,
-        case_id=payload.event.caseId,
-        event_type=payload.event.type,
-        title=payload.event.title,
-        start_at=payload.event.startAt,
-        duration_min=payload.event.durationMin,
-        priority=payload.event.priority,
-        payload_json=payload.event.payload,
-        status='SCHEDULED',
-        created_at=_utcnow(),
-    )
-    db.add(schedule)
-
-    _append_timeline(
-        db,
-        case.case_id,
-        event_type='REEVAL_SCHEDULED' if payload.event.type == 'RECONTACT' else 'PLAN_UPDATED',
-        title='캘린더 일정 생성',
-        detail=payload.event.title,
-        actor_name=actor_name,
-        actor_type=actor_type,
-        payload={'eventType': payload.event.type, 'startAt': payload.event.startAt.isoformat()},
-    )
-
-    _append_audit(
-        db,
-        case.case_id,
-        action='CALENDAR_EVENT_CREATED',
-        message=f'Calendar event created: {payload.event.type}',
-        actor_name=actor_name,
-        actor_type=actor_type,
-        before=None,
-        after={'eventId': schedule.id, 'idempotencyKey': payload.idempotencyKey},
-    )
-
+    ensure_case(db, payload.event.caseId)
+    created = _create_calendar_events(db, [(payload.idempotencyKey, payload.event)], actor_name=actor_name, actor_type=actor_type)
     db.commit()
-    return CalendarEventCreateResponse(ok=True, eventId=schedule.id)
+    return CalendarEventCreateResponse(ok=True, eventId=created[payload.idempotencyKey][0])
 
 
-def _apply_stage3_from_db(db: Session, case: LocalCase, base: dict[str, Any]) -> dict[str, Any]:
-    timeline_rows = db.execute(
-        select(TimelineEvent).where(TimelineEvent.case_id == case.case_id).order_by(desc(TimelineEvent.at)).limit(100)
-    ).scalars().all()
-    audit_rows = db.execute(
-        select(LocalAuditEvent).where(LocalAuditEvent.case_id == case.case_id).order_by(desc(LocalAuditEvent.at)).limit(100)
-    ).scalars().all()
+def _apply_stage3_from_db(
+    db: Session,
+    case: LocalCase,
+    base: dict[str, Any],
+    *,
+    timeline_limit: int = STAGE3_EVENT_LIMIT,
+    audit_limit: int = STAGE3_EVENT_LIMIT,
+) -> dict[str, Any]:
+    timeline_rows = []
+    if timeline_limit > 0:
+        timeline_rows = db.execute(
+            select(TimelineEvent).where(TimelineEvent.case_id == case.case_id).order_by(desc(TimelineEvent.at)).limit(timeline_limit)
+        ).scalars().all()
+    audit_rows = []
+    if audit_limit > 0:
+        audit_rows = db.execute(
+            select(LocalAuditEvent).where(LocalAuditEvent.case_id == case.case_id).order_by(desc(LocalAuditEvent.at)).limit(audit_limit)
+        ).scalars().all()
 
     base['timeline'] = [
         {
@@ -808,17 +963,23 @@ def _apply_stage3_from_db(db: Session, case: LocalCase, base: dict[str, Any]) ->
     return base
 
 
-def get_stage3_case(db: Session, case_id: str) -> dict[str, Any]:
-    case = ensure_case(db, case_id)
+def _stage3_stored_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    # Timeline and audit are projected from their tables on read; raw_json never caches them.
+    return {key: value for key, value in payload.items() if key not in STAGE3_PROJECTED_KEYS}
 
-    payload = case.raw_json if case.raw_json else _default_case_payload(case_id, '담당상담사')
-    payload = dict(payload)
 
-    payload = _apply_stage3_from_db(db, case, payload)
-    case.raw_json = payload
-    case.updated_at = _utcnow()
-    db.commit()
-    return payload
+def get_stage3_case(
+    db: Session,
+    case_id: str,
+    *,
+    timeline_limit: int = STAGE3_EVENT_LIMIT,
+    audit_limit: int = STAGE3_EVENT_LIMIT,
+) -> dict[str, Any]:
+    case = get_case(db, case_id)
+
+    payload = case.raw_json if case.raw_json else _default_case_payload(case_id, '담당상담사')
+    payload = _stage3_stored_payload(payload)
+    return _apply_stage3_from_db(db, case, payload, timeline_limit=timeline_limit, audit_limit=audit_limit)
 
 
 def _derive_zone(metrics: dict[str, Any]) -> str:
@@ -850,7 +1011,7 @@ def execute_stage3_action(
     actor_name: str = '사용자',
 ) -> dict[str, Any]:
     case = ensure_case(db, case_id)
-    stage3 = get_stage3_case(db, case_id)
+    stage3 = get_stage3_case(db, case_id, timeline_limit=0, audit_limit=0)
 
     before_status = {'status': stage3.get('status'), 'operationalStatus': stage3.get('operationalStatus')}
 
@@ -940,7 +1101,7 @@ def execute_stage3_action(
         severity='warn' if body.actionType == 'request_support' else 'info',
     )
 
-    case.raw_json = stage3
+    case.raw_json = _stage3_stored_payload(stage3)
     case.status = stage3.get('status', case.status)
     case.operational_status = stage3.get('operationalStatus', case.operational_status)
     case.metrics_json = stage3.get('metrics', case.metrics_json)
@@ -982,6 +1143,36 @@ def _to_case_summary(case: LocalCase) -> LocalCaseSummaryResponse:
     )
 
 
+def _case_insensitive_values(value: str) -> list[str]:
+    # Stored codes are upper case; matching on a small value set keeps the indexes usable.
+    return list(dict.fromkeys([value, value.upper(), value.lower()]))
+
+
+def _local_case_filters(
+    *,
+    stage: str | None,
+    alert: str | None,
+    owner_type: str | None,
+    priority_tier: str | None,
+    status: str | None,
+) -> list[Any]:
+    filters: list[Any] = []
+    if stage:
+        stage_value = stage.upper().replace('STAGE', '')
+        if not stage_value.isdigit():
+            return [false()]
+        filters.append(LocalCase.stage == int(stage_value))
+    if alert:
+        filters.append(LocalCase.alert_level.in_(_case_insensitive_values(alert)))
+    if owner_type:
+        filters.append(LocalCase.owner_type.in_(_case_insensitive_values(owner_type)))
+    if priority_tier:
+        filters.append(LocalCase.priority_tier.in_(_case_insensitive_values(priority_tier)))
+    if status:
+        filters.append(LocalCase.status.in_(_case_insensitive_values(status)))
+    return filters
+
+
 def list_local_cases(
     db: Session,
     *,
@@ -993,107 +1184,165 @@ def list_local_cases(
     status: str | None,
     page: int,
     size: int,
-) -> LocalCasesListResponse:
-    rows = db.execute(select(LocalCase).order_by(desc(LocalCase.updated_at))).scalars().all()
-
-    def _match(row: LocalCase) -> bool:
-        if stage and str(row.stage) != stage.replace('STAGE', ''):
-            return False
-        if alert and (row.alert_level or '').lower() != alert.lower():
-            return False
-        if owner_type and (row.owner_type or '').lower() != owner_type.lower():
-            return False
-        if priority_tier and (row.priority_tier or '').lower() != priority_tier.lower():
-            return False
-        if status and (row.status or '').lower() != status.lower():
-            return False
-        if q:
-            ql = q.lower()
-            name = str((row.subject_json or {}).get('maskedName', '')).lower()
-            if ql not in row.case_id.lower() and ql not in name:
-                return False
-        return True
-
-    filtered = [row for row in rows if _match(row)]
-    total = len(filtered)
-    start = (page - 1) * size
-    items = filtered[start : start + size]
-
-    return LocalCasesListResponse(
-        total=total,
-        page=page,
-        size=size,
-        items=[_to_case_summary(item) for item in items],
+    cursor: str | None = None,
+) -> CaseSummaryPage:
+    filters = _local_case_filters(
+        stage=stage,
+        alert=alert,
+        owner_type=owner_type,
+        priority_tier=priority_tier,
+        status=status,
+    )
+    search = case_search_filter(db, q)
+    if search is not None:
+        filters.append(search)
+    total = db.execute(select(func.count()).select_from(LocalCase).where(*filters)).scalar_one()
+
+    next_action_at = LocalCase.raw_json[('headerMeta', 'next_reval_at')].as_string()
+    query = (
+        select(
+            LocalCase.case_id,
+            LocalCase.stage,
+            LocalCase.status,
+            LocalCase.operational_status,
+            LocalCase.owner_id,
+            LocalCase.alert_level,
+            LocalCase.priority_tier,
+            next_action_at.label('next_action_at'),
+            LocalCase.updated_at,
+        )
+        .where(*filters)
+        .order_by(desc(LocalCase.updated_at), desc(LocalCase.case_id))
+        .limit(size + 1)
     )
+    if cursor:
+        cursor_updated_at, cursor_case_id = decode_keyset_cursor(cursor)
+        query = query.where(tuple_(LocalCase.updated_at, LocalCase.case_id) < tuple_(cursor_updated_at, cursor_case_id))
+    else:
+        query = query.offset((page - 1) * size)
+
+    rows = db.execute(query).all()
+    has_more = len(rows) > size
+    rows = rows[:size]
+    next_cursor = encode_keyset_cursor(rows[-1].updated_at, rows[-1].case_id) if has_more and rows else None
+
+    return CaseSummaryPage(int(total or 0), page, size, rows, next_cursor)
 
 
 def get_case_summary(db: Session, case_id: str) -> LocalCaseSummaryResponse:
-    case = ensure_case(db, case_id)
+    case = get_case(db, case_id)
     return _to_case_summary(case)
 
 
-def get_local_dashboard_kpis(db: Session) -> LocalDashboardKpiResponse:
-    cases = db.execute(select(LocalCase)).scalars().all()
+def _local_kpi_cache_key(center_id: str | None) -> str:
+    return f'{LOCAL_KPI_CACHE_PREFIX}:{center_id or "all"}'
 
-    stage1_open = sum(1 for case in cases if case.stage == 1 and case.status not in {'CLOSED_REFUSED'})
-    stage2_pending_exam = sum(1 for case in cases if case.stage >= 2 and case.status in {'WAITING_EXAM', 'EXAM_RESULT_PENDING'})
-    stage3_tracking = sum(1 for case in cases if case.stage >= 3 and case.operational_status in {'TRACKING', 'REEVAL_DUE', 'LINKAGE_PENDING'})
-    churn_risk_high = sum(
-        1
-        for case in cases
-        if ((case.raw_json or {}).get('headerMeta') or {}).get('churn_risk') == 'HIGH'
-    )
 
-    overdue_schedules = db.execute(
-        select(func.count()).select_from(Schedule).where(Schedule.status == 'SCHEDULED', Schedule.start_at < _utcnow())
-    ).scalar_one()
-    open_work_items = db.execute(
-        select(func.count()).select_from(WorkItem).where(WorkItem.status.in_(['OPEN', 'IN_PROGRESS']))
-    ).scalar_one()
+@event.listens_for(Session, 'after_flush')
+def _track_local_kpi_sources(session: Session, flush_context: Any) -> None:
+    changed = [obj for obj in chain(session.new, session.dirty, session.deleted) if isinstance(obj, (LocalCase, Schedule, WorkItem))]
+    if not changed:
+        return
+    delete_pattern_after_commit(session, _local_kpi_cache_key(None))
+    if any(not isinstance(obj, LocalCase) for obj in changed):
+        delete_pattern_after_commit(session, f'{LOCAL_KPI_CACHE_PREFIX}:*')
+        return
+    for obj in changed:
+        delete_pattern_after_commit(session, _local_kpi_cache_key(obj.center_id))
 
-    return LocalDashboardKpiResponse(
-        stage1Open=int(stage1_open),
-        stage2PendingExam=int(stage2_pending_exam),
-        stage3Tracking=int(stage3_tracking),
-        overdueSchedules=int(overdue_schedules or 0),
-        openWorkItems=int(open_work_items or 0),
-        churnRiskHigh=int(churn_risk_high),
-    )
 
+def get_local_dashboard_kpis(db: Session, center_id: str | None = None) -> LocalDashboardKpiResponse:
+    cache_key = _local_kpi_cache_key(center_id)
+    cached = get_json(cache_key)
+    if isinstance(cached, dict):
+        return LocalDashboardKpiResponse(**cached)
 
-def list_calendar_events(db: Session, *, from_at: datetime | None, to_at: datetime | None, assignee: str | None) -> list[dict[str, Any]]:
-    query = select(Schedule)
-    if from_at:
-        query = query.where(Schedule.start_at >= from_at)
-    if to_at:
-        query = query.where(Schedule.start_at <= to_at)
+    now = _utcnow()
+    case_scope = [LocalCase.center_id == center_id] if center_id else []
+    scoped_case_ids = select(LocalCase.case_id).where(*case_scope)
+    overdue_schedules = select(func.count()).select_from(Schedule).where(Schedule.status == 'SCHEDULED', Schedule.start_at < now)
+    open_work_items = select(func.count()).select_from(WorkItem).where(WorkItem.status.in_(['OPEN', 'IN_PROGRESS']))
+    if center_id:
+        overdue_schedules = overdue_schedules.where(Schedule.case_id.in_(scoped_case_ids))
+        open_work_items = open_work_items.where(WorkItem.case_id.in_(scoped_case_ids))
+
+    row = db.execute(
+        select(
+            func.count().filter(LocalCase.stage == 1, LocalCase.status != 'CLOSED_REFUSED').label('stage1_open'),
+            func.count()
+            .filter(LocalCase.stage >= 2, LocalCase.status.in_(['WAITING_EXAM', 'EXAM_RESULT_PENDING']))
+            .label('stage2_pending_exam'),
+            func.count()
+            .filter(LocalCase.stage >= 3, LocalCase.operational_status.in_(['TRACKING', 'REEVAL_DUE', 'LINKAGE_PENDING']))
+            .label('stage3_tracking'),
+            func.count().filter(LocalCase.churn_risk == 'HIGH').label('churn_risk_high'),
+            overdue_schedules.scalar_subquery().label('overdue_schedules'),
+            open_work_items.scalar_subquery().label('open_work_items'),
+        )
+        .select_from(LocalCase)
+        .where(*case_scope)
+    ).one()
+
+    response = LocalDashboardKpiResponse(
+        stage1Open=int(row.stage1_open or 0),
+        stage2PendingExam=int(row.stage2_pending_exam or 0),
+        stage3Tracking=int(row.stage3_tracking or 0),
+        overdueSchedules=int(row.overdue_schedules or 0),
+        openWorkItems=int(row.open_work_items or 0),
+        churnRiskHigh=int(row.churn_risk_high or 0),
+    )
+    set_json(cache_key, response.model_dump(), LOCAL_KPI_CACHE_TTL_SECONDS)
+    return response
+
+
+def calendar_range(from_at: datetime, to_at: datetime) -> tuple[datetime, datetime]:
+    # Query strings may carry an offset or not; compare both bounds as UTC-aware values.
+    from_at, to_at = _aware(from_at), _aware(to_at)
+    if to_at < from_at:
+        raise HTTPException(status_code=400, detail='to must not be earlier than from')
+    if to_at - from_at > timedelta(days=CALENDAR_MAX_RANGE_DAYS):
+        raise HTTPException(status_code=400, detail=f'calendar range must not exceed {CALENDAR_MAX_RANGE_DAYS} days')
+    return from_at, to_at
+
+
+def iter_calendar_events(db: Session, *, from_at: datetime, to_at: datetime, assignee: str | None) -> Iterator[dict[str, Any]]:
+    query = select(
+        Schedule.id,
+        Schedule.case_id,
+        Schedule.event_type,
+        Schedule.title,
+        Schedule.start_at,
+        Schedule.duration_min,
+        Schedule.priority,
+        Schedule.status,
+        Schedule.payload_json,
+    ).where(Schedule.start_at >= from_at, Schedule.start_at <= to_at)
     if assignee:
         query = query.where(Schedule.assignee_id == assignee)
 
-    rows = db.execute(query.order_by(Schedule.start_at.asc())).scalars().all()
-    events: list[dict[str, Any]] = []
+    rows = db.execute(
+        query.order_by(Schedule.start_at.asc(), Schedule.id.asc()).execution_options(yield_per=CALENDAR_STREAM_BATCH_SIZE)
+    )
     for row in rows:
         try:
             start_at = row.start_at
             if start_at is None:
                 raise ValueError('start_at is null')
-            payload = row.payload_json if isinstance(row.payload_json, dict) else {}
-            events.append(
-                {
-                    'eventId': row.id,
-                    'caseId': row.case_id,
-                    'type': row.event_type,
-                    'title': row.title,
-                    'startAt': start_at.isoformat() if isinstance(start_at, datetime) else str(start_at),
-                    'durationMin': row.duration_min,
-                    'priority': row.priority,
-                    'status': row.status,
-                    'payload': payload,
-                }
-            )
+            item = {
+                'eventId': row.id,
+                'caseId': row.case_id,
+                'type': row.event_type,
+                'title': row.title,
+                'startAt': start_at.isoformat() if isinstance(start_at, datetime) else str(start_at),
+                'durationMin': row.duration_min,
+                'priority': row.priority,
+                'status': row.status,
+                'payload': row.payload_json if isinstance(row.payload_json, dict) else {},
+            }
         except Exception:
             logger.exception('Calendar event serialization failed for schedule id=%s', getattr(row, 'id', 'unknown'))
-    return events
+            continue
+        yield item
 
 
 def create_work_item(db: Session, payload: WorkItemCreatePayload, actor_name: str = 'system') -> dict[str, Any]:
@@ -1200,7 +1449,9 @@ def list_audit_events(
     case_id: str | None,
     from_at: datetime | None,
     to_at: datetime | None,
-) -> list[AuditLogResponse]:
+    cursor: str | None = None,
+    limit: int = AUDIT_PAGE_LIMIT,
+) -> tuple[list[AuditLogResponse], str | None]:
     query = select(LocalAuditEvent)
     if case_id:
         query = query.where(LocalAuditEvent.case_id == case_id)
@@ -1208,9 +1459,15 @@ def list_audit_events(
         query = query.where(LocalAuditEvent.at >= from_at)
     if to_at:
         query = query.where(LocalAuditEvent.at <= to_at)
-
-    rows = db.execute(query.order_by(desc(LocalAuditEvent.at)).limit(500)).scalars().all()
-    return [
+    if cursor:
+        cursor_at, cursor_id = decode_int_keyset_cursor(cursor)
+        query = query.where(tuple_(LocalAuditEvent.at, LocalAuditEvent.id) < tuple_(cursor_at, cursor_id))
+
+    rows = db.execute(query.order_by(desc(LocalAuditEvent.at), desc(LocalAuditEvent.id)).limit(limit + 1)).scalars().all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_keyset_cursor(rows[-1].at, rows[-1].id) if has_more and rows else None
+    items = [
         AuditLogResponse(
             id=row.id,
             caseId=row.case_id,
@@ -1224,6 +1481,7 @@ def list_audit_events(
         )
         for row in rows
     ]
+    return items, next_cursor
 
 
 def get_stage2_step2_autofill(db: Session, case_id: str, actor_name: str = 'system') -> dict[str, Any]:
@@ -1615,33 +1873,15 @@ def _ops_step_state(*, done: bool, ready: bool, done_reason: str, ready_reason:
     return {'status': 'TODO', 'reason': todo_reason}
 
 
-def _map_timeline_to_ops_events(rows: list[TimelineEvent]) -> set[str]:
-    mapped: set[str] = set()
-    for row in rows:
-        event_type = (row.event_type or '').upper()
-        title = (row.title or '').upper()
-        detail = (row.detail or '').upper()
-        blob = f'{event_type} {title} {detail}'
-
-        if 'PLAN' in blob or '계획' in blob:
-            mapped.add('PLAN_CONFIRMED')
-        if 'RESULT' in blob or '결과' in blob:
-            mapped.add('RESULT_RECEIVED')
-        if 'VALID' in blob or '검증' in blob or '확정' in blob:
-            mapped.add('RESULT_VALIDATED')
-        if 'INFERENCE_REQUESTED' in blob or '모델 실행 요청' in blob:
-            mapped.add('INFERENCE_REQUESTED')
-        if 'INFERENCE_STARTED' in blob or '모델 실행 시작' in blob:
-            mapped.add('INFERENCE_STARTED')
-        if 'INFERENCE_COMPLETED' in blob or '모델 실행 완료' in blob:
-            mapped.add('INFERENCE_COMPLETED')
-        if 'CLASS' in blob or '분류' in blob:
-            mapped.add('CLASSIFICATION_CONFIRMED')
-        if 'NEXT STEP' in blob or '다음 단계' in blob:
-            mapped.add('NEXT_STEP_DECIDED')
-        if 'REFERRAL' in blob or '의뢰' in blob or '예약' in blob:
-            mapped.add('REFERRAL_CONFIRMED')
-
+def _case_ops_events(db: Session, case_ids: list[str]) -> dict[str, set[str]]:
+    mapped: dict[str, set[str]] = {case_id: set() for case_id in case_ids}
+    for offset in range(0, len(case_ids), OPS_RECONCILE_CHUNK):
+        chunk = case_ids[offset : offset + OPS_RECONCILE_CHUNK]
+        rows = db.execute(
+            select(CaseOpsEvent.case_id, CaseOpsEvent.ops_event).where(CaseOpsEvent.case_id.in_(chunk))
+        ).all()
+        for case_id, ops_event in rows:
+            mapped[case_id].add(ops_event)
     return mapped
 
 
@@ -1727,14 +1967,9 @@ def _compute_ops_loop(stage: int, mapped_events: set[str], raw: dict[str, Any])
     }
 
 
-def reconcile_case_ops_loop(db: Session, case_id: str, actor_name: str = 'system') -> OpsLoopReconcileResponse:
-    case = ensure_case(db, case_id)
-    timeline_rows = db.execute(
-        select(TimelineEvent).where(TimelineEvent.case_id == case_id).order_by(desc(TimelineEvent.at)).limit(300)
-    ).scalars().all()
-
+def _apply_ops_loop(db: Session, case: LocalCase, mapped_events: set[str], actor_name: str, now: datetime) -> dict[str, Any]:
     raw = dict(case.raw_json or {})
-    computed = _compute_ops_loop(case.stage, _map_timeline_to_ops_events(timeline_rows), raw)
+    computed = _compute_ops_loop(case.stage, mapped_events, raw)
     raw['opsLoop'] = computed
     state = _ensure_case_state(raw, case.stage)
     if case.stage == 2:
@@ -1749,17 +1984,23 @@ def reconcile_case_ops_loop(db: Session, case_id: str, actor_name: str = 'system
             state['operationStep'] = 'IN_PROGRESS'
 
     case.raw_json = raw
-    case.updated_at = _utcnow()
+    case.updated_at = now
     _append_audit(
         db,
-        case_id,
+        case.case_id,
         action='OPS_LOOP_RECONCILED',
         message='Ops loop state reconciled from timeline events',
         actor_name=actor_name,
-        actor_type='human',
+        actor_type='human' if actor_name != 'system' else 'system',
         before=None,
         after={'doneCount': computed['doneCount'], 'readyCount': computed['readyCount']},
     )
+    return computed
+
+
+def reconcile_case_ops_loop(db: Session, case_id: str, actor_name: str = 'system') -> OpsLoopReconcileResponse:
+    case = ensure_case(db, case_id)
+    computed = _apply_ops_loop(db, case, _case_ops_events(db, [case_id])[case_id], actor_name, _utcnow())
     db.commit()
     return OpsLoopReconcileResponse(
         caseId=case_id,
@@ -1773,46 +2014,84 @@ def reconcile_case_ops_loop(db: Session, case_id: str, actor_name: str = 'system
     )
 
 
+def reconcile_center_ops_loops(db: Session, center_id: str, actor_name: str = 'system') -> dict[str, Any]:
+    cases = db.execute(select(LocalCase).where(LocalCase.center_id == center_id).order_by(LocalCase.case_id)).scalars().all()
+    mapped = _case_ops_events(db, [case.case_id for case in cases])
+    now = _utcnow()
+    mismatched = 0
+    for case in cases:
+        computed = _apply_ops_loop(db, case, mapped[case.case_id], actor_name, now)
+        mismatched += int(computed['mismatch'])
+    db.commit()
+    return {'centerId': center_id, 'reconciledCases': len(cases), 'mismatchedCases': mismatched}
+
+
 def _duration_by_case(case_id: str, stage: int) -> int:
     base = 30 + (sum(ord(ch) for ch in f'{case_id}:{stage}') % 150)
     return max(30, min(base, 180))
 
 
-def _find_case_with_job(db: Session, job_id: str) -> tuple[LocalCase | None, dict[str, Any], dict[str, Any] | None]:
-    rows = db.execute(select(LocalCase).order_by(desc(LocalCase.updated_at)).limit(1000)).scalars().all()
-    for case in rows:
-        raw = dict(case.raw_json or {})
-        jobs = raw.get('inferenceJobs')
-        if isinstance(jobs, dict) and isinstance(jobs.get(job_id), dict):
-            return case, raw, jobs[job_id]
-    return None, {}, None
+def _aware(value: datetime | None) -> datetime | None:
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
 
+def _iso_or_none(value: datetime | None) -> str | None:
+    value = _aware(value)
+    return value.isoformat() if value else None
 
-def _apply_inference_completion(db: Session, case: LocalCase, raw: dict[str, Any], job: dict[str, Any], actor_name: str) -> None:
+
+def _inference_job_payload(job: InferenceJob) -> dict[str, Any]:
+    return {
+        'jobId': job.job_id,
+        'caseId': job.case_id,
+        'stage': int(job.stage),
+        'status': job.status,
+        'progress': int(job.progress or 0),
+        'etaSeconds': job.eta_seconds,
+        'startedAt': _iso_or_none(job.started_at),
+        'updatedAt': _iso_or_none(job.updated_at),
+        'completedAt': _iso_or_none(job.completed_at),
+    }
+
+
+def _score_inference_batch(items: list[tuple[str, int]]) -> list[dict[str, Any]]:
+    # One model invocation per batch; inputs and outputs stay index-aligned.
+    if not items:
+        return []
+    keys = [sum(ord(ch) for ch in case_id) for case_id, _ in items]
+    results: list[dict[str, Any]] = []
+    for key, (_, stage) in zip(keys, items):
+        if stage == 2:
+            classification, risk_score = STAGE2_INFERENCE_CLASSES[key % len(STAGE2_INFERENCE_CLASSES)]
+            results.append({'classification': classification, 'riskScore': risk_score})
+        else:
+            results.append({'riskScore': STAGE3_INFERENCE_RISKS[key % len(STAGE3_INFERENCE_RISKS)]})
+    return results
+
+
+def _apply_inference_completion(
+    db: Session,
+    case: LocalCase,
+    raw: dict[str, Any],
+    job: InferenceJob,
+    result: dict[str, Any],
+    actor_name: str,
+) -> None:
     state = _ensure_case_state(raw, case.stage)
-    stage = int(job.get('stage') or case.stage)
+    stage = int(job.stage or case.stage)
     now_iso = _utcnow().isoformat()
 
     if stage == 2:
-        bucket = sum(ord(ch) for ch in case.case_id) % 3
-        if bucket == 0:
-            classification = 'NORMAL'
-            risk_score = 30
-        elif bucket == 1:
-            classification = 'MCI'
-            risk_score = 55
-        else:
-            classification = 'AD'
-            risk_score = 82
-
         state.update(
             {
                 'stage': max(case.stage, 2),
                 'modelStatus': 'DONE',
                 'operationStep': 'RESULT_READY',
-                'classification': classification,
-                'riskScore': risk_score,
-                'modelVersion': job.get('modelVersion') or 's2-v2',
+                'classification': result.get('classification'),
+                'riskScore': result.get('riskScore'),
+                'modelVersion': job.model_version or 's2-v2',
                 'modelUpdatedAt': now_iso,
             }
         )
@@ -1830,21 +2109,19 @@ def _apply_inference_completion(db: Session, case: LocalCase, raw: dict[str, Any
                 priority='P1',
                 assignee_id=case.owner_id,
                 due_at=_utcnow() + timedelta(days=1),
-                payload_json={'jobId': job.get('jobId'), 'stage': 2},
+                payload_json={'jobId': job.job_id, 'stage': 2},
                 created_at=_utcnow(),
                 updated_at=_utcnow(),
             )
         )
     else:
-        risk_options = [15, 35, 67, 88]
-        risk_score = risk_options[sum(ord(ch) for ch in case.case_id) % len(risk_options)]
         state.update(
             {
                 'stage': max(case.stage, 3),
                 'modelStatus': 'DONE',
                 'operationStep': 'FOLLOW_UP',
-                'riskScore': risk_score,
-                'modelVersion': job.get('modelVersion') or 's3-v2',
+                'riskScore': result.get('riskScore'),
+                'modelVersion': job.model_version or 's3-v2',
                 'modelUpdatedAt': now_iso,
             }
         )
@@ -1862,7 +2139,7 @@ def _apply_inference_completion(db: Session, case: LocalCase, raw: dict[str, Any
                 priority='P1',
                 assignee_id=case.owner_id,
                 due_at=_utcnow() + timedelta(days=2),
-                payload_json={'jobId': job.get('jobId'), 'stage': 3},
+                payload_json={'jobId': job.job_id, 'stage': 3},
                 created_at=_utcnow(),
                 updated_at=_utcnow(),
             )
@@ -1873,10 +2150,10 @@ def _apply_inference_completion(db: Session, case: LocalCase, raw: dict[str, Any
         case.case_id,
         event_type='INFERENCE_COMPLETED',
         title=f'Stage{stage} 모델 실행 완료',
-        detail=f'job={job.get("jobId")} model={job.get("modelVersion") or "-"}',
+        detail=f'job={job.job_id} model={job.model_version or "-"}',
         actor_name=actor_name,
         actor_type='system',
-        payload={'jobId': job.get('jobId'), 'stage': stage},
+        payload={'jobId': job.job_id, 'stage': stage},
     )
     _append_timeline(
         db,
@@ -1886,7 +2163,7 @@ def _apply_inference_completion(db: Session, case: LocalCase, raw: dict[str, Any
         detail=f'stage={stage}',
         actor_name=actor_name,
         actor_type='system',
-        payload={'jobId': job.get('jobId'), 'stage': stage},
+        payload={'jobId': job.job_id, 'stage': stage},
     )
     _append_audit(
         db,
@@ -1896,10 +2173,70 @@ def _apply_inference_completion(db: Session, case: LocalCase, raw: dict[str, Any
         actor_name=actor_name,
         actor_type='system',
         before=None,
-        after={'jobId': job.get('jobId'), 'stage': stage, 'operationStep': state.get('operationStep')},
+        after={'jobId': job.job_id, 'stage': stage, 'operationStep': state.get('operationStep')},
     )
 
 
+def _queue_inference_job(
+    case: LocalCase,
+    *,
+    stage: int,
+    model_version: str | None,
+    actor_name: str,
+    now: datetime,
+) -> tuple[InferenceJob, list[TimelineEvent | LocalAuditEvent]]:
+    job_id = _new_id('INF')
+    duration_sec = _duration_by_case(case.case_id, stage)
+    job = InferenceJob(
+        job_id=job_id,
+        case_id=case.case_id,
+        stage=int(stage),
+        status='PENDING',
+        progress=0,
+        eta_seconds=duration_sec,
+        duration_sec=duration_sec,
+        model_version=model_version or (f's{stage}-v2'),
+        requested_at=now,
+        updated_at=now,
+    )
+
+    raw = dict(case.raw_json or {})
+    state = _ensure_case_state(raw, case.stage)
+    state['modelStatus'] = 'PROCESSING'
+    if stage == 2:
+        case.stage = max(case.stage, 2)
+        case.status = 'WAITING_RESULTS'
+    else:
+        case.stage = max(case.stage, 3)
+        case.status = 'in_progress'
+        case.operational_status = 'TRACKING'
+    state['stage'] = case.stage
+    case.raw_json = raw
+    case.updated_at = now
+
+    events = [
+        _new_timeline_row(
+            case.case_id,
+            event_type='INFERENCE_REQUESTED',
+            title=f'Stage{stage} 모델 실행 요청',
+            detail=f'job={job_id}',
+            actor_name=actor_name,
+            actor_type='human',
+            payload={'jobId': job_id, 'stage': stage},
+        ),
+        _new_audit_row(
+            case.case_id,
+            action='INFERENCE_RUN_QUEUED',
+            message=f'Stage{stage} inference queued',
+            actor_name=actor_name,
+            actor_type='human',
+            before=None,
+            after={'jobId': job_id, 'stage': stage, 'durationSec': duration_sec},
+        ),
+    ]
+    return job, events
+
+
 def run_case_inference(db: Session, case_id: str, payload: InferenceRunPayload, actor_name: str = 'system') -> dict[str, Any]:
     case = ensure_case(db, case_id)
     valid_exam = db.execute(
@@ -1921,180 +2258,359 @@ def run_case_inference(db: Session, case_id: str, payload: InferenceRunPayload,
         if not stage2_run:
             raise HTTPException(status_code=409, detail={'code': 'STAGE2_REQUIRED', 'message': 'Stage3 실행 전 Stage2 모델 실행이 필요합니다.'})
 
-    raw = dict(case.raw_json or {})
-    jobs = raw.get('inferenceJobs')
-    if not isinstance(jobs, dict):
-        jobs = {}
-    job_id = _new_id('INF')
-    now = _utcnow()
-    duration_sec = _duration_by_case(case_id, payload.stage)
-
-    job = {
-        'jobId': job_id,
-        'caseId': case_id,
-        'stage': int(payload.stage),
-        'status': 'RUNNING',
-        'progress': 2,
-        'etaSeconds': duration_sec,
-        'durationSec': duration_sec,
-        'requestedAt': now.isoformat(),
-        'startedAt': now.isoformat(),
-        'updatedAt': now.isoformat(),
-        'completedAt': None,
-        'modelVersion': payload.modelVersion or (f's{payload.stage}-v2'),
-    }
-    jobs[job_id] = job
-    raw['inferenceJobs'] = jobs
-    state = _ensure_case_state(raw, case.stage)
-    state['modelStatus'] = 'PROCESSING'
-    if payload.stage == 2:
-        case.stage = max(case.stage, 2)
-        case.status = 'WAITING_RESULTS'
-    else:
-        case.stage = max(case.stage, 3)
-        case.status = 'in_progress'
-        case.operational_status = 'TRACKING'
-    state['stage'] = case.stage
-    case.raw_json = raw
-    case.updated_at = now
-
-    _append_timeline(
-        db,
-        case_id,
-        event_type='INFERENCE_REQUESTED',
-        title=f'Stage{payload.stage} 모델 실행 요청',
-        detail=f'job={job_id}',
+    job, events = _queue_inference_job(
+        case,
+        stage=int(payload.stage),
+        model_version=payload.modelVersion,
         actor_name=actor_name,
-        actor_type='human',
-        payload={'jobId': job_id, 'stage': payload.stage},
+        now=_utcnow(),
     )
-    _append_timeline(
-        db,
-        case_id,
-        event_type='INFERENCE_STARTED',
-        title=f'Stage{payload.stage} 모델 실행 시작',
-        detail=f'job={job_id}',
-        actor_name=actor_name,
-        actor_type='system',
-        payload={'jobId': job_id, 'stage': payload.stage},
-    )
-    _append_audit(
-        db,
-        case_id,
-        action='INFERENCE_RUN_STARTED',
-        message=f'Stage{payload.stage} inference started',
-        actor_name=actor_name,
-        actor_type='human',
-        before=None,
-        after={'jobId': job_id, 'stage': payload.stage, 'durationSec': duration_sec},
+    db.add(job)
+    record_case_events(db, *events)
+    db.commit()
+    _enqueue_inference_jobs([job.job_id])
+    return _inference_job_payload(job)
+
+
+def run_case_inference_batch(db: Session, payload: InferenceBatchRunPayload, actor_name: str = 'system') -> dict[str, Any]:
+    stage = int(payload.stage)
+    case_ids = list(dict.fromkeys(payload.caseIds))
+
+    cases = {
+        case.case_id: case
+        for case in db.execute(select(LocalCase).where(LocalCase.case_id.in_(case_ids))).scalars()
+    }
+    with_valid_exam = set(
+        db.execute(
+            select(ExamResult.case_id).where(ExamResult.case_id.in_(case_ids), ExamResult.status == 'valid').distinct()
+        ).scalars()
     )
+    with_stage2_run = set()
+    if stage == 3:
+        with_stage2_run = set(
+            db.execute(select(Stage2ModelRun.case_id).where(Stage2ModelRun.case_id.in_(case_ids)).distinct()).scalars()
+        )
+
+    now = _utcnow()
+    jobs: list[InferenceJob] = []
+    rejected: list[dict[str, str]] = []
+    for case_id in case_ids:
+        case = cases.get(case_id)
+        if case is None:
+            rejected.append({'caseId': case_id, 'code': 'CASE_NOT_FOUND', 'message': '케이스를 찾을 수 없습니다.'})
+            continue
+        if case_id not in with_valid_exam:
+            rejected.append(
+                {'caseId': case_id, 'code': 'EXAM_RESULT_REQUIRED', 'message': '검사결과(valid)가 있어야 모델 실행이 가능합니다.'}
+            )
+            continue
+        if stage == 3 and case_id not in with_stage2_run:
+            rejected.append({'caseId': case_id, 'code': 'STAGE2_REQUIRED', 'message': 'Stage3 실행 전 Stage2 모델 실행이 필요합니다.'})
+            continue
+        job, events = _queue_inference_job(
+            case,
+            stage=stage,
+            model_version=payload.modelVersion,
+            actor_name=actor_name,
+            now=now,
+        )
+        jobs.append(job)
+        record_case_events(db, *events)
+
+    if jobs:
+        db.add_all(jobs)
+        db.commit()
+        _enqueue_inference_jobs([job.job_id for job in jobs])
 
-    db.commit()
     return {
-        'jobId': job_id,
-        'caseId': case_id,
-        'stage': int(payload.stage),
-        'status': 'RUNNING',
-        'progress': 2,
-        'etaSeconds': duration_sec,
-        'startedAt': now.isoformat(),
-        'updatedAt': now.isoformat(),
-        'completedAt': None,
+        'jobs': [_inference_job_payload(job) for job in jobs],
+        'rejected': rejected,
     }
 
 
-def get_inference_job(db: Session, job_id: str, actor_name: str = 'system') -> dict[str, Any]:
-    case, raw, job = _find_case_with_job(db, job_id)
-    if not case or not job:
+def get_inference_job(db: Session, job_id: str) -> dict[str, Any]:
+    job = db.get(InferenceJob, job_id)
+    if not job:
         raise HTTPException(status_code=404, detail='inference job not found')
+    return _inference_job_payload(job)
 
-    now = _utcnow()
-    status = str(job.get('status') or 'PENDING')
-    if status in {'PENDING', 'RUNNING'}:
-        started_at_raw = job.get('startedAt')
-        try:
-            started_at = datetime.fromisoformat(started_at_raw) if isinstance(started_at_raw, str) else now
-        except ValueError:
-            started_at = now
-        duration_sec = int(job.get('durationSec') or 60)
-        elapsed = max(0, int((now - started_at).total_seconds()))
-        if elapsed >= duration_sec:
-            status = 'DONE'
-            job['status'] = 'DONE'
-            job['progress'] = 100
-            job['etaSeconds'] = 0
-            job['completedAt'] = now.isoformat()
-            if not job.get('appliedAt'):
-                _apply_inference_completion(db, case, raw, job, actor_name=actor_name)
-                job['appliedAt'] = now.isoformat()
+
+def _enqueue_inference_jobs(job_ids: list[str]) -> None:
+    # Imported lazily: the task package imports the services at load time.
+    from server_fastapi.app.tasks.celery_app import celery_app
+
+    for offset in range(0, len(job_ids), INFERENCE_BATCH_SIZE):
+        chunk = job_ids[offset : offset + INFERENCE_BATCH_SIZE]
+        if len(chunk) == 1:
+            task_name, args = INFERENCE_TASK_NAME, [chunk[0]]
         else:
-            progress = min(99, max(int(job.get('progress') or 0), int((elapsed / max(duration_sec, 1)) * 100)))
-            job['status'] = 'RUNNING'
-            job['progress'] = progress
-            job['etaSeconds'] = max(1, duration_sec - elapsed)
-
-    job['updatedAt'] = now.isoformat()
-    jobs = raw.get('inferenceJobs')
-    if not isinstance(jobs, dict):
-        jobs = {}
-    jobs[job_id] = job
-    raw['inferenceJobs'] = jobs
-    case.raw_json = raw
-    case.updated_at = now
+            task_name, args = INFERENCE_BATCH_TASK_NAME, [chunk]
+        try:
+            celery_app.send_task(task_name, args=args, queue=INFERENCE_QUEUE)
+        except Exception:
+            # The jobs stay PENDING and are picked up by the requeue sweep.
+            logger.exception('Inference job enqueue failed for job ids=%s', chunk)
+
+
+def _claim_inference_jobs(db: Session, job_ids: list[str]) -> list[str]:
+    now = _utcnow()
+    stale_before = now - timedelta(seconds=INFERENCE_STALE_SECONDS)
+    claimed = list(
+        db.execute(
+            update(InferenceJob)
+            .where(
+                InferenceJob.job_id.in_(job_ids),
+                InferenceJob.applied_at.is_(None),
+                or_(
+                    InferenceJob.status == 'PENDING',
+                    and_(InferenceJob.status == 'RUNNING', InferenceJob.updated_at < stale_before),
+                ),
+            )
+            .values(status='RUNNING', progress=10, started_at=now, updated_at=now)
+            .returning(InferenceJob.job_id)
+            .execution_options(synchronize_session=False)
+        ).scalars()
+    )
     db.commit()
+    return claimed
 
-    return {
-        'jobId': job_id,
-        'caseId': case.case_id,
-        'stage': int(job.get('stage') or case.stage),
-        'status': str(job.get('status') or 'PENDING'),
-        'progress': int(job.get('progress') or 0),
-        'etaSeconds': int(job['etaSeconds']) if isinstance(job.get('etaSeconds'), int) else job.get('etaSeconds'),
-        'startedAt': job.get('startedAt'),
-        'updatedAt': job.get('updatedAt'),
-        'completedAt': job.get('completedAt'),
-    }
 
+def _apply_inference_results(db: Session, job_keys: list[tuple[str, str, int]], actor_name: str) -> int:
+    results = _score_inference_batch([(case_id, stage) for _, case_id, stage in job_keys])
+    result_by_job = {job_id: result for (job_id, _, _), result in zip(job_keys, results)}
+
+    # Lock the jobs and cases so a redelivered message cannot apply a result twice.
+    locked_jobs = list(
+        db.execute(
+            select(InferenceJob)
+            .where(InferenceJob.job_id.in_(list(result_by_job)), InferenceJob.applied_at.is_(None))
+            .order_by(InferenceJob.job_id)
+            .with_for_update()
+        ).scalars()
+    )
+    case_ids = sorted({job.case_id for job in locked_jobs})
+    cases = {
+        case.case_id: case
+        for case in db.execute(
+            select(LocalCase).where(LocalCase.case_id.in_(case_ids)).order_by(LocalCase.case_id).with_for_update()
+        ).scalars()
+    }
+    raws = {case_id: dict(case.raw_json or {}) for case_id, case in cases.items()}
 
-def scan_due_schedules_and_contact_plans(db: Session) -> dict[str, int]:
     now = _utcnow()
+    for job in locked_jobs:
+        case = cases.get(job.case_id)
+        if case is None:
+            raise LookupError(f'case {job.case_id} not found for inference job {job.job_id}')
+        _apply_inference_completion(db, case, raws[job.case_id], job, result_by_job[job.job_id], actor_name=actor_name)
+        job.status = 'DONE'
+        job.progress = 100
+        job.eta_seconds = 0
+        job.completed_at = now
+        job.applied_at = now
+        job.updated_at = now
+    for case_id, case in cases.items():
+        case.raw_json = raws[case_id]
+        case.updated_at = now
+    db.commit()
+    return len(locked_jobs)
 
-    due_schedules = db.execute(
-        select(Schedule).where(Schedule.status == 'SCHEDULED', Schedule.start_at <= now)
-    ).scalars().all()
-    due_plans = db.execute(
-        select(ContactPlan).where(ContactPlan.status == 'PENDING', ContactPlan.next_contact_at <= now)
-    ).scalars().all()
 
-    schedule_count = 0
-    for row in due_schedules:
-        row.status = 'QUEUED'
-        _append_audit(
-            db,
-            row.case_id,
-            action='SCHEDULE_DUE_QUEUED',
-            message=f'Due schedule queued: {row.id}',
-            actor_name='beat',
-            actor_type='system',
-            before={'status': 'SCHEDULED'},
-            after={'status': 'QUEUED'},
+def execute_inference_batch(
+    db: Session,
+    job_ids: list[str],
+    actor_name: str = 'inference-worker',
+    *,
+    final_attempt: bool = True,
+) -> dict[str, Any]:
+    claimed = _claim_inference_jobs(db, list(dict.fromkeys(job_ids)))
+    if not claimed:
+        return {'requested': len(job_ids), 'executed': 0}
+
+    jobs = list(db.execute(select(InferenceJob).where(InferenceJob.job_id.in_(claimed)).order_by(InferenceJob.job_id)).scalars())
+    record_case_events(
+        db,
+        *(
+            _new_timeline_row(
+                job.case_id,
+                event_type='INFERENCE_STARTED',
+                title=f'Stage{job.stage} 모델 실행 시작',
+                detail=f'job={job.job_id}',
+                actor_name=actor_name,
+                actor_type='system',
+                payload={'jobId': job.job_id, 'stage': job.stage},
+            )
+            for job in jobs
+        ),
+    )
+    db.commit()
+
+    job_keys = [(job.job_id, job.case_id, int(job.stage)) for job in jobs]
+    executed = 0
+    failed: list[str] = []
+    error: Exception | None = None
+    try:
+        executed = _apply_inference_results(db, job_keys, actor_name=actor_name)
+    except Exception as exc:
+        db.rollback()
+        if len(job_keys) == 1:
+            logger.exception('Inference job %s failed', job_keys[0][0])
+            failed, error = [job_keys[0][0]], exc
+        else:
+            # One bad case must not sink the whole batch: apply the jobs one at a time and keep the ones that succeed.
+            logger.warning('Inference batch of %s jobs failed; applying jobs one at a time', len(job_keys), exc_info=True)
+            for key in job_keys:
+                try:
+                    executed += _apply_inference_results(db, [key], actor_name=actor_name)
+                except Exception as job_exc:
+                    db.rollback()
+                    logger.exception('Inference job %s failed', key[0])
+                    failed.append(key[0])
+                    error = job_exc
+
+    if failed:
+        # Hand the jobs back as PENDING so the task retry can claim them again; only the last attempt gives up.
+        db.execute(
+            update(InferenceJob)
+            .where(InferenceJob.job_id.in_(failed), InferenceJob.applied_at.is_(None))
+            .values(status='FAILED' if final_attempt else 'PENDING', progress=0, updated_at=_utcnow())
+            .execution_options(synchronize_session=False)
         )
-        schedule_count += 1
+        db.commit()
+        # Jobs that applied stay DONE; the retry only reclaims the failed ones.
+        if error is not None:
+            raise error
 
-    contact_plan_count = 0
-    for row in due_plans:
-        row.status = 'QUEUED'
-        _append_audit(
-            db,
+    return {'requested': len(job_ids), 'executed': executed}
+
+
+def execute_inference_job(
+    db: Session,
+    job_id: str,
+    actor_name: str = 'inference-worker',
+    *,
+    final_attempt: bool = True,
+) -> dict[str, Any]:
+    result = execute_inference_batch(db, [job_id], actor_name=actor_name, final_attempt=final_attempt)
+    return {'jobId': job_id, 'executed': bool(result['executed'])}
+
+
+def requeue_pending_inference_jobs(db: Session, older_than_seconds: int = 60) -> list[str]:
+    now = _utcnow()
+    cutoff = now - timedelta(seconds=older_than_seconds)
+    # RUNNING jobs whose worker died mid-batch are claimable once stale, but nothing re-sends them otherwise.
+    stale_before = now - timedelta(seconds=INFERENCE_STALE_SECONDS)
+    job_ids = list(
+        db.execute(
+            select(InferenceJob.job_id)
+            .where(
+                or_(
+                    and_(InferenceJob.status == 'PENDING', InferenceJob.requested_at < cutoff),
+                    and_(
+                        InferenceJob.status == 'RUNNING',
+                        InferenceJob.updated_at < stale_before,
+                        InferenceJob.applied_at.is_(None),
+                    ),
+                )
+            )
+            .order_by(InferenceJob.requested_at)
+            .limit(500)
+        ).scalars()
+    )
+    _enqueue_inference_jobs(job_ids)
+    return job_ids
+
+
+def adjust_overdue_schedule_counts(db: Session, case_ids: list[str], delta: int) -> None:
+    if not case_ids:
+        return
+    cases = LocalCase.__table__
+    db.execute(
+        update(cases)
+        .where(cases.c.case_id == bindparam('target_case_id'))
+        .values(overdue_schedule_count=cases.c.overdue_schedule_count + bindparam('delta')),
+        [{'target_case_id': case_id, 'delta': delta * count} for case_id, count in Counter(case_ids).items()],
+    )
+    delete_pattern_after_commit(db, f'{LOCAL_KPI_CACHE_PREFIX}:*')
+
+
+def rebuild_overdue_schedule_counts(db: Session) -> int:
+    # Same rule the counters follow: the due scan adds a row when it queues it and queue processing removes it,
+    # so only QUEUED rows are counted (a past-due SCHEDULED row is counted once the scan queues it).
+    overdue = (
+        select(func.count())
+        .select_from(Schedule)
+        .where(Schedule.case_id == LocalCase.case_id, Schedule.status == 'QUEUED')
+        .scalar_subquery()
+    )
+    result = db.execute(
+        update(LocalCase)
+        .where(LocalCase.overdue_schedule_count != overdue)
+        .values(overdue_schedule_count=overdue)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount
+
+
+def _queue_due_rows(
+    db: Session,
+    model: type[Schedule] | type[ContactPlan],
+    *,
+    due_column: Any,
+    from_status: str,
+    action: str,
+    label: str,
+    now: datetime,
+    on_batch: Callable[[list[Any]], None] | None = None,
+) -> dict[str, Any]:
+    return bulk_transition(
+        db,
+        model,
+        where=[model.status == from_status, due_column <= now],
+        values={'status': 'QUEUED'},
+        returning=[model.case_id],
+        audit=lambda row: _new_audit_row(
             row.case_id,
-            action='CONTACT_PLAN_DUE_QUEUED',
-            message=f'Due contact plan queued: {row.id}',
+            action=action,
+            message=f'Due {label} queued: {row.id}',
             actor_name='beat',
             actor_type='system',
-            before={'status': 'PENDING'},
+            before={'status': from_status},
             after={'status': 'QUEUED'},
-        )
-        contact_plan_count += 1
+        ),
+        on_batch=on_batch,
+        invalidate=[CAUSE_CUBE_BASE_KEY],
+        order_by=due_column,
+        batch_size=DUE_SCAN_BATCH_SIZE,
+        label=f'due {label} scan',
+    )
 
-    db.commit()
-    return {'dueSchedules': schedule_count, 'dueContactPlans': contact_plan_count}
+
+def scan_due_schedules_and_contact_plans(db: Session) -> dict[str, Any]:
+    now = _utcnow()
+    schedules = _queue_due_rows(
+        db,
+        Schedule,
+        due_column=Schedule.start_at,
+        from_status='SCHEDULED',
+        action='SCHEDULE_DUE_QUEUED',
+        label='schedule',
+        now=now,
+        on_batch=lambda rows: adjust_overdue_schedule_counts(db, [row.case_id for row in rows], 1),
+    )
+    contact_plans = _queue_due_rows(
+        db,
+        ContactPlan,
+        due_column=ContactPlan.next_contact_at,
+        from_status='PENDING',
+        action='CONTACT_PLAN_DUE_QUEUED',
+        label='contact plan',
+        now=now,
+    )
+    return {
+        'dueSchedules': schedules['processed'],
+        'dueContactPlans': contact_plans['processed'],
+        'batches': schedules['batches'] + contact_plans['batches'],
+        'batchLatencyMs': schedules['batchLatencyMs'] + contact_plans['batchLatencyMs'],
+    }
@@ -5,12 +5,11 @@ from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from fastapi import HTTPException
-from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from server_fastapi.app.models.local_center import Contact, ContactPlan, ContactResult, ExamResult, LocalAuditEvent, Schedule
+from server_fastapi.app.models.local_center import Contact, ContactPlan, ContactResult, ExamResult, LocalAuditEvent
 from server_fastapi.app.services.citizen_service import issue_citizen_invite, list_case_citizen_submissions
-from server_fastapi.app.services.local_case_service import ensure_case
+from server_fastapi.app.services.local_case_service import ensure_case, get_case, insert_schedules_idempotent
 
 
 def _utcnow() -> datetime:
@@ -69,7 +68,7 @@ def local_issue_citizen_invite(
 
 
 def local_list_citizen_submissions(db: Session, *, case_id: str) -> dict[str, Any]:
-    ensure_case(db, case_id)
+    get_case(db, case_id)
     return list_case_citizen_submissions(db, case_id=case_id)
 
 
@@ -199,10 +198,6 @@ def create_local_schedule(db: Session, *, payload: dict[str, Any], actor_name: s
     ensure_case(db, case_id)
 
     idempotency_key = payload.get('idempotencyKey') or payload.get('idempotency_key') or f'{case_id}:{payload.get("title")}:{payload.get("startAt")}'
-    existing = db.execute(select(Schedule).where(Schedule.idempotency_key == idempotency_key)).scalar_one_or_none()
-    if existing:
-        return {'ok': True, 'scheduleId': existing.id, 'idempotent': True}
-
     start_raw = payload.get('startAt') or payload.get('start_at')
     if not start_raw:
         raise HTTPException(status_code=422, detail='startAt is required')
@@ -211,30 +206,38 @@ def create_local_schedule(db: Session, *, payload: dict[str, Any], actor_name: s
     except Exception as exc:
         raise HTTPException(status_code=422, detail='invalid startAt format') from exc
 
-    row = Schedule(
-        id=_new_id('CAL'),
-        idempotency_key=idempotency_key,
-        case_id=case_id,
-        event_type=payload.get('eventType') or payload.get('event_type') or 'FOLLOWUP',
-        title=payload.get('title') or '일정',
-        start_at=start_at,
-        duration_min=int(payload.get('durationMin') or payload.get('duration_min') or 20),
-        priority=payload.get('priority') or 'NORMAL',
-        assignee_id=payload.get('assigneeId') or payload.get('assignee_id'),
-        payload_json=payload.get('payload') if isinstance(payload.get('payload'), dict) else payload,
-        status='SCHEDULED',
-        created_at=_utcnow(),
-    )
-    db.add(row)
+    event_type = payload.get('eventType') or payload.get('event_type') or 'FOLLOWUP'
+    schedule_id, created = insert_schedules_idempotent(
+        db,
+        [
+            {
+                'id': _new_id('CAL'),
+                'idempotency_key': idempotency_key,
+                'case_id': case_id,
+                'event_type': event_type,
+                'title': payload.get('title') or '일정',
+                'start_at': start_at,
+                'duration_min': int(payload.get('durationMin') or payload.get('duration_min') or 20),
+                'priority': payload.get('priority') or 'NORMAL',
+                'assignee_id': payload.get('assigneeId') or payload.get('assignee_id'),
+                'payload_json': payload.get('payload') if isinstance(payload.get('payload'), dict) else payload,
+                'status': 'SCHEDULED',
+                'created_at': _utcnow(),
+            }
+        ],
+    )[idempotency_key]
+    if not created:
+        return {'ok': True, 'scheduleId': schedule_id, 'idempotent': True}
+
     _append_audit(
         db,
         case_id=case_id,
         action='LOCAL_SCHEDULE_CREATED',
         message='Local schedule created',
         actor_name=actor_name,
-        after={'scheduleId': row.id, 'eventType': row.event_type, 'startAt': row.start_at.isoformat()},
+        after={'scheduleId': schedule_id, 'eventType': event_type, 'startAt': start_at.isoformat()},
         entity_type='schedule',
-        entity_id=row.id,
+        entity_id=schedule_id,
     )
     db.commit()
-    return {'ok': True, 'scheduleId': row.id, 'idempotent': False}
+    return {'ok': True, 'scheduleId': schedule_id, 'idempotent': False}
@@ -1,23 +1,29 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from itertools import chain
 from typing import Any
 
-from sqlalchemy import and_, desc, func, select
+from sqlalchemy import Float, and_, case, cast, desc, event, false, func, inspect, or_, select, tuple_
 from sqlalchemy.orm import Session
 
 from server_fastapi.app.models.local_center import (
+    CaseView,
     LocalCase,
     LocalUser,
-    Schedule,
     Stage2ModelRun,
     Stage3ModelRun,
     TimelineEvent,
     WorkItem,
 )
-from server_fastapi.app.services.local_case_service import ensure_case, get_stage3_case
+from server_fastapi.app.services.cache_service import delete_pattern_after_commit, get_json, set_json
+from server_fastapi.app.services.case_search_service import case_search_filter, is_demo_unassigned, seed_ratio
+from server_fastapi.app.services.keyset_pagination import decode_keyset_cursor, encode_keyset_cursor
+from server_fastapi.app.services.local_case_service import get_case, get_stage3_case
 
 TOP_PRIORITY_STAGE1_CASE_ID = 'CASE-2026-175'
+USER_DIRECTORY_CACHE_PREFIX = 'local:users'
+USER_DIRECTORY_CACHE_TTL_SECONDS = 300
 
 
 def _utcnow() -> datetime:
@@ -33,14 +39,6 @@ def _fmt_local(dt: datetime | None) -> str:
     return target.strftime('%Y-%m-%d %H:%M')
 
 
-def _seed_ratio(case_id: str, suffix: str) -> float:
-    raw = f'{case_id}:{suffix}'
-    acc = 0
-    for idx, ch in enumerate(raw):
-        acc = (acc * 33 + ord(ch) + idx) & 0xFFFFFFFF
-    return (acc % 1000) / 1000.0
-
-
 def _stage_label(stage: int) -> str:
     if stage >= 3:
         return 'Stage 3'
@@ -75,7 +73,7 @@ def _legacy_status(case: LocalCase) -> str:
     if status in {'CLOSED', 'CLOSED_REFUSED', 'DONE'}:
         return '완료'
     if case.stage == 1 and status in {'QUEUED', 'WAITING_EXAM', 'EXAM_RESULT_PENDING'}:
-        pivot = _seed_ratio(case.case_id, 'stage1-status')
+        pivot = seed_ratio(case.case_id, 'stage1-status')
         if pivot >= 0.82:
             return '지연'
         if pivot >= 0.58:
@@ -104,7 +102,7 @@ def _legacy_path(case: LocalCase) -> str:
         if classification in {'MCI_HIGH', 'AD'}:
             return 'High MCI 경로'
         return '의뢰 우선'
-    path_seed = _seed_ratio(case.case_id, 'stage1-path')
+    path_seed = seed_ratio(case.case_id, 'stage1-path')
     risk = _legacy_risk(case)
     if risk == '고' and path_seed >= 0.38:
         return '상담사 우선 접촉'
@@ -160,14 +158,6 @@ def _resolve_contact_mode(case: LocalCase) -> str:
     return 'HUMAN'
 
 
-def _is_demo_unassigned(case: LocalCase) -> bool:
-    if case.stage != 1:
-        return False
-    if not (case.case_id.startswith('CASE-2026-') or case.case_id.startswith('CASE-TOKEN-')):
-        return False
-    return _seed_ratio(case.case_id, 'owner') < 0.22
-
-
 def _quality_label(case: LocalCase) -> str:
     metrics = case.metrics_json if isinstance(case.metrics_json, dict) else {}
     score_raw = metrics.get('dataQualityPct')
@@ -219,36 +209,54 @@ def _alert_tags(case: LocalCase, overdue_by_case: dict[str, int]) -> list[str]:
     return deduped
 
 
-def _owner_name_map(db: Session) -> dict[str, str]:
-    rows = db.execute(select(LocalUser)).scalars().all()
-    return {row.id: row.name for row in rows}
+def _user_directory_cache_key(center_id: str | None) -> str:
+    return f'{USER_DIRECTORY_CACHE_PREFIX}:{center_id or "none"}'
 
 
-def _overdue_by_case(db: Session) -> dict[str, int]:
-    now = _utcnow()
-    rows = db.execute(
-        select(Schedule.case_id, func.count())
-        .where(and_(Schedule.status.in_(['SCHEDULED', 'QUEUED']), Schedule.start_at < now))
-        .group_by(Schedule.case_id)
-    ).all()
-    return {str(case_id): int(count or 0) for case_id, count in rows}
+def center_user_directory(db: Session, center_id: str | None) -> dict[str, str]:
+    cache_key = _user_directory_cache_key(center_id)
+    cached = get_json(cache_key)
+    if isinstance(cached, dict):
+        return cached
+    scope = LocalUser.center_id == center_id if center_id else LocalUser.center_id.is_(None)
+    directory = {user_id: name for user_id, name in db.execute(select(LocalUser.id, LocalUser.name).where(scope)).all()}
+    set_json(cache_key, directory, USER_DIRECTORY_CACHE_TTL_SECONDS)
+    return directory
+
 
+@event.listens_for(Session, 'after_flush')
+def _track_user_directory_changes(session: Session, flush_context: Any) -> None:
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if not isinstance(obj, LocalUser):
+            continue
+        history = inspect(obj).attrs.center_id.history
+        for center_id in {obj.center_id, *history.deleted}:
+            delete_pattern_after_commit(session, _user_directory_cache_key(center_id))
 
-def _case_record(case: LocalCase, owner_map: dict[str, str], overdue_map: dict[str, int]) -> dict[str, Any]:
+
+def _owner_name_map(db: Session, rows: list[Any]) -> dict[str, str]:
+    names: dict[str, str] = {}
+    for center_id in sorted({row.center_id for row in rows}):
+        names.update(center_user_directory(db, center_id))
+    # Owners assigned across centers are rare; resolve them directly rather than widening the cached scope.
+    missing = {row.owner_id for row in rows if row.owner_id and row.owner_id not in names}
+    if missing:
+        names.update(db.execute(select(LocalUser.id, LocalUser.name).where(LocalUser.id.in_(missing))).all())
+    return names
+
+
+def _case_record_base(case: LocalCase) -> dict[str, Any]:
+    # Everything in a list record except the owner name and overdue-schedule tag, which change without the case.
     subject = case.subject_json if isinstance(case.subject_json, dict) else {}
-    manager = owner_map.get(case.owner_id or '', case.owner_id or '담당자 미지정')
-    if _is_demo_unassigned(case):
-        manager = '담당자 미지정'
     guardian_phone = subject.get('guardianPhone')
-    if not guardian_phone and _seed_ratio(case.case_id, 'guardian') < 0.38:
-        guardian_phone = f"010-****-{(1000 + int(_seed_ratio(case.case_id, 'g4') * 8000)):04d}"
+    if not guardian_phone and seed_ratio(case.case_id, 'guardian') < 0.38:
+        guardian_phone = f"010-****-{(1000 + int(seed_ratio(case.case_id, 'g4') * 8000)):04d}"
     return {
         'id': case.case_id,
         'stage': _stage_label(case.stage),
         'risk': _legacy_risk(case),
         'path': _legacy_path(case),
         'status': _legacy_status(case),
-        'manager': manager,
         'action': _legacy_action(case),
         'updated': _fmt_local(case.updated_at),
         'quality': _quality_label(case),
@@ -258,98 +266,263 @@ def _case_record(case: LocalCase, owner_map: dict[str, str], overdue_map: dict[s
             'phone': str(subject.get('maskedPhone') or '010-****-0000'),
             'guardianPhone': guardian_phone,
         },
-        'alertTags': _alert_tags(case, overdue_map),
+        'alertTags': _alert_tags(case, {}),
     }
 
 
-def list_dashboard_case_records(db: Session, *, stage: str | None, status: str | None, keyword: str | None) -> list[dict[str, Any]]:
-    rows = db.execute(select(LocalCase).order_by(desc(LocalCase.updated_at))).scalars().all()
-    owner_map = _owner_name_map(db)
-    overdue_map = _overdue_by_case(db)
+def _finish_case_record(
+    base: dict[str, Any],
+    row: Any,
+    owner_map: dict[str, str],
+) -> dict[str, Any]:
+    manager = owner_map.get(row.owner_id or '', row.owner_id or '담당자 미지정')
+    if is_demo_unassigned(row):
+        manager = '담당자 미지정'
+    alert_tags = list(base.get('alertTags') or [])
+    if (row.overdue_schedule_count or 0) > 0 and 'SLA 임박' not in alert_tags:
+        alert_tags.insert(0, 'SLA 임박')
+    record: dict[str, Any] = {}
+    for key, value in base.items():
+        record[key] = alert_tags if key == 'alertTags' else value
+        if key == 'status':
+            record['manager'] = manager
+    return record
+
 
-    records = [_case_record(row, owner_map, overdue_map) for row in rows]
+def _case_record(case: LocalCase, owner_map: dict[str, str]) -> dict[str, Any]:
+    return _finish_case_record(_case_record_base(case), case, owner_map)
 
-    if stage and stage != 'ALL':
-        target = str(stage).replace('STAGE', '').replace('Stage ', '').strip()
-        records = [row for row in records if row['stage'].endswith(target)]
 
+def list_dashboard_case_records(db: Session, *, stage: str | None, status: str | None, keyword: str | None) -> list[dict[str, Any]]:
+    query = (
+        select(
+            LocalCase.case_id,
+            LocalCase.center_id,
+            LocalCase.stage,
+            LocalCase.owner_id,
+            LocalCase.overdue_schedule_count,
+            CaseView.record_json,
+        )
+        .outerjoin(CaseView, CaseView.case_id == LocalCase.case_id)
+        .order_by(desc(LocalCase.updated_at))
+    )
+    search = case_search_filter(db, keyword)
+    if search is not None:
+        query = query.where(search)
+    stage_clause = _dashboard_stage_clause(stage)
+    if stage_clause is not None:
+        query = query.where(stage_clause)
+    normalized_status = str(status).strip() if status and status != 'ALL' else None
+    if normalized_status:
+        query = query.where(or_(CaseView.display_status == normalized_status, CaseView.case_id.is_(None)))
+    rows = db.execute(query).all()
+
+    missing = [row.case_id for row in rows if row.record_json is None]
+    fallback: dict[str, dict[str, Any]] = {}
+    if missing:
+        cases = db.execute(select(LocalCase).where(LocalCase.case_id.in_(missing))).scalars().all()
+        fallback = {case.case_id: _case_record_base(case) for case in cases}
+
+    owner_map = _owner_name_map(db, rows)
+    records = []
+    for row in rows:
+        base = row.record_json if row.record_json is not None else fallback[row.case_id]
+        if normalized_status and base['status'] != normalized_status:
+            continue
+        records.append(_finish_case_record(base, row, owner_map))
+    return records
+
+
+DASHBOARD_WAITING_STATUSES = {'대기', '임박', '지연'}
+STAGE1_PIVOT_STATUSES = ['QUEUED', 'WAITING_EXAM', 'EXAM_RESULT_PENDING']
+STAGE2_WAITING_STATUSES = ['WAITING_EXAM', 'EXAM_RESULT_PENDING', 'QUEUED', 'ON_HOLD']
+PRIORITY_CANDIDATE_STATUSES = ['QUEUED', 'WAITING_EXAM', 'EXAM_RESULT_PENDING', 'ON_HOLD', 'TRACKING', 'REEVAL_DUE', 'LINKAGE_PENDING']
+CLOSED_CASE_STATUSES = ['CLOSED', 'CLOSED_REFUSED', 'DONE']
+PRIORITY_TASK_LIMIT = 6
+HIGH_MCI_LIST_LIMIT = 5
+CASE_EVENT_PAGE_LIMIT = 200
+NUMERIC_TEXT_PATTERN = r'^\s*[-+]?[0-9]+(\.[0-9]+)?\s*$'
+
+
+def _dashboard_stage_clause(stage: str | None) -> Any | None:
+    if not stage or stage == 'ALL':
+        return None
+    target = str(stage).replace('STAGE', '').replace('Stage ', '').strip()
+    clauses = {1: LocalCase.stage < 2, 2: LocalCase.stage == 2, 3: LocalCase.stage >= 3}
+    matched = [clause for number, clause in clauses.items() if _stage_label(number).endswith(target)]
+    if not matched:
+        return false()
+    return or_(*matched)
+
+
+def _dashboard_scope_filters(db: Session, *, stage: str | None, status: str | None, keyword: str | None) -> list[Any]:
+    filters: list[Any] = []
+    stage_clause = _dashboard_stage_clause(stage)
+    if stage_clause is not None:
+        filters.append(stage_clause)
+    search = case_search_filter(db, keyword)
+    if search is not None:
+        filters.append(search)
     if status and status != 'ALL':
+        # Display statuses are partly seeded per case id, so resolve them on a narrow projection.
         normalized = str(status).strip()
-        records = [row for row in records if row['status'] == normalized]
-
-    if keyword:
-        q = str(keyword).strip().lower()
-        if q:
-            records = [
-                row
-                for row in records
-                if q in str(row['id']).lower()
-                or q in str(row['profile']['name']).lower()
-                or q in str(row['manager']).lower()
-            ]
+        rows = db.execute(select(LocalCase.case_id, LocalCase.stage, LocalCase.status).where(*filters)).all()
+        filters.append(LocalCase.case_id.in_([row.case_id for row in rows if _legacy_status(row) == normalized]))
+    return filters
+
+
+def _high_mci_clause(db: Session) -> Any:
+    classification = func.upper(LocalCase.raw_json[('caseState', 'classification')].as_string())
+    risk_path = LocalCase.raw_json[('caseState', 'riskScore')]
+    risk_text = risk_path.as_string()
+    if db.get_bind().dialect.name == 'postgresql':
+        # raw_json is jsonb. Numbers and numeric strings are cast as before; anything else
+        # counts as no score instead of aborting the whole count with a cast error.
+        kind = func.jsonb_typeof(risk_path)
+        is_numeric = or_(kind == 'number', and_(kind == 'string', risk_text.op('~')(NUMERIC_TEXT_PATTERN)))
+        risk_score = case((is_numeric, cast(risk_text, Float)), else_=None)
+    else:
+        # SQLite casts never raise; non-numeric text becomes 0.
+        risk_score = cast(risk_text, Float)
+    return and_(
+        LocalCase.stage == 2,
+        or_(classification.in_(['MCI_HIGH', 'AD']), func.upper(LocalCase.alert_level) == 'HIGH', risk_score >= 70),
+    )
 
-    return records
 
+def _churn_high_clause() -> Any:
+    return and_(LocalCase.stage >= 3, LocalCase.churn_risk == 'HIGH')
+
+
+def _stage1_pivot_waiting(case_id: str) -> bool:
+    pivot = seed_ratio(case_id, 'stage1-status')
+    return pivot >= 0.58 or pivot < 0.36
+
+
+def _priority_task(record: dict[str, Any]) -> dict[str, Any]:
+    return {
+        'id': record['id'],
+        'name': record['profile'].get('name', record['id']),
+        'age': record['profile'].get('age', 0),
+        'stage': record['stage'],
+        'reason': ', '.join(record.get('alertTags') or ['운영 확인']),
+        'action': record.get('action', '확인'),
+        'sla': '24h' if 'SLA 임박' in (record.get('alertTags') or []) else '72h',
+    }
 
-def build_dashboard_stats(db: Session, records: list[dict[str, Any]]) -> dict[str, Any]:
-    total = max(1, len(records))
-    stage_counts = {1: 0, 2: 0, 3: 0}
-    contact_needed = 0
-    stage2_waiting = 0
-    high_risk_mci = 0
-    stage3_waiting = 0
-    churn_risk = 0
-
-    for row in records:
-        stage_label = str(row.get('stage') or '')
-        if stage_label.endswith('1'):
-            stage_counts[1] += 1
-            if row.get('status') in {'대기', '임박', '지연'}:
-                contact_needed += 1
-        elif stage_label.endswith('2'):
-            stage_counts[2] += 1
-            if row.get('status') in {'대기', '임박', '지연'}:
-                stage2_waiting += 1
-            if 'High MCI' in (row.get('alertTags') or []):
-                high_risk_mci += 1
-        else:
-            stage_counts[3] += 1
-            if row.get('status') in {'대기', '임박', '지연', '진행중'}:
-                stage3_waiting += 1
-            if '이탈 위험' in (row.get('alertTags') or []):
-                churn_risk += 1
 
+def _load_priority_tasks(db: Session, filters: list[Any]) -> list[dict[str, Any]]:
+    pinned_id = db.execute(
+        select(LocalCase.case_id).where(*filters, LocalCase.case_id == TOP_PRIORITY_STAGE1_CASE_ID)
+    ).scalar_one_or_none()
+
+    candidates = (
+        select(LocalCase.case_id, LocalCase.stage, LocalCase.status)
+        .where(*filters, func.upper(LocalCase.status).in_(PRIORITY_CANDIDATE_STATUSES))
+        .order_by(desc(LocalCase.updated_at))
+        .execution_options(yield_per=200)
+    )
+    selected: list[str] = [pinned_id] if pinned_id else []
+    for row in db.execute(candidates):
+        if len(selected) >= PRIORITY_TASK_LIMIT:
+            break
+        if row.case_id != pinned_id and _legacy_status(row) in DASHBOARD_WAITING_STATUSES:
+            selected.append(row.case_id)
+
+    if not selected:
+        return []
+    cases = {row.case_id: row for row in db.execute(select(LocalCase).where(LocalCase.case_id.in_(selected))).scalars()}
+    return [_priority_task(_case_record(cases[case_id], {})) for case_id in selected if case_id in cases]
+
+
+def compute_dashboard_stats(
+    db: Session,
+    *,
+    stage: str | None,
+    status: str | None,
+    keyword: str | None,
+) -> tuple[dict[str, Any], int]:
+    filters = _dashboard_scope_filters(db, stage=stage, status=status, keyword=keyword)
+    status_upper = func.upper(LocalCase.status)
+    high_mci = _high_mci_clause(db)
+
+    counts = db.execute(
+        select(
+            func.count().label('total'),
+            func.count().filter(LocalCase.stage < 2).label('stage1'),
+            func.count().filter(LocalCase.stage == 2).label('stage2'),
+            func.count().filter(LocalCase.stage >= 3).label('stage3'),
+            func.count()
+            .filter(
+                LocalCase.stage < 2,
+                or_(status_upper == 'ON_HOLD', and_(LocalCase.stage != 1, status_upper.in_(STAGE1_PIVOT_STATUSES))),
+            )
+            .label('stage1_waiting'),
+            func.count().filter(LocalCase.stage == 2, status_upper.in_(STAGE2_WAITING_STATUSES)).label('stage2_waiting'),
+            func.count().filter(LocalCase.stage >= 3, status_upper.not_in(CLOSED_CASE_STATUSES)).label('stage3_waiting'),
+            func.count().filter(high_mci).label('high_mci'),
+            func.count().filter(_churn_high_clause()).label('churn'),
+        ).where(*filters)
+    ).one()
+
+    pivot_ids = db.execute(
+        select(LocalCase.case_id).where(*filters, LocalCase.stage == 1, status_upper.in_(STAGE1_PIVOT_STATUSES))
+    ).scalars()
+    contact_needed = int(counts.stage1_waiting or 0) + sum(1 for case_id in pivot_ids if _stage1_pivot_waiting(case_id))
+
+    # Probability labels follow each case's position in the full dashboard ordering.
+    ranked = (
+        select(
+            LocalCase.case_id,
+            LocalCase.subject_json['age'].as_string().label('age'),
+            LocalCase.updated_at,
+            (func.row_number().over(order_by=desc(LocalCase.updated_at)) - 1).label('position'),
+            high_mci.label('is_high_mci'),
+        )
+        .where(*filters)
+        .subquery()
+    )
+    high_mci_rows = db.execute(
+        select(ranked.c.case_id, ranked.c.age, ranked.c.position)
+        .where(ranked.c.is_high_mci)
+        .order_by(ranked.c.position)
+        .limit(HIGH_MCI_LIST_LIMIT)
+    ).all()
     high_mci_list = [
         {
-            'id': row['id'],
-            'age': row['profile'].get('age', 0),
-            'probability': f"{72 + (idx % 9)}%",
+            'id': row.case_id,
+            'age': int(float(row.age)) if row.age else 74,
+            'probability': f"{72 + (int(row.position) % 9)}%",
             'period': '30일',
             'nextAction': '추적 등록',
         }
-        for idx, row in enumerate(records)
-        if 'High MCI' in (row.get('alertTags') or [])
-    ][:5]
-
-    def to_priority_task(row: dict[str, Any]) -> dict[str, Any]:
-        return {
-            'id': row['id'],
-            'name': row['profile'].get('name', row['id']),
-            'age': row['profile'].get('age', 0),
-            'stage': row['stage'],
-            'reason': ', '.join(row.get('alertTags') or ['운영 확인']),
-            'action': row.get('action', '확인'),
-            'sla': '24h' if 'SLA 임박' in (row.get('alertTags') or []) else '72h',
-        }
-
-    priority_tasks = [to_priority_task(row) for row in records if row.get('status') in {'대기', '임박', '지연'}]
-
-    pinned_task = next((to_priority_task(row) for row in records if str(row.get('id')) == TOP_PRIORITY_STAGE1_CASE_ID), None)
-    if pinned_task is not None:
-        priority_tasks = [pinned_task, *[task for task in priority_tasks if task.get('id') != TOP_PRIORITY_STAGE1_CASE_ID]]
-
-    priority_tasks = priority_tasks[:6]
+        for row in high_mci_rows
+    ]
 
+    stats = _assemble_dashboard_stats(
+        stage_counts={1: int(counts.stage1 or 0), 2: int(counts.stage2 or 0), 3: int(counts.stage3 or 0)},
+        contact_needed=contact_needed,
+        stage2_waiting=int(counts.stage2_waiting or 0),
+        high_risk_mci=int(counts.high_mci or 0),
+        stage3_waiting=int(counts.stage3_waiting or 0),
+        churn_risk=int(counts.churn or 0),
+        high_mci_list=high_mci_list,
+        priority_tasks=_load_priority_tasks(db, filters),
+    )
+    return stats, int(counts.total or 0)
+
+
+def _assemble_dashboard_stats(
+    *,
+    stage_counts: dict[int, int],
+    contact_needed: int,
+    stage2_waiting: int,
+    high_risk_mci: int,
+    stage3_waiting: int,
+    churn_risk: int,
+    high_mci_list: list[dict[str, Any]],
+    priority_tasks: list[dict[str, Any]],
+) -> dict[str, Any]:
     stage1_base = max(stage_counts[1], 1)
     stage2_mci = max(high_risk_mci, min(stage_counts[2], stage2_waiting))
     stage2_rate = round(stage_counts[2] / stage1_base * 100, 1)
@@ -415,18 +588,42 @@ def build_dashboard_stats(db: Session, records: list[dict[str, Any]]) -> dict[st
     }
 
 
-def build_case_entity(db: Session, case_id: str) -> dict[str, Any]:
-    case = ensure_case(db, case_id)
+def _latest_model_runs(db: Session, model: Any, case_ids: list[str]) -> dict[str, Any]:
+    ranked = (
+        select(
+            model.id.label('run_id'),
+            func.row_number().over(partition_by=model.case_id, order_by=(desc(model.created_at), desc(model.id))).label('rn'),
+        )
+        .where(model.case_id.in_(case_ids))
+        .subquery()
+    )
+    runs = db.execute(select(model).join(ranked, ranked.c.run_id == model.id).where(ranked.c.rn == 1)).scalars().all()
+    return {run.case_id: run for run in runs}
+
+
+def _pending_work_item_counts(db: Session, case_ids: list[str]) -> dict[str, tuple[int, int]]:
+    open_items = and_(WorkItem.case_id.in_(case_ids), WorkItem.status.in_(['OPEN', 'IN_PROGRESS']))
+    rows = db.execute(
+        select(
+            WorkItem.case_id,
+            func.count().filter(WorkItem.item_type.like('%BOOKING%')),
+            func.count().filter(WorkItem.item_type.like('%APPROVAL%')),
+        )
+        .where(open_items)
+        .group_by(WorkItem.case_id)
+    ).all()
+    return {str(case_id): (int(booking or 0), int(approvals or 0)) for case_id, booking, approvals in rows}
+
+
+def _case_entity(
+    case: LocalCase,
+    stage2_run: Stage2ModelRun | None,
+    stage3_run: Stage3ModelRun | None,
+    pending_counts: tuple[int, int],
+) -> dict[str, Any]:
     legacy_status = _legacy_status(case)
     contact_mode = _resolve_contact_mode(case)
-    assignee_id = None if _is_demo_unassigned(case) else case.owner_id
-
-    stage2_run = db.execute(
-        select(Stage2ModelRun).where(Stage2ModelRun.case_id == case.case_id).order_by(desc(Stage2ModelRun.created_at)).limit(1)
-    ).scalar_one_or_none()
-    stage3_run = db.execute(
-        select(Stage3ModelRun).where(Stage3ModelRun.case_id == case.case_id).order_by(desc(Stage3ModelRun.created_at)).limit(1)
-    ).scalar_one_or_none()
+    assignee_id = None if is_demo_unassigned(case) else case.owner_id
 
     model2_available = stage2_run is not None
     model3_available = stage3_run is not None
@@ -542,22 +739,8 @@ def build_case_entity(db: Session, case_id: str) -> dict[str, Any]:
             'ops': {
                 'contactMode': contact_mode,
                 'lastContactAt': updated_at,
-                'bookingPendingCount': int(
-                    db.execute(
-                        select(func.count())
-                        .select_from(WorkItem)
-                        .where(and_(WorkItem.case_id == case.case_id, WorkItem.item_type.like('%BOOKING%'), WorkItem.status.in_(['OPEN', 'IN_PROGRESS'])))
-                    ).scalar_one()
-                    or 0
-                ),
-                'approvalsPendingCount': int(
-                    db.execute(
-                        select(func.count())
-                        .select_from(WorkItem)
-                        .where(and_(WorkItem.case_id == case.case_id, WorkItem.item_type.like('%APPROVAL%'), WorkItem.status.in_(['OPEN', 'IN_PROGRESS'])))
-                    ).scalar_one()
-                    or 0
-                ),
+                'bookingPendingCount': pending_counts[0],
+                'approvalsPendingCount': pending_counts[1],
                 'dataQualityScore': 95 if _quality_label(case) == '양호' else (82 if _quality_label(case) == '주의' else 65),
                 'missingFieldCount': 0 if _quality_label(case) == '양호' else (2 if _quality_label(case) == '주의' else 5),
             },
@@ -565,11 +748,44 @@ def build_case_entity(db: Session, case_id: str) -> dict[str, Any]:
     }
 
 
-def build_case_events(db: Session, case_id: str) -> list[dict[str, Any]]:
-    ensure_case(db, case_id)
-    rows = db.execute(
-        select(TimelineEvent).where(TimelineEvent.case_id == case_id).order_by(desc(TimelineEvent.at)).limit(200)
-    ).scalars().all()
+def compute_case_entities(db: Session, cases: list[LocalCase]) -> dict[str, dict[str, Any]]:
+    case_ids = [case.case_id for case in cases]
+    if not case_ids:
+        return {}
+    stage2_runs = _latest_model_runs(db, Stage2ModelRun, case_ids)
+    stage3_runs = _latest_model_runs(db, Stage3ModelRun, case_ids)
+    pending = _pending_work_item_counts(db, case_ids)
+    return {
+        case.case_id: _case_entity(case, stage2_runs.get(case.case_id), stage3_runs.get(case.case_id), pending.get(case.case_id, (0, 0)))
+        for case in cases
+    }
+
+
+def build_case_entity(db: Session, case_id: str) -> dict[str, Any]:
+    case = get_case(db, case_id)
+    view = db.get(CaseView, case_id)
+    if view is not None:
+        return dict(view.entity_json)
+    # Not projected yet (e.g. rows written before case_views existed); derive without writing.
+    return compute_case_entities(db, [case])[case_id]
+
+
+def build_case_events(
+    db: Session,
+    case_id: str,
+    *,
+    cursor: str | None = None,
+    limit: int = CASE_EVENT_PAGE_LIMIT,
+) -> tuple[list[dict[str, Any]], str | None]:
+    get_case(db, case_id)
+    query = select(TimelineEvent).where(TimelineEvent.case_id == case_id)
+    if cursor:
+        cursor_at, cursor_id = decode_keyset_cursor(cursor)
+        query = query.where(tuple_(TimelineEvent.at, TimelineEvent.id) < tuple_(cursor_at, cursor_id))
+    rows = db.execute(query.order_by(desc(TimelineEvent.at), desc(TimelineEvent.id)).limit(limit + 1)).scalars().all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_keyset_cursor(rows[-1].at, rows[-1].id) if has_more and rows else None
 
     mapped: list[dict[str, Any]] = []
     for idx, row in enumerate(rows):
@@ -600,12 +816,12 @@ def build_case_events(db: Session, case_id: str) -> list[dict[str, Any]]:
             }
         )
 
-    if mapped:
-        return mapped
+    if mapped or cursor:
+        return mapped, next_cursor
 
     # Ensure empty timelines still render a stable history card.
-    stage3_payload = get_stage3_case(db, case_id)
-    return [
+    stage3_payload = get_stage3_case(db, case_id, timeline_limit=0, audit_limit=0)
+    bootstrap = [
         {
             'eventId': f'evt-{case_id}-bootstrap',
             'caseId': case_id,
@@ -618,3 +834,4 @@ def build_case_events(db: Session, case_id: str) -> list[dict[str, Any]]:
             },
         }
     ]
+    return bootstrap, None
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+import json
 from collections import Counter
 from datetime import datetime, timedelta, timezone
 from hashlib import sha256
+from itertools import chain
 from typing import Any
 from uuid import uuid4
 
 from fastapi import HTTPException
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, event, func, select, text
 from sqlalchemy.orm import Session
 
+from server_fastapi.app.db.dialect import dialect_insert
 from server_fastapi.app.models.citizen import CitizenRequest
 from server_fastapi.app.models.local_center import (
+    Center,
     ContactPlan,
     LocalCase,
     RegionalSnapshot,
@@ -20,6 +24,7 @@ from server_fastapi.app.models.local_center import (
     Stage3ModelRun,
     WorkItem,
 )
+from server_fastapi.app.services.cache_service import delete_pattern, delete_pattern_after_commit, get_json, set_json
 
 CAUSE_CATALOG: list[dict[str, Any]] = [
     {'causeKey': 'staff_shortage', 'causeLabel': '인력 여유 부족', 'owner': 'center', 'actionable': True, 'regionalNeed': 'high'},
@@ -38,6 +43,43 @@ STAGE_META: list[tuple[str, str]] = [
 
 DEFAULT_DISTRICTS = ['강남구', '서초구', '송파구', '강동구', '마포구', '영등포구']
 
+DISTRICT_METRIC_KEYS = [
+    'total_cases',
+    'stage1_cases',
+    'stage2_cases',
+    'stage3_cases',
+    'high_alert_cases',
+    'overdue_schedules',
+    'overdue_contacts',
+    'open_work_items',
+    'stage2_runs',
+    'stage3_runs',
+    'citizen_pending',
+]
+
+CAUSE_CUBE_TTL_SECONDS = 600
+CAUSE_CUBE_BASE_KEY = 'regional:cause-cube:base'
+
+REGION_CODE_BY_ID = {
+    'seoul': '11',
+    'busan': '26',
+    'daegu': '27',
+    'incheon': '28',
+    'gwangju': '29',
+    'daejeon': '30',
+    'ulsan': '31',
+    'sejong': '36',
+    'gyeonggi': '41',
+    'chungbuk': '43',
+    'chungnam': '44',
+    'jeonbuk': '45',
+    'jeonnam': '46',
+    'gyeongbuk': '47',
+    'gyeongnam': '48',
+    'jeju': '50',
+    'gangwon': '51',
+}
+
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
@@ -79,6 +121,44 @@ def _parse_district_tokens(tokens: list[str]) -> list[dict[str, str]]:
     return [{'code': f'D-{idx + 1:03d}', 'name': name} for idx, name in enumerate(DEFAULT_DISTRICTS)]
 
 
+def _finalize_base_metrics(raw: dict[str, int]) -> dict[str, int]:
+    total_cases = int(raw.get('total_cases') or 0)
+    stage1_cases = int(raw.get('stage1_cases') or 0)
+    stage2_cases = int(raw.get('stage2_cases') or 0)
+    stage3_cases = int(raw.get('stage3_cases') or 0)
+    high_alert_cases = int(raw.get('high_alert_cases') or 0)
+    overdue_schedules = int(raw.get('overdue_schedules') or 0)
+    overdue_contacts = int(raw.get('overdue_contacts') or 0)
+    open_work_items = int(raw.get('open_work_items') or 0)
+    observed = total_cases > 0
+
+    queue_pressure = max(1, overdue_schedules + overdue_contacts + open_work_items)
+    if total_cases <= 0:
+        # Empty environments still need operational demo figures.
+        total_cases = 36
+        stage1_cases = 14
+        stage2_cases = 12
+        stage3_cases = 10
+        high_alert_cases = 9
+        queue_pressure = 22
+
+    return {
+        'total_cases': total_cases,
+        'stage1_cases': max(1, stage1_cases),
+        'stage2_cases': max(1, stage2_cases),
+        'stage3_cases': max(1, stage3_cases),
+        'high_alert_cases': max(1, high_alert_cases),
+        'overdue_schedules': max(1, overdue_schedules),
+        'overdue_contacts': max(1, overdue_contacts),
+        'open_work_items': max(1, open_work_items),
+        'stage2_runs': max(1, int(raw.get('stage2_runs') or 0)),
+        'stage3_runs': max(1, int(raw.get('stage3_runs') or 0)),
+        'citizen_pending': max(1, int(raw.get('citizen_pending') or 0)),
+        'queue_pressure': queue_pressure,
+        'observed': int(observed),
+    }
+
+
 def _collect_base_metrics(db: Session) -> dict[str, int]:
     now = _utcnow()
     total_cases = int(db.execute(select(func.count()).select_from(LocalCase)).scalar_one() or 0)
@@ -113,30 +193,89 @@ def _collect_base_metrics(db: Session) -> dict[str, int]:
         db.execute(select(func.count()).select_from(CitizenRequest).where(CitizenRequest.status == 'RECEIVED')).scalar_one() or 0
     )
 
-    queue_pressure = max(1, overdue_schedules + overdue_contacts + open_work_items)
-    if total_cases <= 0:
-        # Empty environments still need operational demo figures.
-        total_cases = 36
-        stage1_cases = 14
-        stage2_cases = 12
-        stage3_cases = 10
-        high_alert_cases = 9
-        queue_pressure = 22
+    return _finalize_base_metrics(
+        {
+            'total_cases': total_cases,
+            'stage1_cases': stage1_cases,
+            'stage2_cases': stage2_cases,
+            'stage3_cases': stage3_cases,
+            'high_alert_cases': high_alert_cases,
+            'overdue_schedules': overdue_schedules,
+            'overdue_contacts': overdue_contacts,
+            'open_work_items': open_work_items,
+            'stage2_runs': stage2_runs,
+            'stage3_runs': stage3_runs,
+            'citizen_pending': citizen_pending,
+        }
+    )
+
+
+def _count_by_case(case_column: Any, *criteria: Any) -> Any:
+    return select(case_column.label('case_id'), func.count().label('n')).where(*criteria).group_by(case_column).subquery()
 
-    return {
-        'total_cases': total_cases,
-        'stage1_cases': max(1, stage1_cases),
-        'stage2_cases': max(1, stage2_cases),
-        'stage3_cases': max(1, stage3_cases),
-        'high_alert_cases': max(1, high_alert_cases),
-        'overdue_schedules': max(1, overdue_schedules),
-        'overdue_contacts': max(1, overdue_contacts),
-        'open_work_items': max(1, open_work_items),
-        'stage2_runs': max(1, stage2_runs),
-        'stage3_runs': max(1, stage3_runs),
-        'citizen_pending': max(1, citizen_pending),
-        'queue_pressure': queue_pressure,
-    }
+
+def _district_code_for_center(center_id: str, center_name: str, districts: list[dict[str, str]]) -> str | None:
+    for district in districts:
+        if district['code'] == center_id:
+            return district['code']
+    for district in districts:
+        if district['name'] and district['name'] in center_name:
+            return district['code']
+    return None
+
+
+def _collect_district_metrics(db: Session, *, region_id: str, districts: list[dict[str, str]]) -> dict[str, dict[str, int]]:
+    """Aggregate per-center case metrics in one grouped query and fold centers into districts."""
+    now = _utcnow()
+    overdue_schedules = _count_by_case(Schedule.case_id, Schedule.status.in_(['SCHEDULED', 'QUEUED']), Schedule.start_at < now)
+    overdue_contacts = _count_by_case(
+        ContactPlan.case_id, ContactPlan.status.in_(['PENDING', 'QUEUED']), ContactPlan.next_contact_at < now
+    )
+    open_work_items = _count_by_case(WorkItem.case_id, WorkItem.status.in_(['OPEN', 'IN_PROGRESS']))
+    stage2_runs = _count_by_case(Stage2ModelRun.case_id)
+    stage3_runs = _count_by_case(Stage3ModelRun.case_id)
+    citizen_pending = _count_by_case(CitizenRequest.case_id, CitizenRequest.status == 'RECEIVED')
+
+    query = (
+        select(
+            Center.id,
+            Center.name,
+            func.count(LocalCase.case_id).label('total_cases'),
+            func.count(LocalCase.case_id).filter(LocalCase.stage == 1).label('stage1_cases'),
+            func.count(LocalCase.case_id).filter(LocalCase.stage == 2).label('stage2_cases'),
+            func.count(LocalCase.case_id).filter(LocalCase.stage >= 3).label('stage3_cases'),
+            func.count(LocalCase.case_id).filter(LocalCase.alert_level.in_(['HIGH', 'MID'])).label('high_alert_cases'),
+            func.coalesce(func.sum(overdue_schedules.c.n), 0).label('overdue_schedules'),
+            func.coalesce(func.sum(overdue_contacts.c.n), 0).label('overdue_contacts'),
+            func.coalesce(func.sum(open_work_items.c.n), 0).label('open_work_items'),
+            func.coalesce(func.sum(stage2_runs.c.n), 0).label('stage2_runs'),
+            func.coalesce(func.sum(stage3_runs.c.n), 0).label('stage3_runs'),
+            func.coalesce(func.sum(citizen_pending.c.n), 0).label('citizen_pending'),
+        )
+        .select_from(Center)
+        .join(LocalCase, LocalCase.center_id == Center.id)
+        .outerjoin(overdue_schedules, overdue_schedules.c.case_id == LocalCase.case_id)
+        .outerjoin(overdue_contacts, overdue_contacts.c.case_id == LocalCase.case_id)
+        .outerjoin(open_work_items, open_work_items.c.case_id == LocalCase.case_id)
+        .outerjoin(stage2_runs, stage2_runs.c.case_id == LocalCase.case_id)
+        .outerjoin(stage3_runs, stage3_runs.c.case_id == LocalCase.case_id)
+        .outerjoin(citizen_pending, citizen_pending.c.case_id == LocalCase.case_id)
+        .group_by(Center.id, Center.name)
+    )
+    region_code = REGION_CODE_BY_ID.get(region_id)
+    if region_code:
+        query = query.where(Center.region_code == region_code)
+
+    raw_by_district: dict[str, dict[str, int]] = {district['code']: {key: 0 for key in DISTRICT_METRIC_KEYS} for district in districts}
+    for row in db.execute(query).mappings():
+        code = _district_code_for_center(str(row['id']), str(row['name'] or ''), districts)
+        if code is None:
+            continue
+        bucket = raw_by_district[code]
+        for key in DISTRICT_METRIC_KEYS:
+            bucket[key] += int(row[key] or 0)
+
+    return {code: _finalize_base_metrics(raw) for code, raw in raw_by_district.items()}
 
 
 def _period_scale(period: str) -> float:
@@ -159,27 +298,28 @@ def build_dashboard_district_rows(
     range_preset: str,
     districts: list[dict[str, str]],
 ) -> list[dict[str, Any]]:
-    base = _collect_base_metrics(db)
-    n = max(1, len(districts))
+    metrics_by_district = _collect_district_metrics(db, region_id=region_id, districts=districts)
     period_mul = _period_scale(period)
 
     rows: list[dict[str, Any]] = []
-    for idx, district in enumerate(districts):
+    for district in districts:
         code = district['code']
         name = district['name']
         seed = f'{region_id}:{period}:{range_preset}:{code}:{name}'
-        scale = _sv(f'{seed}:scale', 0.72, 1.34) * period_mul
+        base = metrics_by_district[code]
+        # Districts without any mapped center fall back to scaled demo figures.
+        scale = period_mul if base['observed'] else _sv(f'{seed}:scale', 0.72, 1.34) * period_mul
 
-        volume = int(max(24, (base['total_cases'] * 4 / n) * scale + _sv(f'{seed}:vol_noise', 8, 80)))
-        queue_count = int(max(10, (base['queue_pressure'] * 1.8 / n) * scale + _sv(f'{seed}:queue_noise', 6, 52)))
-        inflow_count = int(max(12, (base['stage1_cases'] * 2.2 / n) * scale + _sv(f'{seed}:inflow_noise', 5, 38)))
+        volume = int(max(24, base['total_cases'] * 4 * scale))
+        queue_count = int(max(10, base['queue_pressure'] * 1.8 * scale))
+        inflow_count = int(max(12, base['stage1_cases'] * 2.2 * scale))
 
-        recontact_rate = _round(min(38, max(6, (base['overdue_contacts'] * 100 / max(base['total_cases'], 1)) * 0.6 + _sv(f'{seed}:recontact', 4, 20))))
-        data_ready = _round(min(98, max(54, 100 - (base['citizen_pending'] * 100 / (base['total_cases'] * 1.8)) + _sv(f'{seed}:data', -8, 8))))
-        governance = _round(min(99, max(62, 100 - (base['open_work_items'] * 100 / (base['total_cases'] * 2.4)) + _sv(f'{seed}:gov', -7, 9))))
-        ad_density = _round(min(92, max(18, (base['high_alert_cases'] * 100 / max(base['total_cases'], 1)) + _sv(f'{seed}:ad', -10, 18))))
-        dx_delay = _round(min(52, max(6, 8 + (base['stage2_cases'] * 22 / max(base['total_cases'], 1)) + _sv(f'{seed}:dx', -4, 14))))
-        screen_to_dx = _round(min(90, max(28, 70 - dx_delay * 0.7 + _sv(f'{seed}:conv', -10, 9))))
+        recontact_rate = _round(min(38, max(6, base['overdue_contacts'] * 100 / max(base['total_cases'], 1))))
+        data_ready = _round(min(98, max(54, 100 - (base['citizen_pending'] * 100 / (base['total_cases'] * 1.8)))))
+        governance = _round(min(99, max(62, 100 - (base['open_work_items'] * 100 / (base['total_cases'] * 2.4)))))
+        ad_density = _round(min(92, max(18, base['high_alert_cases'] * 100 / max(base['total_cases'], 1))))
+        dx_delay = _round(min(52, max(6, 8 + (base['stage2_cases'] * 22 / max(base['total_cases'], 1)))))
+        screen_to_dx = _round(min(90, max(28, 70 - dx_delay * 0.7)))
 
         queue_type_backlog = [
             {'name': '재접촉 큐', 'value': int(queue_count * _sv(f'{seed}:qt1', 0.24, 0.36))},
@@ -335,6 +475,29 @@ def build_dashboard_district_rows(
     return rows
 
 
+def get_cause_cube(db: Session, *, region_id: str, period: str) -> dict[str, Any]:
+    # Every cause drill-down slices the same global aggregates; only the seeded
+    # breakdowns depend on region, period and the filter combination.
+    cached = get_json(CAUSE_CUBE_BASE_KEY)
+    if not (isinstance(cached, dict) and isinstance(cached.get('base'), dict)):
+        cached = {'base': _collect_base_metrics(db), 'computedAt': _utcnow().isoformat()}
+        set_json(CAUSE_CUBE_BASE_KEY, cached, CAUSE_CUBE_TTL_SECONDS)
+    return {'regionId': region_id, 'period': period, **cached}
+
+
+def invalidate_cause_cubes() -> int:
+    return delete_pattern(CAUSE_CUBE_BASE_KEY)
+
+
+CAUSE_CUBE_SOURCE_MODELS = (LocalCase, WorkItem, Schedule, ContactPlan, Stage2ModelRun, Stage3ModelRun, CitizenRequest)
+
+
+@event.listens_for(Session, 'after_flush')
+def _track_cause_cube_sources(session: Session, flush_context: Any) -> None:
+    if any(isinstance(obj, CAUSE_CUBE_SOURCE_MODELS) for obj in chain(session.new, session.dirty, session.deleted)):
+        delete_pattern_after_commit(session, CAUSE_CUBE_BASE_KEY)
+
+
 def build_cause_summary(
     db: Session,
     *,
@@ -345,7 +508,28 @@ def build_cause_summary(
     selected_stage: str | None,
     selected_cause_key: str | None,
 ) -> dict[str, Any]:
-    base = _collect_base_metrics(db)
+    return _slice_cause_summary(
+        get_cause_cube(db, region_id=region_id, period=period),
+        region_id=region_id,
+        kpi_key=kpi_key,
+        sigungu=sigungu,
+        period=period,
+        selected_stage=selected_stage,
+        selected_cause_key=selected_cause_key,
+    )
+
+
+def _slice_cause_summary(
+    cube: dict[str, Any],
+    *,
+    region_id: str,
+    kpi_key: str,
+    sigungu: str,
+    period: str,
+    selected_stage: str | None,
+    selected_cause_key: str | None,
+) -> dict[str, Any]:
+    base = cube['base']
     seed = f'{region_id}:{kpi_key}:{sigungu}:{period}:{selected_stage or "all"}:{selected_cause_key or "all"}'
 
     total = max(60, int(base['queue_pressure'] * _sv(f'{seed}:total', 2.2, 4.8)))
@@ -416,7 +600,8 @@ def build_cause_topn(
     selected_stage: str | None,
     selected_area: str | None,
 ) -> dict[str, Any]:
-    base = _collect_base_metrics(db)
+    cube = get_cause_cube(db, region_id=region_id, period=period)
+    base = cube['base']
     seed = f'{region_id}:{kpi_key}:{sigungu}:{period}:{selected_stage or "all"}:{selected_area or "all"}'
 
     rows: list[dict[str, Any]] = []
@@ -455,8 +640,8 @@ def build_cause_topn(
 
     rows.sort(key=lambda item: item['count'], reverse=True)
 
-    coverage = build_cause_summary(
-        db,
+    coverage = _slice_cause_summary(
+        cube,
         region_id=region_id,
         kpi_key=kpi_key,
         sigungu=sigungu,
@@ -479,7 +664,7 @@ def build_area_comparison(
     selected_cause_key: str | None,
     districts: list[str],
 ) -> list[dict[str, Any]]:
-    base = _collect_base_metrics(db)
+    base = get_cause_cube(db, region_id=region_id, period=period)['base']
     seed = f'{region_id}:{kpi_key}:{sigungu}:{period}:{selected_stage or "all"}:{selected_cause_key or "all"}'
     parsed = districts or DEFAULT_DISTRICTS
 
@@ -529,7 +714,7 @@ def build_cause_trend(
     selected_area: str | None,
     trend_metric: str,
 ) -> dict[str, Any]:
-    base = _collect_base_metrics(db)
+    base = get_cause_cube(db, region_id=region_id, period=period)['base']
     seed = f'{region_id}:{kpi_key}:{sigungu}:{period}:{selected_stage or "all"}:{selected_cause_key or "all"}:{selected_area or "all"}:{trend_metric}'
 
     if period == 'quarter':
@@ -581,15 +766,49 @@ def build_cause_trend(
     return {'metric': trend_metric, 'points': points, 'alerts': alerts}
 
 
-def _load_snapshot(db: Session, scope_key: str) -> RegionalSnapshot | None:
-    return db.execute(select(RegionalSnapshot).where(RegionalSnapshot.scope_key == scope_key)).scalar_one_or_none()
+def get_many_snapshot_payloads(db: Session, scope_keys: list[str]) -> dict[str, dict[str, Any]]:
+    keys = list(dict.fromkeys(key for key in scope_keys if key))
+    if not keys:
+        return {}
+    rows = db.execute(
+        select(RegionalSnapshot.scope_key, RegionalSnapshot.payload_json).where(RegionalSnapshot.scope_key.in_(keys))
+    ).all()
+    return {scope_key: dict(payload or {}) for scope_key, payload in rows}
+
+
+def put_many_snapshot_payloads(db: Session, entries: list[dict[str, Any]], *, overwrite: bool = True) -> int:
+    if not entries:
+        return 0
+    now = _utcnow()
+    values = [
+        {
+            'snapshot_id': entry.get('snapshot_id') or _new_id('SNAP'),
+            'scope_key': entry['scope_key'],
+            'region_id': entry['region_id'],
+            'payload_json': entry['payload'],
+            'created_at': now,
+            'updated_at': now,
+        }
+        for entry in entries
+    ]
+    stmt = dialect_insert(db, RegionalSnapshot).values(values)
+    if overwrite:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[RegionalSnapshot.scope_key],
+            set_={
+                'region_id': stmt.excluded.region_id,
+                'payload_json': stmt.excluded.payload_json,
+                'updated_at': stmt.excluded.updated_at,
+            },
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(index_elements=[RegionalSnapshot.scope_key])
+    db.execute(stmt)
+    return len(values)
 
 
 def get_snapshot_payload(db: Session, scope_key: str) -> dict[str, Any] | None:
-    row = _load_snapshot(db, scope_key)
-    if not row:
-        return None
-    return dict(row.payload_json or {})
+    return get_many_snapshot_payloads(db, [scope_key]).get(scope_key)
 
 
 def put_snapshot_payload(
@@ -599,40 +818,129 @@ def put_snapshot_payload(
     region_id: str,
     payload: dict[str, Any],
     snapshot_id: str | None = None,
-) -> RegionalSnapshot:
+) -> None:
+    put_many_snapshot_payloads(
+        db,
+        [{'scope_key': scope_key, 'region_id': region_id, 'payload': payload, 'snapshot_id': snapshot_id}],
+    )
+
+
+def _jsonb_param(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def append_snapshot_item(
+    db: Session,
+    *,
+    scope_key: str,
+    region_id: str,
+    item: dict[str, Any],
+) -> None:
     now = _utcnow()
-    row = _load_snapshot(db, scope_key)
-    if row:
-        row.region_id = region_id
-        row.payload_json = payload
-        row.updated_at = now
-        db.flush()
-        return row
-
-    row = RegionalSnapshot(
-        snapshot_id=snapshot_id or _new_id('SNAP'),
-        scope_key=scope_key,
-        region_id=region_id,
-        payload_json=payload,
-        created_at=now,
-        updated_at=now,
+    put_many_snapshot_payloads(
+        db,
+        [{'scope_key': scope_key, 'region_id': region_id, 'payload': {'items': [], 'updatedAt': now.isoformat()}}],
+        overwrite=False,
     )
-    db.add(row)
-    db.flush()
-    return row
+    if db.get_bind().dialect.name != 'postgresql':
+        payload = get_snapshot_payload(db, scope_key) or {}
+        items = [item, *_intervention_items_from_payload(payload)]
+        put_snapshot_payload(db, scope_key=scope_key, region_id=region_id, payload={**payload, 'items': items, 'updatedAt': now.isoformat()})
+        return
 
+    # Prepend in place instead of rewriting the whole items list.
+    db.execute(
+        text(
+            """
+            UPDATE local_center.regional_snapshots
+            SET payload_json = jsonb_set(
+                  payload_json,
+                  '{items}',
+                  jsonb_build_array(CAST(:item AS jsonb)) || COALESCE(payload_json -> 'items', '[]'::jsonb)
+                ) || jsonb_build_object('updatedAt', CAST(:updated_at AS text)),
+                updated_at = :now
+            WHERE scope_key = :scope_key
+            """
+        ),
+        {'item': _jsonb_param(item), 'updated_at': now.isoformat(), 'now': now, 'scope_key': scope_key},
+    )
 
-def get_intervention_items(db: Session, *, region_id: str, period: str) -> list[dict[str, Any]]:
-    scope_key = f'interventions:{region_id}:{period}'
-    payload = get_snapshot_payload(db, scope_key)
+
+def patch_snapshot_item(
+    db: Session,
+    *,
+    scope_key: str,
+    item_id: str,
+    patch: dict[str, Any],
+) -> dict[str, Any] | None:
+    now = _utcnow()
+    if db.get_bind().dialect.name != 'postgresql':
+        payload = get_snapshot_payload(db, scope_key)
+        items = _intervention_items_from_payload(payload)
+        for index, current in enumerate(items):
+            if str(current.get('id')) == item_id:
+                items[index] = {**current, **patch}
+                db.execute(
+                    RegionalSnapshot.__table__.update()
+                    .where(RegionalSnapshot.scope_key == scope_key)
+                    .values(payload_json={**(payload or {}), 'items': items, 'updatedAt': now.isoformat()}, updated_at=now)
+                )
+                return items[index]
+        return None
+
+    row = db.execute(
+        text(
+            """
+            UPDATE local_center.regional_snapshots AS s
+            SET payload_json = jsonb_set(
+                  s.payload_json,
+                  ARRAY['items', (m.idx - 1)::text],
+                  (s.payload_json -> 'items' -> (m.idx - 1)::int) || CAST(:patch AS jsonb)
+                ) || jsonb_build_object('updatedAt', CAST(:updated_at AS text)),
+                updated_at = :now
+            FROM (
+              SELECT e.idx
+              FROM local_center.regional_snapshots AS r,
+                   jsonb_array_elements(r.payload_json -> 'items') WITH ORDINALITY AS e(item, idx)
+              WHERE r.scope_key = :scope_key AND e.item ->> 'id' = :item_id
+              LIMIT 1
+            ) AS m
+            WHERE s.scope_key = :scope_key
+              AND s.payload_json -> 'items' @> CAST(:probe AS jsonb)
+            RETURNING s.payload_json -> 'items' -> (m.idx - 1)::int AS item
+            """
+        ),
+        {
+            'patch': _jsonb_param(patch),
+            'probe': _jsonb_param([{'id': item_id}]),
+            'updated_at': now.isoformat(),
+            'now': now,
+            'scope_key': scope_key,
+            'item_id': item_id,
+        },
+    ).first()
+    if not row:
+        return None
+    return dict(row.item or {})
+
+
+def _intervention_scope_key(region_id: str, period: str) -> str:
+    return f'interventions:{region_id}:{period}'
+
+
+def _intervention_items_from_payload(payload: dict[str, Any] | None) -> list[dict[str, Any]]:
     if not payload:
         return []
     items = payload.get('items') if isinstance(payload.get('items'), list) else []
     return [item for item in items if isinstance(item, dict)]
 
 
+def get_intervention_items(db: Session, *, region_id: str, period: str) -> list[dict[str, Any]]:
+    return _intervention_items_from_payload(get_snapshot_payload(db, _intervention_scope_key(region_id, period)))
+
+
 def put_intervention_items(db: Session, *, region_id: str, period: str, items: list[dict[str, Any]]) -> dict[str, Any]:
-    scope_key = f'interventions:{region_id}:{period}'
+    scope_key = _intervention_scope_key(region_id, period)
     payload = {
         'items': items,
         'updatedAt': _utcnow().isoformat(),
@@ -642,6 +950,27 @@ def put_intervention_items(db: Session, *, region_id: str, period: str, items: l
     return {'ok': True, 'count': len(items), 'scopeKey': scope_key}
 
 
+def patch_intervention_item(
+    db: Session,
+    *,
+    region_id: str,
+    period: str,
+    intervention_id: str,
+    patch: dict[str, Any],
+) -> dict[str, Any]:
+    patch = {key: value for key, value in patch.items() if key != 'id'}
+    item = patch_snapshot_item(
+        db,
+        scope_key=_intervention_scope_key(region_id, period),
+        item_id=intervention_id,
+        patch=patch,
+    )
+    if item is None:
+        raise HTTPException(status_code=404, detail='intervention not found')
+    db.commit()
+    return item
+
+
 def _infer_intervention_type(kpi_key: str) -> str:
     if kpi_key == 'regionalDxDelayHotspot':
         return 'PATHWAY_TUNE'
@@ -786,10 +1115,16 @@ def create_intervention_from_cause_snapshot(
     period = str(query_state.get('period') or 'week')
 
     snapshot_id = _new_id('SNAP')
-    scope_key = f'cause:{snapshot_id}'
+    item = _create_intervention_item_from_snapshot(
+        region_id=region_id,
+        query_state=query_state,
+        before_snapshot=before_snapshot,
+        snapshot_id=snapshot_id,
+    )
+
     put_snapshot_payload(
         db,
-        scope_key=scope_key,
+        scope_key=f'cause:{snapshot_id}',
         region_id=region_id,
         payload={
             'queryState': query_state,
@@ -798,21 +1133,11 @@ def create_intervention_from_cause_snapshot(
         },
         snapshot_id=snapshot_id,
     )
-
-    item = _create_intervention_item_from_snapshot(
-        region_id=region_id,
-        query_state=query_state,
-        before_snapshot=before_snapshot,
-        snapshot_id=snapshot_id,
-    )
-
-    existing = get_intervention_items(db, region_id=region_id, period=period)
-    existing.insert(0, item)
-    put_snapshot_payload(
+    append_snapshot_item(
         db,
-        scope_key=f'interventions:{region_id}:{period}',
+        scope_key=_intervention_scope_key(region_id, period),
         region_id=region_id,
-        payload={'items': existing, 'updatedAt': _utcnow().isoformat()},
+        item=item,
     )
 
     db.commit()
@@ -832,7 +1157,7 @@ def build_report_summary(
     kpi: str,
     period: str,
 ) -> dict[str, Any]:
-    base = _collect_base_metrics(db)
+    base = get_cause_cube(db, region_id=region_id, period=period)['base']
     seed = f'report:{region_id}:{scope_mode}:{sgg or "all"}:{kpi}:{period}'
 
     interventions = get_intervention_items(db, region_id=region_id, period=period)
@@ -930,15 +1255,16 @@ def build_report_summary(
 
 
 def ensure_regional_snapshot_scope(db: Session, *, region_id: str, period: str) -> None:
-    scope_key = f'interventions:{region_id}:{period}'
-    if _load_snapshot(db, scope_key):
-        return
-
-    put_snapshot_payload(
+    put_many_snapshot_payloads(
         db,
-        scope_key=scope_key,
-        region_id=region_id,
-        payload={'items': [], 'updatedAt': _utcnow().isoformat()},
+        [
+            {
+                'scope_key': _intervention_scope_key(region_id, period),
+                'region_id': region_id,
+                'payload': {'items': [], 'updatedAt': _utcnow().isoformat()},
+            }
+        ],
+        overwrite=False,
     )
     db.commit()
 
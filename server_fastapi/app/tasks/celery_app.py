@@ -27,7 +27,11 @@ celery_app.conf.update(
         'server_fastapi.app.tasks.tasks',
         'server_fastapi.app.tasks.citizen_tasks',
         'server_fastapi.app.tasks.regional',
+        'server_fastapi.app.tasks.inference',
     ),
+    task_routes={
+        'server_fastapi.app.tasks.inference.*': {'queue': 'inference'},
+    },
     beat_schedule={
         'aggregate-kpis': {
             'task': 'server_fastapi.app.tasks.aggregate.aggregate_kpis',
@@ -69,10 +73,18 @@ celery_app.conf.update(
             'task': 'server_fastapi.app.tasks.tasks.process_queued_schedules',
             'schedule': 120.0,
         },
+        'rebuild-overdue-schedule-counts': {
+            'task': 'server_fastapi.app.tasks.tasks.rebuild_overdue_schedule_counts',
+            'schedule': 3600.0,
+        },
         'sync-regional-snapshots': {
             'task': 'server_fastapi.app.tasks.regional.sync_regional_snapshots',
             'schedule': 900.0,
         },
+        'requeue-pending-inference-jobs': {
+            'task': 'server_fastapi.app.tasks.inference.requeue_pending_inference_jobs',
+            'schedule': 120.0,
+        },
     },
 )
 
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from server_fastapi.app.db.session import SessionLocal
+from server_fastapi.app.services.local_case_service import (
+    execute_inference_batch,
+    execute_inference_job,
+    requeue_pending_inference_jobs,
+)
+from server_fastapi.app.tasks.celery_app import celery_app
+
+
+@celery_app.task(
+    name='server_fastapi.app.tasks.inference.run_inference_job',
+    bind=True,
+    acks_late=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    max_retries=3,
+)
+def run_inference_job(self, job_id: str) -> dict:
+    db = SessionLocal()
+    try:
+        return execute_inference_job(db, job_id, final_attempt=self.request.retries >= self.max_retries)
+    finally:
+        db.close()
+
+
+@celery_app.task(
+    name='server_fastapi.app.tasks.inference.run_inference_batch',
+    bind=True,
+    acks_late=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    max_retries=3,
+)
+def run_inference_batch(self, job_ids: list[str]) -> dict:
+    db = SessionLocal()
+    try:
+        return execute_inference_batch(db, job_ids, final_attempt=self.request.retries >= self.max_retries)
+    finally:
+        db.close()
+
+
+@celery_app.task(name='server_fastapi.app.tasks.inference.requeue_pending_inference_jobs')
+def requeue_pending_inference() -> dict:
+    db = SessionLocal()
+    try:
+        job_ids = requeue_pending_inference_jobs(db)
+        return {'requeued': len(job_ids)}
+    finally:
+        db.close()
@@ -1,5 +1,12 @@
 from __future__ import annotations
 
+import math
+import time
+from datetime import datetime, timezone
+
+from celery import chord
+
+from server_fastapi.app.core.config import get_settings
 from server_fastapi.app.db.session import SessionLocal
 from server_fastapi.app.services.regional_service import build_report_summary, ensure_regional_snapshot_scope
 from server_fastapi.app.tasks.celery_app import celery_app
@@ -26,33 +33,78 @@ DEFAULT_REGION_IDS = [
 DEFAULT_PERIODS = ['week', 'month', 'quarter']
 
 
-@celery_app.task(name='server_fastapi.app.tasks.regional.sync_regional_snapshots')
-def sync_regional_snapshots(region_ids: list[str] | None = None) -> dict:
+@celery_app.task(name='server_fastapi.app.tasks.regional.sync_regional_scope')
+def sync_regional_scope(region_id: str, period: str) -> dict:
+    started = time.perf_counter()
     db = SessionLocal()
     try:
-        targets = [value.strip() for value in (region_ids or DEFAULT_REGION_IDS) if str(value).strip()]
-        prepared_scopes = 0
-        report_rows = 0
-
-        for region_id in targets:
-            for period in DEFAULT_PERIODS:
-                ensure_regional_snapshot_scope(db, region_id=region_id, period=period)
-                build_report_summary(
-                    db,
-                    region_id=region_id,
-                    scope_mode='regional',
-                    sgg='',
-                    kpi='all',
-                    period=period,
-                )
-                prepared_scopes += 1
-                report_rows += 1
-
+        # The report summary reads the snapshots prepared for the same scope.
+        ensure_regional_snapshot_scope(db, region_id=region_id, period=period)
+        build_report_summary(
+            db,
+            region_id=region_id,
+            scope_mode='regional',
+            sgg='',
+            kpi='all',
+            period=period,
+        )
         return {
+            'regionId': region_id,
+            'period': period,
             'ok': True,
-            'regions': len(targets),
-            'preparedScopes': prepared_scopes,
-            'reportSummariesRefreshed': report_rows,
+            'elapsedMs': int((time.perf_counter() - started) * 1000),
+        }
+    except Exception as exc:
+        db.rollback()
+        return {
+            'regionId': region_id,
+            'period': period,
+            'ok': False,
+            'error': str(exc),
+            'elapsedMs': int((time.perf_counter() - started) * 1000),
         }
     finally:
         db.close()
+
+
+@celery_app.task(name='server_fastapi.app.tasks.regional.report_regional_sync')
+def report_regional_sync(chunk_results: list, started_at: str) -> dict:
+    scopes = [item for chunk in chunk_results or [] for item in (chunk or [])]
+    failed = [item for item in scopes if not item.get('ok')]
+    slowest = max(scopes, key=lambda item: item.get('elapsedMs', 0), default=None)
+    wall_ms = int((datetime.now(timezone.utc) - datetime.fromisoformat(started_at)).total_seconds() * 1000)
+    return {
+        'ok': not failed,
+        'regions': len({item['regionId'] for item in scopes}),
+        'preparedScopes': len(scopes) - len(failed),
+        'reportSummariesRefreshed': len(scopes) - len(failed),
+        'failedScopes': failed,
+        'wallMs': wall_ms,
+        'sumScopeMs': sum(int(item.get('elapsedMs', 0)) for item in scopes),
+        'slowestScope': slowest,
+        'scopes': scopes,
+    }
+
+
+@celery_app.task(name='server_fastapi.app.tasks.regional.sync_regional_snapshots')
+def sync_regional_snapshots(region_ids: list[str] | None = None) -> dict:
+    targets = [value.strip() for value in (region_ids or DEFAULT_REGION_IDS) if str(value).strip()]
+    scopes = [(region_id, period) for region_id in targets for period in DEFAULT_PERIODS]
+    if not scopes:
+        return {'ok': True, 'regions': 0, 'preparedScopes': 0, 'reportSummariesRefreshed': 0}
+
+    # Each chunk runs its scopes one after another, so the number of chunks caps
+    # how many scopes hit the database at the same time.
+    concurrency = max(1, get_settings().regional_sync_concurrency)
+    chunk_size = max(1, math.ceil(len(scopes) / concurrency))
+    header = sync_regional_scope.chunks(scopes, chunk_size).group()
+    started_at = datetime.now(timezone.utc).isoformat()
+    result = chord(header)(report_regional_sync.s(started_at=started_at))
+
+    return {
+        'ok': True,
+        'regions': len(targets),
+        'dispatchedScopes': len(scopes),
+        'chunks': len(header.tasks),
+        'chordId': result.id,
+    }
@@ -1,7 +1,17 @@
 from __future__ import annotations
 
+from sqlalchemy import select
+
 from server_fastapi.app.db.session import SessionLocal
-from server_fastapi.app.models.local_center import ContactPlan, Schedule
+from server_fastapi.app.models.local_center import ContactPlan, LocalCase, Schedule
+from server_fastapi.app.services.bulk_transition import bulk_transition
+from server_fastapi.app.services.case_view_service import refresh_case_views
+from server_fastapi.app.services.local_case_service import (
+    adjust_overdue_schedule_counts,
+    rebuild_overdue_schedule_counts,
+    reconcile_center_ops_loops,
+)
+from server_fastapi.app.services.regional_service import CAUSE_CUBE_BASE_KEY
 from server_fastapi.app.tasks.celery_app import celery_app
 
 
@@ -9,15 +19,57 @@ from server_fastapi.app.tasks.celery_app import celery_app
 def process_queued_schedules() -> dict:
     db = SessionLocal()
     try:
-        schedules = db.query(Schedule).filter(Schedule.status == 'QUEUED').all()
-        plans = db.query(ContactPlan).filter(ContactPlan.status == 'QUEUED').all()
+        schedules = bulk_transition(
+            db,
+            Schedule,
+            where=[Schedule.status == 'QUEUED'],
+            values={'status': 'DONE'},
+            returning=[Schedule.case_id],
+            on_batch=lambda rows: adjust_overdue_schedule_counts(db, [row.case_id for row in rows], -1),
+            invalidate=[CAUSE_CUBE_BASE_KEY],
+        )
+        plans = bulk_transition(
+            db,
+            ContactPlan,
+            where=[ContactPlan.status == 'QUEUED'],
+            values={'status': 'DONE'},
+            invalidate=[CAUSE_CUBE_BASE_KEY],
+        )
+        return {
+            'processedSchedules': schedules['processed'],
+            'processedContactPlans': plans['processed'],
+            'batches': schedules['batches'] + plans['batches'],
+            'batchLatencyMs': schedules['batchLatencyMs'] + plans['batchLatencyMs'],
+        }
+    finally:
+        db.close()
 
-        for row in schedules:
-            row.status = 'DONE'
-        for row in plans:
-            row.status = 'DONE'
 
+@celery_app.task(name='server_fastapi.app.tasks.tasks.rebuild_case_views')
+def rebuild_case_views() -> dict:
+    db = SessionLocal()
+    try:
+        case_ids = list(db.execute(select(LocalCase.case_id).order_by(LocalCase.case_id)).scalars())
+        refreshed = refresh_case_views(db, case_ids)
         db.commit()
-        return {'processedSchedules': len(schedules), 'processedContactPlans': len(plans)}
+        return {'refreshedCaseViews': refreshed}
+    finally:
+        db.close()
+
+
+@celery_app.task(name='server_fastapi.app.tasks.tasks.rebuild_overdue_schedule_counts')
+def rebuild_overdue_schedule_counts_task() -> dict:
+    db = SessionLocal()
+    try:
+        return {'correctedCases': rebuild_overdue_schedule_counts(db)}
+    finally:
+        db.close()
+
+
+@celery_app.task(name='server_fastapi.app.tasks.tasks.reconcile_center_ops_loops')
+def reconcile_center_ops_loops_task(center_id: str) -> dict:
+    db = SessionLocal()
+    try:
+        return reconcile_center_ops_loops(db, center_id)
     finally:
         db.close()
@@ -0,0 +1,146 @@
+"""Compare case list serialization throughput: pydantic/jsonable_encoder vs tuple rows + orjson.
+
+Run from the repository root:
+
+    python -m server_fastapi.scripts.bench_case_list_serialization --cases 10000 --repeat 5
+
+No database is needed; rows are synthesized in the shape list_local_cases and
+list_dashboard_case_records produce.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+from server_fastapi.app.models.local_center import LocalCase
+from server_fastapi.app.schemas.local_center import LocalCaseSummaryResponse, LocalCasesListResponse
+from server_fastapi.app.services.case_rows import CaseSummaryPage
+from server_fastapi.app.services.local_view_service import _case_record
+
+
+def _summary_rows(count: int) -> list[tuple[Any, ...]]:
+    rng = random.Random(7)
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        (
+            f'CASE-2026-{index:05d}',
+            rng.randint(1, 3),
+            rng.choice(['QUEUED', 'WAITING_EXAM', 'TRACKING', 'CLOSED']),
+            rng.choice(['TRACKING', 'FOLLOW_UP']),
+            f'u-local-{rng.randint(1, 40):03d}',
+            rng.choice([None, 'LOW', 'HIGH']),
+            rng.choice(['P1', 'P2', 'P3']),
+            (base + timedelta(days=rng.randint(0, 90))).date().isoformat(),
+            base + timedelta(minutes=index),
+        )
+        for index in range(count)
+    ]
+
+
+def _cases(count: int) -> list[LocalCase]:
+    rng = random.Random(11)
+    now = datetime(2026, 2, 1, tzinfo=timezone.utc)
+    return [
+        LocalCase(
+            case_id=f'CASE-2026-{index:05d}',
+            case_key=f'KEY-{index:05d}',
+            center_id='LC-001',
+            owner_id=f'u-local-{rng.randint(1, 40):03d}',
+            owner_type='counselor',
+            stage=rng.randint(1, 3),
+            status=rng.choice(['QUEUED', 'WAITING_EXAM', 'TRACKING']),
+            operational_status='TRACKING',
+            priority_tier='P2',
+            alert_level=rng.choice([None, 'HIGH']),
+            overdue_schedule_count=rng.choice([0, 0, 1]),
+            subject_json={'maskedName': f'대상자-{index:04d}', 'age': 60 + index % 30},
+            communication_json={},
+            referral_json={},
+            metrics_json={},
+            raw_json={},
+            updated_at=now - timedelta(minutes=index),
+        )
+        for index in range(count)
+    ]
+
+
+def _summary_legacy(rows: list[tuple[Any, ...]]) -> bytes:
+    page = LocalCasesListResponse(
+        total=len(rows),
+        page=1,
+        size=len(rows),
+        items=[
+            LocalCaseSummaryResponse(
+                caseId=row[0],
+                stage=row[1],
+                status=row[2],
+                operationalStatus=row[3],
+                owner=row[4],
+                alertLevel=row[5],
+                priorityTier=row[6],
+                nextActionAt=row[7],
+            )
+            for row in rows
+        ],
+    )
+    # What FastAPI does for a response_model route: re-validate, encode, then json.dumps.
+    validated = LocalCasesListResponse.model_validate(page.model_dump())
+    return json.dumps(jsonable_encoder(validated), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _summary_compact(rows: list[tuple[Any, ...]]) -> bytes:
+    return orjson.dumps(CaseSummaryPage(len(rows), 1, len(rows), rows, None).to_payload())
+
+
+def _dashboard_legacy(records: list[dict[str, Any]]) -> bytes:
+    return json.dumps(jsonable_encoder({'items': records, 'total': len(records)}), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _dashboard_compact(records: list[dict[str, Any]]) -> bytes:
+    return orjson.dumps({'items': records, 'total': len(records)})
+
+
+def _measure(label: str, fn: Callable[[Any], bytes], data: Any, repeat: int) -> float:
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = len(fn(data))
+        timings.append(time.perf_counter() - started)
+    best = min(timings)
+    print(f'{label:<28} best {best * 1000:8.1f} ms  median {statistics.median(timings) * 1000:8.1f} ms  {len(data) / best:>12,.0f} rows/s  {size:,} bytes')
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--cases', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    rows = _summary_rows(args.cases)
+    if orjson.loads(_summary_compact(rows)) != json.loads(_summary_legacy(rows)):
+        raise SystemExit('summary payloads differ')
+    print(f'/api/local-center/cases ({args.cases:,} rows)')
+    legacy = _measure('  pydantic + json', _summary_legacy, rows, args.repeat)
+    compact = _measure('  tuple rows + orjson', _summary_compact, rows, args.repeat)
+    print(f'  speedup x{legacy / compact:.1f}')
+
+    records = [_case_record(case, {}) for case in _cases(args.cases)]
+    print(f'/api/local-center/dashboard/cases ({args.cases:,} rows)')
+    legacy = _measure('  jsonable_encoder + json', _dashboard_legacy, records, args.repeat)
+    compact = _measure('  orjson', _dashboard_compact, records, args.repeat)
+    print(f'  speedup x{legacy / compact:.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -428,9 +428,14 @@ export function CalendarView() {
     let timer: number | null = null;
     let consecutiveFailures = 0;
 
+    // The API requires a bounded window: the visible month plus a week on each side for week views.
+    const rangeFrom = shiftDate(baseMonth, -7);
+    const rangeTo = shiftDate(new Date(baseMonth.getFullYear(), baseMonth.getMonth() + 1, 1), 7);
+    const rangeQuery = `from=${encodeURIComponent(rangeFrom.toISOString())}&to=${encodeURIComponent(rangeTo.toISOString())}`;
+
     const syncRemoteSchedules = async () => {
       try {
-        const response = await fetch(`/api/local-center/calendar/events?_=${Date.now()}`, {
+        const response = await fetch(`/api/local-center/calendar/events?${rangeQuery}&_=${Date.now()}`, {
           cache: "no-store",
         });
         if (!response.ok) {
@@ -492,7 +497,7 @@ export function CalendarView() {
         window.clearTimeout(timer);
       }
     };
-  }, []);
+  }, [baseMonth]);
 
   const selectedSchedule = useMemo(
     () => schedules.find((item) => item.id === selectedScheduleId) ?? null,
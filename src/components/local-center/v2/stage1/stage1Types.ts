@@ -136,6 +136,9 @@ export interface CalendarEventDraft {
   durationMin?: number;
   priority?: "NORMAL" | "HIGH";
   payload?: Record<string, any>;
+  /** Set when the server already created the schedule while saving the outcome. */
+  eventId?: string;
+  idempotencyKey?: string;
 }
 
 export type OutcomeSavePayload = {
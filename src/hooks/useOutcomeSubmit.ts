@@ -104,7 +104,11 @@ export function useOutcomeSubmit() {
 
         for (let idx = 0; idx < events.length; idx += 1) {
           const event = events[idx];
-          const idempotencyKey = `${caseId}:${outcome.outcomeId}:${event.type}:${idx}`;
+          const idempotencyKey = event.idempotencyKey ?? `${caseId}:${outcome.outcomeId}:${event.type}:${idx}`;
+          if (event.eventId) {
+            created.push({ idempotencyKey, eventId: event.eventId, event });
+            continue;
+          }
           try {
             const calendarResponse = await createStage1CalendarEvent({
               idempotencyKey,